@@ -1,6 +1,5 @@
-from libs.utils.pluginloader import load
 from typing import Any, List, Protocol, runtime_checkable
-import inspect
+import importlib
 
 # Define StorageProvider protocol. 
 # Classes implementing this protocol must have save() and load() methods.
@@ -48,14 +47,16 @@ class StorageProvider(Protocol):
 
 # Define StorageProviderRegistry protocol.
 # Classes implementing this protocol must have the following class methods:
-# get_protocol(), register(), get_instance(), get_schemes(), and load_modules().
+# get_protocol(), register(), get_instance(), get_schemes(), load_modules(),
+# load_scheme(), and supports().
 @runtime_checkable
 class StorageProviderRegistry(Protocol):
     """
     Protocol for storage provider registries.
 
     Classes implementing this protocol must have the following class methods:
-    get_protocol(), register(), get_instance(), get_schemes(), and load_modules().
+    get_protocol(), register(), get_instance(), get_schemes(), load_modules(),
+    load_scheme(), and supports().
     """
 
     @classmethod
@@ -127,17 +128,81 @@ class StorageProviderRegistry(Protocol):
 
         pass  # Placeholder for load_modules method
 
+    @classmethod
+    def load_scheme(cls, scheme: str) -> None:
+        """
+        Load only the provider module that supports a specified scheme.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme whose provider module should be loaded.
+        """
+
+        pass  # Placeholder for load_scheme method
+
+    @classmethod
+    def supports(cls, scheme: str) -> bool:
+        """
+        Check whether a scheme is supported without importing provider modules.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme to check.
+
+        Returns
+        -------
+        bool
+            True if the scheme is supported, False otherwise.
+        """
+
+        pass  # Placeholder for supports method
 
-from libs.utils.pluginloader import load
-import inspect
+
+# Static manifest mapping each registry to the package that defines it.
+# Registries (and through them, providers) are imported on first use.
+_MANIFEST = {
+    "KeyValueRegistry": "libs.data.key_value",
+    "StructuredRegistry": "libs.data.structured",
+}
 
 _REGISTRY = {}
 
-for module in load(path=__file__, depth=1):
-    for name, obj in inspect.getmembers(module):
+
+# Function to retrieve a registry, importing its package on first use
+def get_registry(protocol: str) -> StorageProviderRegistry:
+    """
+    Get the storage provider registry for a protocol.
+
+    Parameters
+    ----------
+    protocol : str
+        The protocol name, with or without the "Registry" suffix.
+
+    Returns
+    -------
+    StorageProviderRegistry
+        The registry associated with the protocol, or None if not found.
+
+    Example
+    -------
+    >>> registry = get_registry('KeyValue')
+    >>> print(registry.get_schemes())
+
+    Notes
+    -----
+    Only the registry package is imported. Provider modules are imported by the registry
+    when a binding requests one of their schemes.
+    """
+
+    global _REGISTRY
+    name = protocol if protocol in _MANIFEST else protocol + "Registry"
+    if name not in _REGISTRY and name in _MANIFEST:
+        obj = getattr(importlib.import_module(_MANIFEST[name]), name)
         if isinstance(obj, StorageProviderRegistry):
             _REGISTRY[name] = obj
-            obj.load_modules()  # Load modules for the storage provider registry
+    return _REGISTRY.get(name)
 
 # Function to retrieve a provider instance supporting a specified scheme
 def get_provider(protocol: str, scheme: str, *args, **kwargs) -> StorageProvider:
@@ -170,16 +235,16 @@ def get_provider(protocol: str, scheme: str, *args, **kwargs) -> StorageProvider
     -----
     This function retrieves a provider instance that supports a specified scheme.
     It checks the registered storage provider registries for the given protocol and scheme,
-    and returns an instance of the storage provider if found.
+    and returns an instance of the storage provider if found. Only the provider module
+    declared for the scheme is imported.
     """
 
-    global _REGISTRY
-    cls = _REGISTRY.get(protocol) or _REGISTRY.get(protocol + "Registry")
-    if scheme in cls.get_schemes():
+    cls = get_registry(protocol)
+    if not cls.supports(scheme):
+        # Unknown schemes may be matched by providers outside the manifest
+        cls.load_scheme(scheme)
+    if cls.supports(scheme):
         return cls.get_instance(scheme, *args, **kwargs)
-    if hasattr(cls, "regex_schemes"):
-        if cls.regex_schemes(scheme):
-            return cls.get_instance(scheme, *args, **kwargs)
 
 # Function to retrieve a dictionary of supported schemes for each protocol
 def get_supported() -> dict:
@@ -202,8 +267,10 @@ def get_supported() -> dict:
     and `get_schemes()` methods to retrieve the supported schemes for each protocol.
     """
 
-    global _REGISTRY
-    return {cls.get_protocol().__name__: cls.get_schemes() for _, cls in _REGISTRY.items()}
+    return {
+        cls.get_protocol().__name__: cls.get_schemes()
+        for cls in map(get_registry, _MANIFEST.keys())
+    }
 
 # Initialize global bindings dictionary
 _BINDINGS = {}
@@ -1,18 +1,192 @@
 from libs.utils.decorators import staticproperty, immutable_arguments
-from typing import Any, Callable, List, Protocol, runtime_checkable
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Protocol,
+    Set,
+    runtime_checkable,
+)
 from libs.utils.pluginloader import load
+import asyncio
 import functools
+import importlib
 import inspect
 
 _REGISTRY = {}
 
+# Static manifest mapping each scheme to the module that provides it.
+# Provider modules are only imported when a binding asks for one of their schemes.
+_MANIFEST: Dict[str, str] = {
+    "ram": f"{__name__}.ram",
+    "thread": f"{__name__}.thread",
+    "azure_table": f"{__name__}.table",
+    "tiered": f"{__name__}.tiered",
+    "shm": f"{__name__}.shm",
+    "sqlite": f"{__name__}.sqlite",
+    **{
+        scheme: f"{__name__}.stream"
+        for scheme in [
+            "azure_blob",
+            "file",
+            "ftp",
+            "ftps",
+            "gs",
+            "hdfs",
+            "http",
+            "https",
+            "s3",
+            "scp",
+            "sftp",
+            "ssh",
+            "viewfs",
+            "webhdfs",
+        ]
+    },
+}
+
+
+def map_keys(
+    func: Callable, keys: Iterable[str], max_workers: int = None
+) -> Dict[str, Any]:
+    """
+    Apply a function to each key and collect the per-key results or errors.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to call with each key.
+    keys : Iterable[str]
+        The keys to process.
+    max_workers : int, optional
+        The number of worker threads, by default None (the ThreadPoolExecutor default).
+        A value of 1 processes the keys sequentially in the calling thread.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary mapping each key to the value returned by `func`,
+        or to the exception it raised.
+
+    Example
+    -------
+    >>> results = map_keys(provider.load, ["key1", "key2"], max_workers=1)
+    >>> failed = [k for k, v in results.items() if isinstance(v, Exception)]
+    """
+
+    def call(key):
+        try:
+            return func(key)
+        except Exception as e:
+            return e
+
+    keys = list(dict.fromkeys(keys))
+    if max_workers == 1 or len(keys) < 2:
+        return {key: call(key) for key in keys}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(keys, executor.map(call, keys)))
+
+
+async def amap_keys(
+    func: Callable, keys: Iterable[str], max_concurrency: int = None
+) -> Dict[str, Any]:
+    """
+    Await a coroutine function for each key and collect the per-key results or errors.
+
+    Parameters
+    ----------
+    func : Callable
+        The coroutine function to call with each key.
+    keys : Iterable[str]
+        The keys to process.
+    max_concurrency : int, optional
+        The maximum number of coroutines awaited at once, by default None (unbounded).
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary mapping each key to the value returned by `func`,
+        or to the exception it raised.
+
+    Example
+    -------
+    >>> results = await amap_keys(provider.aload, ["key1", "key2"], max_concurrency=8)
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def call(key):
+        if semaphore:
+            async with semaphore:
+                return await func(key)
+        return await func(key)
+
+    keys = list(dict.fromkeys(keys))
+    return dict(
+        zip(
+            keys,
+            await asyncio.gather(*[call(key) for key in keys], return_exceptions=True),
+        )
+    )
+
+
+def is_missing(error: BaseException) -> bool:
+    """
+    Check whether an error raised by a key-value provider means that the key does not exist.
+
+    Parameters
+    ----------
+    error : BaseException
+        The error raised by `load()` or `drop()`.
+
+    Returns
+    -------
+    bool
+        True for KeyError and FileNotFoundError, for HTTP 404 errors of the Azure and AWS SDKs,
+        and for errors caused by one of these, such as those raised by `smart_open`.
+
+    Example
+    -------
+    >>> try:
+    >>>     value = provider.load("my_key")
+    >>> except Exception as e:
+    >>>     if not is_missing(e):
+    >>>         raise
+    >>>     value = None
+    """
+
+    while error is not None:
+        if isinstance(error, (KeyError, FileNotFoundError)):
+            return True
+        # azure.core.exceptions.ResourceNotFoundError and other HttpResponseErrors
+        if getattr(error, "status_code", None) == 404 or any(
+            cls.__name__ == "ResourceNotFoundError" for cls in type(error).__mro__
+        ):
+            return True
+        # botocore.exceptions.ClientError
+        response = getattr(error, "response", None)
+        if isinstance(response, dict) and response.get("Error", {}).get("Code") in (
+            "404",
+            "NoSuchKey",
+            "NotFound",
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
 
 @runtime_checkable
 class KeyValueProvider(Protocol):
     """
     Protocol for key-value storage providers.
 
-    Classes implementing this protocol must have the save() and load() methods.
+    Classes implementing this protocol must have the save() and load() methods,
+    and their batch counterparts save_many(), load_many() and drop_many().
     """
 
     @staticproperty
@@ -67,6 +241,207 @@ class KeyValueProvider(Protocol):
 
         pass
 
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Store several key-value pairs in the storage provider.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be stored, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the result of its save,
+            or to the exception that prevented it.
+        """
+
+        pass
+
+    def load_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Retrieve the values associated with several keys from the storage provider.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its retrieved value,
+            or to the exception that prevented it.
+        """
+
+        pass
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete the values associated with several keys from the storage provider.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the result of its deletion,
+            or to the exception that prevented it.
+        """
+
+        pass
+
+
+@runtime_checkable
+class AsyncKeyValueProvider(Protocol):
+    """
+    Protocol for key-value storage providers with native asyncio support.
+
+    Classes implementing this protocol must have the asave(), aload() and adrop() methods,
+    and their batch counterparts asave_many(), aload_many() and adrop_many().
+    """
+
+    async def asave(
+        self, key: str, value: Any, encoder: Callable = None, **kwargs
+    ) -> None:
+        """
+        Store the given value with the specified key without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be stored.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+        """
+
+        pass
+
+    async def aload(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Retrieve the value associated with the specified key without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The retrieved value.
+        """
+
+        pass
+
+    async def adrop(self, key: str, **kwargs) -> None:
+        """
+        Delete the value associated with the specified key without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        **kwargs : dict
+            Additional keyword arguments.
+        """
+
+        pass
+
+    async def asave_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Store several key-value pairs without blocking the event loop.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be stored, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the result of its save,
+            or to the exception that prevented it.
+        """
+
+        pass
+
+    async def aload_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Retrieve the values associated with several keys without blocking the event loop.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its retrieved value,
+            or to the exception that prevented it.
+        """
+
+        pass
+
+    async def adrop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete the values associated with several keys without blocking the event loop.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the result of its deletion,
+            or to the exception that prevented it.
+        """
+
+        pass
+
 
 class KeyValueRegistry:
     """
@@ -77,6 +452,9 @@ class KeyValueRegistry:
     """
 
     _providers = []
+    _index: Dict[str, Any] = {}
+    _schemes: List[str] = list(_MANIFEST.keys())
+    _loaded: Set[str] = set()
 
     @classmethod
     def get_protocol(cls) -> Protocol:
@@ -113,6 +491,44 @@ class KeyValueRegistry:
             raise TypeError("Only KeyValueProviders can be registered.")
         if provider_class not in cls._providers:
             cls._providers.append(provider_class)
+            cls.reindex()
+
+    @classmethod
+    def reindex(cls) -> None:
+        """
+        Rebuild the scheme-to-provider index from the registered provider classes.
+
+        Notes
+        -----
+        This method is called by `register()`, so lookups never have to evaluate
+        SUPPORTED_SCHEMES on the registered providers. When several providers claim
+        the same scheme, the first one registered wins.
+        """
+
+        index = {}
+        for provider in cls._providers:
+            for scheme in provider.SUPPORTED_SCHEMES:
+                index.setdefault(scheme, provider)
+        cls._index = index
+        cls._schemes = list(dict.fromkeys([*_MANIFEST.keys(), *index.keys()]))
+
+    @classmethod
+    def supports(cls, scheme: str) -> bool:
+        """
+        Check whether a scheme is declared in the manifest or by a registered provider.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme to check.
+
+        Returns
+        -------
+        bool
+            True if the scheme is supported, False otherwise.
+        """
+
+        return scheme in _MANIFEST or scheme in cls._index
 
     @classmethod
     @immutable_arguments
@@ -153,16 +569,13 @@ class KeyValueRegistry:
         This method generally should not be called directly.
 
         This method retrieves an instance of a key-value storage provider that supports
-        the specified scheme. It checks the registered provider classes for the given scheme
-        and returns an instance of the first matching provider. If no supporting provider is found,
+        the specified scheme. It looks up the scheme in the index built by `register()`
+        and returns an instance of the matching provider. If no supporting provider is found,
         a ValueError is raised.
         """
 
-        provider_class = None
-        for provider in cls._providers:
-            if scheme in provider.SUPPORTED_SCHEMES:
-                provider_class = provider
-                break
+        cls.load_scheme(scheme)
+        provider_class = cls._index.get(scheme)
         if not provider_class:
             raise ValueError(
                 f"Storage provider for the '{scheme}' scheme is not supported."
@@ -186,15 +599,59 @@ class KeyValueRegistry:
 
         Notes
         -----
-        This method returns a list of all supported schemes by iterating over the registered provider classes
-        and retrieving the SUPPORTED_SCHEMES attribute from each class.
+        This method returns the schemes declared in the provider manifest, followed by any
+        schemes of registered provider classes that are not declared in the manifest.
+        Provider modules are not imported to build this list, and the list is only rebuilt
+        when a provider is registered.
         """
 
-        return [
-            scheme
-            for provider in cls._providers
-            for scheme in provider.SUPPORTED_SCHEMES
-        ]
+        return cls._schemes
+
+    @classmethod
+    def load_scheme(cls, scheme: str) -> None:
+        """
+        Import the provider module declared for a scheme and register its providers.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme whose provider module should be loaded.
+
+        Example
+        -------
+        >>> KeyValueRegistry.load_scheme("ram")
+
+        Notes
+        -----
+        Schemes that are neither declared in the manifest nor already registered fall back
+        to `load_modules()`, which imports every module in the package.
+        """
+
+        if scheme in _MANIFEST:
+            if _MANIFEST[scheme] not in cls._loaded:
+                cls.register_module(importlib.import_module(_MANIFEST[scheme]))
+                cls._loaded.add(_MANIFEST[scheme])
+        elif scheme not in cls._index:
+            cls.load_modules()
+
+    @classmethod
+    def register_module(cls, module: ModuleType) -> None:
+        """
+        Register any KeyValueProviders found in a module.
+
+        Parameters
+        ----------
+        module : ModuleType
+            The module to scan for provider classes.
+        """
+
+        for name, obj in inspect.getmembers(module):
+            if (
+                inspect.isclass(obj)
+                and isinstance(obj, KeyValueProvider)
+                and obj != KeyValueProvider
+            ):
+                cls.register(obj)
 
     @classmethod
     def load_modules(cls) -> None:
@@ -213,10 +670,4 @@ class KeyValueRegistry:
         """
 
         for module in load(path=__file__, file_mode="all", depth=-1):
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and isinstance(obj, KeyValueProvider)
-                    and obj != KeyValueProvider
-                ):
-                    KeyValueRegistry.register(obj)
+            cls.register_module(module)
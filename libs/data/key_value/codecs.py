@@ -0,0 +1,238 @@
+from typing import Any, Callable, Dict, Tuple, Union
+import pickle
+import threading
+
+# Every zstd frame starts with this magic number, which none of the serializers can emit
+# as the first bytes of a value.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _orjson() -> Tuple[Callable, Callable]:
+    import orjson
+
+    return (
+        lambda value: orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY),
+        orjson.loads,
+    )
+
+
+def _msgpack() -> Tuple[Callable, Callable]:
+    import msgpack
+
+    return (
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False),
+    )
+
+
+def _pickle() -> Tuple[Callable, Callable]:
+    return (lambda value: pickle.dumps(value, protocol=5), pickle.loads)
+
+
+def _json() -> Tuple[Callable, Callable]:
+    import json
+
+    return (
+        lambda value: json.dumps(value, separators=(",", ":")).encode(),
+        # json only parses str, bytes and bytearray, not buffers such as memoryview
+        lambda data: json.loads(bytes(data)),
+    )
+
+
+SERIALIZERS: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "orjson": _orjson,
+    "msgpack": _msgpack,
+    "pickle": _pickle,
+    "json": _json,
+}
+
+
+class Codec:
+    """
+    Binary codec applied to values by key-value bindings.
+
+    A codec serializes values to bytes and optionally compresses them with zstd.
+    Codecs are configured per binding with the `codec` keyword argument, as a `Codec`
+    instance or as a specification string of the form "serializer[+zstd[:level]]".
+    """
+
+    def __init__(
+        self,
+        serializer: str = "pickle",
+        compression: str = None,
+        level: int = 3,
+        threshold: int = 256,
+    ) -> None:
+        """
+        Initialize an instance of Codec.
+
+        Parameters
+        ----------
+        serializer : str, optional
+            The serializer, one of "orjson", "msgpack", "pickle" (protocol 5) or "json",
+            by default "pickle".
+        compression : str, optional
+            The compression, "zstd" or None, by default None.
+        level : int, optional
+            The zstd compression level, by default 3.
+        threshold : int, optional
+            The size in bytes below which serialized values are stored uncompressed,
+            by default 256.
+
+        Raises
+        ------
+        ValueError
+            If the serializer or the compression is not supported.
+        ImportError
+            If the package of the serializer or the compression is not installed.
+        """
+
+        if serializer not in SERIALIZERS:
+            raise ValueError(
+                f"Unsupported serializer '{serializer}'. Supported serializers are {', '.join(SERIALIZERS)}."
+            )
+        if compression not in (None, "zstd"):
+            raise ValueError(
+                f"Unsupported compression '{compression}'. The only supported compression is zstd."
+            )
+        self.serializer = serializer
+        self.compression = compression
+        self.level = level
+        self.threshold = threshold
+        try:
+            self.dumps, self.loads = SERIALIZERS[serializer]()
+            if compression == "zstd":
+                import zstandard
+
+                self.zstd = zstandard
+        except ImportError as e:
+            raise ImportError(
+                f"The codec '{self}' requires the optional package '{e.name}'. Install it with `pip install {e.name}`."
+            ) from e
+        if compression == "zstd":
+            # Compression contexts are not thread-safe, so each thread keeps its own
+            self.local = threading.local()
+
+    def __repr__(self) -> str:
+        """
+        Return the specification string of the codec.
+
+        Returns
+        -------
+        str
+            The specification string, as accepted by `get_codec()`.
+        """
+
+        if self.compression:
+            return f"{self.serializer}+{self.compression}:{self.level}"
+        return self.serializer
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize and compress a value.
+
+        Parameters
+        ----------
+        value : Any
+            The value to encode.
+
+        Returns
+        -------
+        bytes
+            The encoded value.
+        """
+
+        data = self.dumps(value)
+        if self.compression and len(data) >= self.threshold:
+            data = self.__context("compressor").compress(data)
+        return data
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decompress and deserialize a value.
+
+        Parameters
+        ----------
+        data : bytes
+            The encoded value, as bytes or any other buffer, such as a memoryview.
+
+        Returns
+        -------
+        Any
+            The decoded value.
+
+        Notes
+        -----
+        Compressed values are recognized by the zstd magic number, so values stored
+        uncompressed, below the threshold or before compression was enabled, still decode.
+        """
+
+        if bytes(data[:4]) == _ZSTD_MAGIC:
+            if not self.compression:
+                raise ValueError(
+                    "The value is compressed with zstd, but the codec has no compression."
+                )
+            data = self.__context("decompressor").decompress(data)
+        return self.loads(data)
+
+    def __context(self, name: str) -> Any:
+        """
+        Get the zstd compression or decompression context of the current thread.
+
+        Parameters
+        ----------
+        name : str
+            "compressor" or "decompressor".
+
+        Returns
+        -------
+        Any
+            The context of the current thread.
+        """
+
+        context = getattr(self.local, name, None)
+        if context is None:
+            context = (
+                self.zstd.ZstdCompressor(level=self.level)
+                if name == "compressor"
+                else self.zstd.ZstdDecompressor()
+            )
+            setattr(self.local, name, context)
+        return context
+
+
+def get_codec(codec: Union[str, Codec, None]) -> Union[Codec, None]:
+    """
+    Get a codec from a binding configuration value.
+
+    Parameters
+    ----------
+    codec : Union[str, Codec, None]
+        A `Codec` instance, a specification string of the form "serializer[+zstd[:level]]",
+        or None.
+
+    Returns
+    -------
+    Union[Codec, None]
+        The codec, or None if no codec is configured.
+
+    Raises
+    ------
+    ImportError
+        If the codec needs msgpack, orjson or zstandard and the package is not installed.
+        These packages are optional, pickle and json need no extra package.
+
+    Example
+    -------
+    >>> codec = get_codec("msgpack+zstd:6")
+    >>> codec.decode(codec.encode({"a": 1}))
+    {'a': 1}
+    """
+
+    if codec is None or isinstance(codec, Codec):
+        return codec
+    serializer, _, compression = codec.partition("+")
+    compression, _, level = compression.partition(":")
+    return Codec(
+        serializer, compression or None, **({"level": int(level)} if level else {})
+    )
@@ -1,5 +1,31 @@
+from collections import OrderedDict
+from libs.data.key_value import map_keys
 from libs.utils.decorators import staticproperty
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+import heapq
+import sys
+import threading
+import time
+
+
+def sizeof(value: Any) -> int:
+    """
+    Approximate the number of bytes held by a value.
+
+    Parameters
+    ----------
+    value : Any
+        The value to measure.
+
+    Returns
+    -------
+    int
+        The length of bytes-like and string values, otherwise `sys.getsizeof(value)`.
+    """
+
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    return sys.getsizeof(value)
 
 
 class MemoryKeyValueProvider:
@@ -7,7 +33,10 @@ class MemoryKeyValueProvider:
     Memory-based key-value storage provider.
 
     This class provides methods to save, load, and delete key-value pairs
-    in a memory-based store.
+    in a memory-based store. The store can be bounded by entry count and
+    approximate byte size, and entries can expire after a time-to-live.
+    Every operation holds a lock, so a binding can be shared by the
+    worker threads that run synchronous functions.
     """
 
     @staticproperty
@@ -46,9 +75,69 @@ class MemoryKeyValueProvider:
             Additional positional arguments.
         **kwargs : dict
             Additional keyword arguments.
+            Supported optional kwargs include:
+            - max_entries : int
+                The maximum number of entries kept in the store.
+            - max_bytes : int
+                The maximum approximate size, in bytes, of the values kept in the store.
+            - ttl : float
+                The default number of seconds an entry lives before it expires.
+            - policy : str
+                The eviction policy used once a limit is reached, either "lru"
+                (least recently used, the default) or "lfu" (least frequently used).
+            - sizeof : Callable
+                The function used to approximate the size of a value, by default `sizeof`.
+
+        Raises
+        ------
+        ValueError
+            If the eviction policy is not supported.
+
+        Example
+        -------
+        >>> from libs.data import register_binding
+        >>> register_binding("ram_handle", "KeyValue", "ram", max_entries=1000, ttl=300)
         """
 
-        self.store = {}
+        self.max_entries: int = kwargs.get("max_entries")
+        self.max_bytes: int = kwargs.get("max_bytes")
+        self.ttl: float = kwargs.get("ttl")
+        self.policy: str = kwargs.get("policy", "lru").lower()
+        if self.policy not in ["lru", "lfu"]:
+            raise ValueError(f"Eviction policy '{self.policy}' is not supported.")
+        self.sizeof: Callable = kwargs.get("sizeof", sizeof)
+
+        self.store = OrderedDict()
+        self.lock = threading.RLock()
+        self.__sizes = {}
+        self.__expires = {}
+        self.__deadlines = []
+        self.__counts = {}
+        self.__buckets = {}
+        self.__min_count = 0
+        self.__bytes = 0
+        self.__stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics for the store.
+
+        Returns
+        -------
+        Dict[str, int]
+            The hit, miss, eviction and expiration counters,
+            and the current number of entries and bytes.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('ram_handle')
+        >>> print(provider.stats["hits"])
+        """
+
+        with self.lock:
+            return {**self.__stats, "entries": len(self.store), "bytes": self.__bytes}
 
     def __getitem__(self, handle: str) -> Any:
         """
@@ -80,7 +169,14 @@ class MemoryKeyValueProvider:
 
         return self.load(key=handle)
 
-    def save(self, key: str, value: Any, encoder: Callable = None, **kwargs) -> None:
+    def save(
+        self,
+        key: str,
+        value: Any,
+        encoder: Callable = None,
+        ttl: float = None,
+        **kwargs,
+    ) -> None:
         """
         Save a key-value pair in the store.
 
@@ -92,6 +188,9 @@ class MemoryKeyValueProvider:
             The value to be saved.
         encoder : Callable, optional
             The encoder function to use for encoding the value, by default None.
+        ttl : float, optional
+            The number of seconds the entry lives before it expires,
+            by default None (the binding's `ttl`).
         **kwargs : dict
             Additional keyword arguments.
 
@@ -99,16 +198,45 @@ class MemoryKeyValueProvider:
         -------
         >>> from libs.data import from_bind
         >>> provider = from_bind('ram_handle')
-        >>> provider.save("my_key", "my_value")
+        >>> provider.save("my_key", "my_value", ttl=60)
 
         Notes
         -----
         This method saves a key-value pair in the store. If an encoder function is provided,
         the value is encoded before saving. The encoded value or the original value is stored
-        in the internal store dictionary with the specified key.
+        in the internal store dictionary with the specified key. Expired entries are removed first,
+        then entries are evicted according to the policy until the new entry fits the limits.
+        A value larger than `max_bytes` on its own is not stored.
         """
 
-        self.store[key] = encoder(value, **kwargs) if encoder else value
+        value = encoder(value, **kwargs) if encoder else value
+        size = self.sizeof(value) if self.max_bytes else 0
+        ttl = ttl if ttl is not None else self.ttl
+        with self.lock:
+            if key in self.store:
+                self.__remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                return
+            if self.__deadlines and self.__deadlines[0][0] <= time.monotonic():
+                self.purge()
+            # Room is made before inserting, so the new entry is never its own victim
+            while self.__over_limit(size):
+                self.__evict()
+            self.store[key] = value
+            self.__sizes[key] = size
+            self.__bytes += size
+            if self.policy == "lfu":
+                self.__counts[key] = 1
+                self.__buckets.setdefault(1, OrderedDict())[key] = None
+                self.__min_count = 1
+            if ttl is not None:
+                deadline = time.monotonic() + ttl
+                self.__expires[key] = deadline
+                heapq.heappush(self.__deadlines, (deadline, key))
+                if len(self.__deadlines) > 2 * len(self.__expires) + 64:
+                    # Drop heap entries left behind by overwritten or dropped keys
+                    self.__deadlines = [(d, k) for k, d in self.__expires.items()]
+                    heapq.heapify(self.__deadlines)
 
     def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
         """
@@ -136,6 +264,11 @@ class MemoryKeyValueProvider:
         >>> value = provider.load("my_key")
         >>> print(value)
 
+        Raises
+        ------
+        KeyError
+            If the key is not found in the store or has expired.
+
         Notes
         -----
         This method retrieves a value from the store using the specified key.
@@ -143,7 +276,17 @@ class MemoryKeyValueProvider:
         The decoded value or the original stored value is returned.
         """
 
-        return decoder(self.store[key], **kwargs) if decoder else self.store[key]
+        with self.lock:
+            if key in self.__expires and self.__expires[key] <= time.monotonic():
+                self.__remove(key)
+                self.__stats["expirations"] += 1
+            if key not in self.store:
+                self.__stats["misses"] += 1
+                raise KeyError(key)
+            self.__stats["hits"] += 1
+            self.__touch(key)
+            value = self.store[key]
+        return decoder(value, **kwargs) if decoder else value
 
     def drop(self, key: str) -> None:
         """
@@ -167,4 +310,206 @@ class MemoryKeyValueProvider:
         If the key is not found in the store, a KeyError is raised.
         """
 
+        with self.lock:
+            if key not in self.store:
+                raise KeyError(key)
+            self.__remove(key)
+
+    def purge(self) -> int:
+        """
+        Remove every expired entry from the store.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('ram_handle')
+        >>> provider.purge()
+        """
+
+        removed = 0
+        now = time.monotonic()
+        with self.lock:
+            while self.__deadlines and self.__deadlines[0][0] <= now:
+                deadline, key = heapq.heappop(self.__deadlines)
+                # Skip heap entries left behind by keys that were overwritten or dropped
+                if self.__expires.get(key) == deadline:
+                    self.__remove(key)
+                    removed += 1
+            self.__stats["expirations"] += removed
+        return removed
+
+    def __over_limit(self, size: int = 0) -> bool:
+        """
+        Check whether adding an entry would exceed the entry count or byte size limit.
+
+        Parameters
+        ----------
+        size : int, optional
+            The size of the entry to add, by default 0.
+
+        Returns
+        -------
+        bool
+            True if a limit would be exceeded, False otherwise.
+        """
+
+        return bool(
+            self.store
+            and (
+                (self.max_entries and len(self.store) >= self.max_entries)
+                or (self.max_bytes and self.__bytes + size > self.max_bytes)
+            )
+        )
+
+    def __touch(self, key: str) -> None:
+        """
+        Record an access to a key for the eviction policy.
+
+        Parameters
+        ----------
+        key : str
+            The key that was accessed.
+        """
+
+        if self.policy == "lru":
+            self.store.move_to_end(key)
+        else:
+            count = self.__counts[key]
+            bucket = self.__buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self.__buckets[count]
+                if self.__min_count == count:
+                    self.__min_count = count + 1
+            self.__counts[key] = count + 1
+            self.__buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def __evict(self) -> None:
+        """
+        Evict one entry according to the eviction policy.
+        """
+
+        if self.policy == "lru":
+            key = next(iter(self.store))
+        else:
+            if self.__min_count not in self.__buckets:
+                self.__min_count = min(self.__buckets)
+            key = next(iter(self.__buckets[self.__min_count]))
+        self.__remove(key)
+        self.__stats["evictions"] += 1
+
+    def __remove(self, key: str) -> None:
+        """
+        Remove a key and its bookkeeping from the store.
+
+        Parameters
+        ----------
+        key : str
+            The key to remove.
+        """
+
         del self.store[key]
+        self.__bytes -= self.__sizes.pop(key)
+        self.__expires.pop(key, None)
+        if self.policy == "lfu":
+            count = self.__counts.pop(key)
+            bucket = self.__buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self.__buckets[count]
+
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in the store.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while saving it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('ram_handle')
+        >>> provider.save_many({"key1": "value1", "key2": "value2"})
+        """
+
+        return map_keys(
+            lambda key: self.save(key, items[key], encoder=encoder, **kwargs),
+            items.keys(),
+            max_workers=1,
+        )
+
+    def load_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Load several values from the store.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('ram_handle')
+        >>> values = provider.load_many(["key1", "key2"])
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=1,
+        )
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs from the store.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while deleting it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('ram_handle')
+        >>> provider.drop_many(["key1", "key2"])
+        """
+
+        return map_keys(self.drop, keys, max_workers=1)
@@ -0,0 +1,681 @@
+from contextlib import contextmanager
+from hashlib import blake2b
+from libs.data.key_value import map_keys
+from libs.data.key_value.codecs import get_codec
+from libs.utils.decorators import staticproperty
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+import fcntl
+import itertools
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+# magic, seq, slot count, heap size, active heap, heap top, entry count, generation
+_HEADER = struct.Struct("<8sQQQQQQQ")
+# key hash, record offset, key length, value length
+_SLOT = struct.Struct("<QQII")
+_WORD = struct.Struct("<Q")
+_MAGIC = b"LIBSKV01"
+_SEQ, _ACTIVE, _TOP, _COUNT, _GENERATION = 8, 32, 40, 48, 56
+_EMPTY, _TOMBSTONE = 0, 1
+
+
+def _hash(key: bytes) -> int:
+    """
+    Hash a key consistently across processes.
+
+    Parameters
+    ----------
+    key : bytes
+        The encoded key.
+
+    Returns
+    -------
+    int
+        A 64-bit hash, never equal to the empty or tombstone slot markers.
+    """
+
+    return max(int.from_bytes(blake2b(key, digest_size=8).digest(), "little"), 2)
+
+
+class SharedMemoryKeyValueProvider:
+    """
+    Shared-memory key-value storage provider.
+
+    This class provides methods to save, load, and delete key-value pairs in a
+    memory-mapped file shared by every process on the host, such as the worker
+    processes of a function app. Reads are lock-free and can return zero-copy
+    views, while writers are serialized by a file lock and publish their changes
+    through a sequence lock. It suits read-mostly reference data.
+    """
+
+    @staticproperty
+    def SUPPORTED_SCHEMES(self) -> List[str]:
+        """
+        List of supported schemes.
+
+        Returns
+        -------
+        List[str]
+            A list of supported schemes.
+        """
+
+        return ["shm"]
+
+    @staticproperty
+    def scheme(self) -> str:
+        """
+        Scheme supported by the provider.
+
+        Returns
+        -------
+        str
+            The supported scheme.
+        """
+
+        return self.SUPPORTED_SCHEMES[0]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize an instance of SharedMemoryKeyValueProvider.
+
+        Parameters
+        ----------
+        *args : tuple
+            Additional positional arguments.
+        **kwargs : dict
+            Additional keyword arguments.
+            Supported optional kwargs include:
+            - name : str
+                The name of the store, by default "default". Bindings with the same name
+                share the same store.
+            - path : str
+                The path of the memory-mapped file, by default "<name>.kv" in /dev/shm,
+                or in the temporary directory where /dev/shm does not exist.
+            - size : int
+                The size in bytes of the file, by default 64 MiB. Ignored when the file
+                already exists.
+            - slots : int
+                The number of hash table slots, rounded up to a power of two, by default 65536.
+                At most three quarters of them hold entries. Ignored when the file already exists.
+            - codec : str or libs.data.key_value.codecs.Codec
+                The codec applied to values saved without an encoder and loaded without a
+                decoder, by default "pickle". With None, values must be bytes or strings and
+                are loaded as bytes.
+
+        Example
+        -------
+        >>> from libs.data import register_binding
+        >>> register_binding(
+        >>>     "reference",
+        >>>     "KeyValue",
+        >>>     "shm",
+        >>>     name="reference",
+        >>>     size=256 * 1024**2,
+        >>>     codec="msgpack",
+        >>> )
+        """
+
+        kwargs.pop("scheme", None)
+        name = kwargs.pop("name", "default")
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        self.path = kwargs.pop("path", os.path.join(directory, f"{name}.kv"))
+        self.codec = get_codec(kwargs.pop("codec", "pickle"))
+        size = kwargs.pop("size", 64 * 1024**2)
+        slots = 1 << max(kwargs.pop("slots", 65536) - 1, 1).bit_length()
+
+        self.lock = threading.Lock()
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size == 0:
+                heap_size = (size - _HEADER.size - slots * _SLOT.size) // 2
+                if heap_size <= 0:
+                    raise ValueError(
+                        f"A store of {size} bytes cannot hold {slots} slots."
+                    )
+                os.ftruncate(self.fd, size)
+                self.mm = mmap.mmap(self.fd, size)
+                _HEADER.pack_into(self.mm, 0, _MAGIC, 0, slots, heap_size, 0, 0, 0, 0)
+            else:
+                self.mm = mmap.mmap(self.fd, os.fstat(self.fd).st_size)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        magic, _, self.slots, self.heap_size, *_ = _HEADER.unpack_from(self.mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a shared-memory key-value store.")
+        self.buffer = memoryview(self.mm)
+        self.slot_base = _HEADER.size
+        self.heap_base = self.slot_base + self.slots * _SLOT.size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Store statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of entries, the bytes used in the active heap, the heap size,
+            the number of slots, and the number of compactions.
+        """
+
+        return {
+            "entries": self.__word(_COUNT),
+            "bytes": self.__word(_TOP),
+            "heap_size": self.heap_size,
+            "slots": self.slots,
+            "generation": self.__word(_GENERATION),
+        }
+
+    def __getitem__(self, handle: str) -> Any:
+        """
+        Retrieve an item from the storage using a handle.
+
+        Parameters
+        ----------
+        handle : str
+            The handle associated with the item.
+
+        Returns
+        -------
+        Any
+            The retrieved item.
+        """
+
+        return self.load(key=handle)
+
+    def save(self, key: str, value: Any, encoder: Callable = None, **kwargs) -> None:
+        """
+        Save a key-value pair in the storage.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value to bytes, by default None.
+            Without an encoder, the codec of the binding encodes the value.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Raises
+        ------
+        MemoryError
+            If the store is full even after compaction.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('shm_handle')
+        >>> provider.save("policies", policies)
+
+        Notes
+        -----
+        Values are appended to the active heap, so readers of the previous value are never
+        disturbed. When the heap is full, the live entries are compacted into the other heap.
+        """
+
+        if encoder:
+            data = encoder(value, **kwargs)
+        elif self.codec is not None:
+            data = self.codec.encode(value)
+        else:
+            data = value
+        if isinstance(data, str):
+            data = data.encode()
+        raw_key = key.encode()
+        hash_ = _hash(raw_key)
+        size = len(raw_key) + len(data)
+        if size > self.heap_size:
+            raise MemoryError(f"The value of '{key}' is larger than the store.")
+
+        with self.__write():
+            if self.__word(_TOP) + size > self.heap_size:
+                self.__compact()
+            top = self.__word(_TOP)
+            if top + size > self.heap_size:
+                raise MemoryError(f"The store is full, '{key}' was not saved.")
+            index, found = self.__find(raw_key, hash_)
+            if not found:
+                if (self.__word(_COUNT) + 1) * 4 > self.slots * 3:
+                    raise MemoryError(f"The store has no free slot for '{key}'.")
+                if index is None:
+                    # Tombstones fill the probe sequence, compaction clears them
+                    self.__compact()
+                    top = self.__word(_TOP)
+                    index, _ = self.__find(raw_key, hash_)
+                self.__set_word(_COUNT, self.__word(_COUNT) + 1)
+            offset = self.heap_base + self.__word(_ACTIVE) * self.heap_size + top
+            self.buffer[offset : offset + len(raw_key)] = raw_key
+            self.buffer[offset + len(raw_key) : offset + size] = data
+            _SLOT.pack_into(
+                self.mm,
+                self.slot_base + index * _SLOT.size,
+                hash_,
+                offset,
+                len(raw_key),
+                len(data),
+            )
+            self.__set_word(_TOP, top + size)
+
+    def view(self, key: str) -> memoryview:
+        """
+        Get a zero-copy view of the encoded value of a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+
+        Returns
+        -------
+        memoryview
+            A read-only view of the encoded value in shared memory.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist.
+
+        Notes
+        -----
+        Saving a key never overwrites the bytes of its previous value, so the view stays valid
+        across writes. A compaction may reuse the heap it points to two compactions later;
+        compare `stats["generation"]` before and after using a long-lived view.
+        """
+
+        raw_key = key.encode()
+        hash_ = _hash(raw_key)
+        for attempt in itertools.count():
+            seq = self.__word(_SEQ)
+            if seq & 1:
+                self.__wait(attempt)
+                continue
+            located = self.__locate(raw_key, hash_)
+            if self.__word(_SEQ) == seq:
+                if located is None:
+                    raise KeyError(key)
+                offset, key_length, value_length = located
+                start = offset + key_length
+                return self.buffer[start : start + value_length].toreadonly()
+
+    def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Load a value from the storage using a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+            It receives a memoryview of the encoded value. Without a decoder, the codec of
+            the binding decodes the value.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The loaded value, or the encoded bytes if the binding has no codec.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('shm_handle')
+        >>> policies = provider.load("policies")
+
+        Notes
+        -----
+        The value is decoded straight from shared memory. If a writer compacted the store
+        meanwhile, the sequence lock detects it and the read is retried.
+        """
+
+        if decoder:
+            decode = lambda data: decoder(data, **kwargs)
+        elif self.codec is not None:
+            decode = self.codec.decode
+        else:
+            decode = bytes
+        for attempt in itertools.count():
+            generation = self.__word(_GENERATION)
+            try:
+                value = decode(self.view(key))
+            except KeyError:
+                raise
+            except Exception:
+                # A compaction may have moved the bytes while they were decoded
+                if self.__word(_GENERATION) == generation:
+                    raise
+                continue
+            if self.__word(_GENERATION) == generation:
+                return value
+            self.__wait(attempt)
+
+    def drop(self, key: str, **kwargs) -> None:
+        """
+        Delete a key-value pair from the storage.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist.
+        """
+
+        raw_key = key.encode()
+        with self.__write():
+            index, found = self.__find(raw_key, _hash(raw_key))
+            if not found:
+                raise KeyError(key)
+            _SLOT.pack_into(
+                self.mm, self.slot_base + index * _SLOT.size, _TOMBSTONE, 0, 0, 0
+            )
+            self.__set_word(_COUNT, self.__word(_COUNT) - 1)
+
+    def clear(self) -> None:
+        """
+        Delete every key-value pair from the storage.
+        """
+
+        with self.__write():
+            self.__reset()
+
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in the storage.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while saving it.
+        """
+
+        return map_keys(
+            lambda key: self.save(key, items[key], encoder=encoder, **kwargs),
+            items.keys(),
+            max_workers=1,
+        )
+
+    def load_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Load several values from the storage.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=1,
+        )
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs from the storage.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while deleting it.
+        """
+
+        return map_keys(lambda key: self.drop(key, **kwargs), keys, max_workers=1)
+
+    def close(self) -> None:
+        """
+        Unmap the store. The file is kept for the other processes.
+        """
+
+        self.buffer.release()
+        self.mm.close()
+        os.close(self.fd)
+
+    @contextmanager
+    def __write(self) -> Iterator[None]:
+        """
+        Hold the writer lock of every thread and process, with the sequence number odd.
+
+        Notes
+        -----
+        An odd sequence number found when taking the lock means a writer died while
+        writing, so the store is cleared rather than trusted.
+        """
+
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                seq = self.__word(_SEQ)
+                if seq & 1:
+                    self.__reset()
+                    seq += 1
+                self.__set_word(_SEQ, seq + 1)
+                try:
+                    yield
+                finally:
+                    self.__set_word(_SEQ, seq + 2)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def __wait(self, attempt: int) -> None:
+        """
+        Back off while a writer holds the sequence lock.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of attempts made so far.
+        """
+
+        if attempt < 100:
+            return
+        if attempt % 1000 == 0:
+            # Taking the writer lock clears the store if its last writer died
+            with self.__write():
+                pass
+        time.sleep(0.0001)
+
+    def __word(self, offset: int) -> int:
+        """
+        Read a header field.
+
+        Parameters
+        ----------
+        offset : int
+            The offset of the field.
+
+        Returns
+        -------
+        int
+            The field value.
+        """
+
+        return _WORD.unpack_from(self.mm, offset)[0]
+
+    def __set_word(self, offset: int, value: int) -> None:
+        """
+        Write a header field.
+
+        Parameters
+        ----------
+        offset : int
+            The offset of the field.
+        value : int
+            The field value.
+        """
+
+        _WORD.pack_into(self.mm, offset, value)
+
+    def __locate(self, raw_key: bytes, hash_: int) -> Tuple[int, int, int]:
+        """
+        Find the record of a key without taking the writer lock.
+
+        Parameters
+        ----------
+        raw_key : bytes
+            The encoded key.
+        hash_ : int
+            The hash of the key.
+
+        Returns
+        -------
+        Tuple[int, int, int]
+            The record offset, key length and value length, or None if the key does not exist.
+            The result is only meaningful if the sequence number did not change meanwhile.
+        """
+
+        index, found = self.__find(raw_key, hash_)
+        if not found:
+            return None
+        _, offset, key_length, value_length = _SLOT.unpack_from(
+            self.mm, self.slot_base + index * _SLOT.size
+        )
+        return offset, key_length, value_length
+
+    def __find(self, raw_key: bytes, hash_: int) -> Tuple[int, bool]:
+        """
+        Probe the hash table for a key.
+
+        Parameters
+        ----------
+        raw_key : bytes
+            The encoded key.
+        hash_ : int
+            The hash of the key.
+
+        Returns
+        -------
+        Tuple[int, bool]
+            The slot of the key and True if it exists. Otherwise, the first free slot of its
+            probe sequence (None if there is none) and False.
+        """
+
+        mask = self.slots - 1
+        index = hash_ & mask
+        free = None
+        for _ in range(self.slots):
+            slot_hash, offset, key_length, _ = _SLOT.unpack_from(
+                self.mm, self.slot_base + index * _SLOT.size
+            )
+            if slot_hash == _EMPTY:
+                return (index if free is None else free), False
+            if slot_hash == _TOMBSTONE:
+                if free is None:
+                    free = index
+            elif (
+                slot_hash == hash_
+                and key_length == len(raw_key)
+                and self.buffer[offset : offset + key_length] == raw_key
+            ):
+                return index, True
+            index = (index + 1) & mask
+        return free, False
+
+    def __compact(self) -> None:
+        """
+        Copy the live entries into the inactive heap and make it the active one.
+
+        Notes
+        -----
+        The hash table is rebuilt at the same time, which also clears the tombstones.
+        Must be called while holding the writer lock.
+        """
+
+        entries = [
+            _SLOT.unpack_from(self.mm, self.slot_base + index * _SLOT.size)
+            for index in range(self.slots)
+        ]
+        active = 1 - self.__word(_ACTIVE)
+        base = self.heap_base + active * self.heap_size
+        self.buffer[self.slot_base : self.heap_base] = bytes(
+            self.heap_base - self.slot_base
+        )
+        top = 0
+        mask = self.slots - 1
+        for slot_hash, offset, key_length, value_length in entries:
+            if slot_hash <= _TOMBSTONE:
+                continue
+            size = key_length + value_length
+            self.buffer[base + top : base + top + size] = self.buffer[
+                offset : offset + size
+            ]
+            index = slot_hash & mask
+            while _SLOT.unpack_from(self.mm, self.slot_base + index * _SLOT.size)[0]:
+                index = (index + 1) & mask
+            _SLOT.pack_into(
+                self.mm,
+                self.slot_base + index * _SLOT.size,
+                slot_hash,
+                base + top,
+                key_length,
+                value_length,
+            )
+            top += size
+        self.__set_word(_ACTIVE, active)
+        self.__set_word(_TOP, top)
+        self.__set_word(_GENERATION, self.__word(_GENERATION) + 1)
+
+    def __reset(self) -> None:
+        """
+        Empty the hash table and the active heap.
+
+        Notes
+        -----
+        Must be called while holding the writer lock.
+        """
+
+        self.buffer[self.slot_base : self.heap_base] = bytes(
+            self.heap_base - self.slot_base
+        )
+        self.__set_word(_TOP, 0)
+        self.__set_word(_COUNT, 0)
+        self.__set_word(_GENERATION, self.__word(_GENERATION) + 1)
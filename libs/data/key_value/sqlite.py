@@ -0,0 +1,551 @@
+from contextlib import closing, contextmanager
+from libs.data.key_value.codecs import get_codec
+from libs.utils.decorators import staticproperty
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+class SQLiteKeyValueProvider:
+    """
+    SQLite-based key-value storage provider.
+
+    This class provides methods to save, load, and delete key-value pairs in a
+    SQLite database on the local disk of the instance. The database runs in WAL
+    mode, so reads never wait for writers, and it survives process restarts,
+    which makes it suited to warm caches in front of remote bindings.
+    """
+
+    @staticproperty
+    def SUPPORTED_SCHEMES(self) -> List[str]:
+        """
+        List of supported schemes.
+
+        Returns
+        -------
+        List[str]
+            A list of supported schemes.
+        """
+
+        return ["sqlite"]
+
+    @staticproperty
+    def scheme(self) -> str:
+        """
+        Scheme supported by the provider.
+
+        Returns
+        -------
+        str
+            The supported scheme.
+        """
+
+        return self.SUPPORTED_SCHEMES[0]
+
+    @staticproperty
+    def PARAMETER_LIMIT(self) -> int:
+        """
+        Maximum number of keys bound to a single statement.
+
+        Returns
+        -------
+        int
+            The parameter limit, below the SQLite default of 999 on older builds.
+        """
+
+        return 500
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize an instance of SQLiteKeyValueProvider.
+
+        Parameters
+        ----------
+        *args : tuple
+            Additional positional arguments.
+        **kwargs : dict
+            Additional keyword arguments.
+            Supported optional kwargs include:
+            - name : str
+                The name of the store, by default "default".
+            - path : str
+                The path of the database, by default "<name>.sqlite" in the temporary directory.
+            - ttl : float
+                The default number of seconds before an entry expires, by default None (never).
+            - codec : str or libs.data.key_value.codecs.Codec
+                The codec applied to values saved without an encoder and loaded without a
+                decoder, by default "pickle".
+            - compact_interval : float
+                The number of seconds between background compactions, by default 300.
+                With None or 0, the store is only compacted by calling `compact()`.
+
+        Example
+        -------
+        >>> from libs.data import register_binding
+        >>> register_binding(
+        >>>     "warm_cache",
+        >>>     "KeyValue",
+        >>>     "sqlite",
+        >>>     name="warm_cache",
+        >>>     ttl=3600,
+        >>> )
+        """
+
+        kwargs.pop("scheme", None)
+        name = kwargs.pop("name", "default")
+        self.path = kwargs.pop(
+            "path", os.path.join(tempfile.gettempdir(), f"{name}.sqlite")
+        )
+        self.ttl = kwargs.pop("ttl", None)
+        self.codec = get_codec(kwargs.pop("codec", "pickle"))
+        self.local = threading.local()
+
+        # auto_vacuum must be set before the switch to WAL and the first table, or be
+        # followed by a VACUUM for databases created without it
+        with closing(sqlite3.connect(self.path, isolation_level=None, timeout=30)) as connection:
+            if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                connection.execute("VACUUM")
+        connection = self.connect()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL"
+            ") WITHOUT ROWID"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS kv_expires ON kv (expires) "
+            "WHERE expires IS NOT NULL"
+        )
+
+        interval = kwargs.pop("compact_interval", 300)
+        if interval:
+            self.stopped = threading.Event()
+            threading.Thread(
+                target=self.__compact_periodically,
+                args=(interval,),
+                name=f"sqlite-compact-{name}",
+                daemon=True,
+            ).start()
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Connect to the database from the current thread.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection of the current thread, created on first use.
+
+        Notes
+        -----
+        Each thread keeps its own connection in autocommit mode, and each connection keeps
+        its own cache of prepared statements, so the fixed statements of this provider are
+        only compiled once per thread.
+        """
+
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, isolation_level=None, cached_statements=64, timeout=30
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA mmap_size = 268435456")
+            self.local.connection = connection
+        return connection
+
+    def __getitem__(self, handle: str) -> Any:
+        """
+        Retrieve an item from the storage using a handle.
+
+        Parameters
+        ----------
+        handle : str
+            The handle associated with the item.
+
+        Returns
+        -------
+        Any
+            The retrieved item.
+        """
+
+        return self.load(key=handle)
+
+    def save(
+        self,
+        key: str,
+        value: Any,
+        encoder: Callable = None,
+        ttl: float = None,
+        **kwargs,
+    ) -> None:
+        """
+        Save a key-value pair in the storage.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value to bytes, by default None.
+            Without an encoder, the codec of the binding encodes the value.
+        ttl : float, optional
+            The number of seconds before the entry expires, by default the `ttl` of the binding.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('warm_cache')
+        >>> provider.save("my_key", {"a": 1}, ttl=60)
+        """
+
+        self.connect().execute(
+            "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+            self.__row(key, value, encoder, ttl, **kwargs),
+        )
+
+    def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Load a value from the storage using a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+            Without a decoder, the codec of the binding decodes the value.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The loaded value.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist or has expired.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('warm_cache')
+        >>> value = provider.load("my_key")
+        """
+
+        row = (
+            self.connect()
+            .execute(
+                "SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            raise KeyError(key)
+        return self.__decode(row[0], decoder, **kwargs)
+
+    def drop(self, key: str, **kwargs) -> None:
+        """
+        Delete a key-value pair from the storage.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist.
+        """
+
+        if not self.connect().execute("DELETE FROM kv WHERE key = ?", (key,)).rowcount:
+            raise KeyError(key)
+
+    def save_many(
+        self,
+        items: Mapping[str, Any],
+        encoder: Callable = None,
+        ttl: float = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in a single transaction.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        ttl : float, optional
+            The number of seconds before the entries expire, by default the `ttl` of the binding.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while encoding it.
+            If the transaction fails, its exception is reported for every key.
+        """
+
+        results, rows = {}, []
+        for key in items.keys():
+            try:
+                rows.append(self.__row(key, items[key], encoder, ttl, **kwargs))
+                results[key] = None
+            except Exception as e:
+                results[key] = e
+        try:
+            with self.__transaction() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                    rows,
+                )
+        except Exception as e:
+            return {key: e for key in results.keys()}
+        return results
+
+    def load_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Load several values with one query per PARAMETER_LIMIT keys.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while
+            loading it (KeyError if it does not exist or has expired).
+        """
+
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        found = {}
+        for i in range(0, len(keys), self.PARAMETER_LIMIT):
+            chunk = keys[i : i + self.PARAMETER_LIMIT]
+            found.update(
+                self.connect().execute(
+                    f"SELECT key, value FROM kv WHERE key IN ({', '.join('?' * len(chunk))}) "
+                    "AND (expires IS NULL OR expires > ?)",
+                    (*chunk, now),
+                )
+            )
+        results = {}
+        for key in keys:
+            try:
+                if key not in found:
+                    raise KeyError(key)
+                results[key] = self.__decode(found[key], decoder, **kwargs)
+            except Exception as e:
+                results[key] = e
+        return results
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs in a single transaction.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to KeyError if it did not exist.
+            If the transaction fails, its exception is reported for every key.
+        """
+
+        keys = list(dict.fromkeys(keys))
+        try:
+            with self.__transaction() as connection:
+                existing = set()
+                for i in range(0, len(keys), self.PARAMETER_LIMIT):
+                    chunk = keys[i : i + self.PARAMETER_LIMIT]
+                    placeholders = ", ".join("?" * len(chunk))
+                    existing.update(
+                        key
+                        for key, in connection.execute(
+                            f"SELECT key FROM kv WHERE key IN ({placeholders})", chunk
+                        )
+                    )
+                    connection.execute(
+                        f"DELETE FROM kv WHERE key IN ({placeholders})", chunk
+                    )
+        except Exception as e:
+            return {key: e for key in keys}
+        return {key: None if key in existing else KeyError(key) for key in keys}
+
+    def purge(self) -> int:
+        """
+        Delete the expired entries.
+
+        Returns
+        -------
+        int
+            The number of deleted entries.
+        """
+
+        return (
+            self.connect()
+            .execute(
+                "DELETE FROM kv WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time(),),
+            )
+            .rowcount
+        )
+
+    def compact(self) -> int:
+        """
+        Delete the expired entries, return free pages to the disk and truncate the WAL.
+
+        Returns
+        -------
+        int
+            The number of deleted entries.
+
+        Notes
+        -----
+        Expired entries are invisible to reads but keep their disk space until this runs.
+        It runs periodically in a background thread unless `compact_interval` is disabled.
+        """
+
+        purged = self.purge()
+        connection = self.connect()
+        # The pragma frees one page per step, and execute() only steps it once
+        connection.executescript("PRAGMA incremental_vacuum")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return purged
+
+    def close(self) -> None:
+        """
+        Stop the background compaction and close the connection of the current thread.
+        """
+
+        if hasattr(self, "stopped"):
+            self.stopped.set()
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    def __row(
+        self, key: str, value: Any, encoder: Callable = None, ttl: float = None, **kwargs
+    ) -> tuple:
+        """
+        Convert a key-value pair into a row.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        ttl : float, optional
+            The number of seconds before the entry expires, by default the `ttl` of the binding.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        tuple
+            The key, the encoded value and the expiry timestamp (None if it never expires).
+        """
+
+        if encoder:
+            value = encoder(value, **kwargs)
+        elif self.codec is not None:
+            value = self.codec.encode(value)
+        ttl = self.ttl if ttl is None else ttl
+        return key, value, (time.time() + ttl) if ttl else None
+
+    def __decode(self, data: bytes, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Decode a stored value.
+
+        Parameters
+        ----------
+        data : bytes
+            The stored value.
+        decoder : Callable, optional
+            The decoder function, by default None.
+        **kwargs : dict
+            Additional keyword arguments, passed to the decoder.
+
+        Returns
+        -------
+        Any
+            The decoded value.
+        """
+
+        if decoder:
+            return decoder(data, **kwargs)
+        if self.codec is not None:
+            return self.codec.decode(data)
+        return data
+
+    @contextmanager
+    def __transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold a write transaction on the connection of the current thread.
+
+        Returns
+        -------
+        Iterator[sqlite3.Connection]
+            The connection. The transaction is committed on success and rolled back on error.
+        """
+
+        connection = self.connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def __compact_periodically(self, interval: float) -> None:
+        """
+        Compact the store every `interval` seconds until the provider is closed.
+
+        Parameters
+        ----------
+        interval : float
+            The number of seconds between compactions.
+        """
+
+        while not self.stopped.wait(interval):
+            try:
+                self.compact()
+            except sqlite3.Error:
+                # Another process may hold the database, the next run will catch up
+                pass
+        self.close()
+
@@ -1,10 +1,24 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from io import BytesIO
+from itertools import chain
+from libs.data.key_value import amap_keys, map_keys
+from libs.data.key_value.codecs import get_codec
 from libs.utils.decorators import staticproperty
-from shutil import copyfileobj
+from pathlib import PurePosixPath
 from smart_open import open
-from typing import Any, Callable, List
+from smart_open.compression import compression_wrapper, get_supported_extensions
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+import asyncio
+import os
 import smart_open.transport
 
 _RENAME = {"azure": "azure_blob"}
+# smart_open registers its transports on import, so the scheme list is mapped once.
+_SUPPORTED_SCHEMES = [
+    _RENAME.get(scheme, scheme)
+    for scheme in smart_open.transport.SUPPORTED_SCHEMES
+    if len(scheme)
+]
 
 
 class StreamKeyValueProvider:
@@ -26,12 +40,7 @@ class StreamKeyValueProvider:
             A list of supported schemes.
         """
 
-        return list(
-            map(
-                lambda x: _RENAME[x] if x in _RENAME else x,
-                filter(len, smart_open.transport.SUPPORTED_SCHEMES),
-            )
-        )
+        return _SUPPORTED_SCHEMES
 
     def __init__(self, *args, **kwargs) -> None:
         """
@@ -42,7 +51,19 @@ class StreamKeyValueProvider:
         *args : tuple
             Additional positional arguments.
         **kwargs : dict
-            Additional keyword arguments.
+            Additional keyword arguments, passed to `smart_open.open`.
+            Supported optional kwargs include:
+            - aio_client : azure.storage.blob.aio.BlobServiceClient
+                The service client used by the asynchronous methods of the azure_blob scheme.
+                Every blob client created from it shares its aiohttp transport.
+            - block_size : int
+                The size in bytes of each block uploaded by `save()`, by default 8 MiB.
+                For the s3 scheme it must be at least 5 MiB.
+            - max_concurrency : int
+                The number of blocks `save()` uploads at once, by default 4.
+            - codec : str or libs.data.key_value.codecs.Codec
+                The codec applied to values saved without an encoder and loaded without a decoder,
+                such as "orjson", "msgpack", "pickle" or "msgpack+zstd".
         """
 
         if len(args):
@@ -52,6 +73,10 @@ class StreamKeyValueProvider:
         for key, value in _RENAME.items():
             if self.scheme == value:
                 self.scheme = key
+        self.aio_client = kwargs.pop("aio_client", None)
+        self.block_size: int = kwargs.pop("block_size", 8 * 1024**2)
+        self.max_concurrency: int = kwargs.pop("max_concurrency", 4)
+        self.codec = get_codec(kwargs.pop("codec", None))
         self.config = {**kwargs}
     
     def __getitem__(self, handle):
@@ -86,11 +111,113 @@ class StreamKeyValueProvider:
         This method connects to a specified key using the stream-based storage mechanism.
         It returns a connection object that can be used for reading from or writing to the key.
         The connection object can be used with standard file-like operations such as write, read, and close.
+        The `transport_params` of the call are merged over those of the binding.
+        """
+
+        transport_params = {
+            **self.config.get("transport_params", {}),
+            **kwargs.pop("transport_params", {}),
+        }
+        return open(
+            self.scheme + "://" + key,
+            **{**kwargs, **self.config, "transport_params": transport_params},
+        )
+
+    def open_seekable(self, key: str, buffer_size: int = None) -> Any:
+        """
+        Open a key as a seekable binary file object that fetches byte ranges lazily.
+
+        Parameters
+        ----------
+        key : str
+            The key to open.
+        buffer_size : int, optional
+            The number of bytes fetched per request, by default None (the transport default).
+
+        Returns
+        -------
+        Any
+            A seekable binary file object.
+
+        Example
+        -------
+        >>> import pyarrow.parquet as pq
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> with provider.open_seekable("my_container/data.parquet") as f:
+        >>>     table = pq.read_table(f, columns=["id"])
+
+        Notes
+        -----
+        Transparent decompression is disabled, so the object can always seek. For schemes with
+        ranged reads, such as azure_blob, s3 and http, only the bytes that are read are fetched.
+        """
+
+        return self.connect(
+            key,
+            mode="rb",
+            compression="disable",
+            transport_params={"buffer_size": buffer_size} if buffer_size else {},
+        )
+
+    def aconnect(self, key: str) -> Any:
+        """
+        Connect to a key with an asynchronous client.
+
+        Parameters
+        ----------
+        key : str
+            The key to connect to, starting with the container name.
+
+        Returns
+        -------
+        Any
+            An asynchronous client for the specified key.
+
+        Raises
+        ------
+        NotImplementedError
+            If the scheme has no native asynchronous client.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> blob = provider.aconnect("my_container/my_key.txt")
+        >>> await blob.upload_blob(b"Hello, world!", overwrite=True)
         """
 
-        return open(self.scheme + "://" + key, **{**kwargs, **self.config})
+        match self.scheme:
+            case "azure":
+                container, blob = key.split("/", 1)
+                return self.aio_client.get_blob_client(container, blob)
+        raise NotImplementedError(
+            f"The '{self.scheme}' scheme has no native asynchronous client."
+        )
 
-    def save(self, key: str, value: Any, encoder: Callable = None, **kwargs) -> None:
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether the asynchronous methods use a native asynchronous client.
+
+        Returns
+        -------
+        bool
+            True if an asynchronous client is configured for the scheme, False if the
+            asynchronous methods run the synchronous ones in a worker thread.
+        """
+
+        return self.scheme == "azure" and self.aio_client is not None
+
+    def save(
+        self,
+        key: str,
+        value: Any,
+        encoder: Callable = None,
+        block_size: int = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> None:
         """
         Save a key-value pair.
 
@@ -102,6 +229,10 @@ class StreamKeyValueProvider:
             The value to be saved.
         encoder : Callable, optional
             The encoder function to use for encoding the value, by default None.
+        block_size : int, optional
+            The size in bytes of each uploaded block, by default the `block_size` of the binding.
+        max_concurrency : int, optional
+            The number of blocks uploaded at once, by default the `max_concurrency` of the binding.
         **kwargs : dict
             Additional keyword arguments.
 
@@ -119,27 +250,310 @@ class StreamKeyValueProvider:
         Notes
         -----
         This method saves a key-value pair using the stream-based storage mechanism.
-        If an encoder function is provided, the value is encoded before saving.
-        The method uses the specified key to connect to the storage provider and writes the encoded or
-        original value to the connected key.
+        If an encoder function is provided, the value is encoded before saving, otherwise
+        the codec of the binding, if any, encodes it.
+        Strings, bytes and file-like objects are read in blocks of `block_size` bytes.
+        For the azure_blob and s3 schemes the blocks are staged concurrently and committed
+        once all of them are uploaded, so a failed upload never replaces the existing value.
+        Values that fit in one block, and keys compressed by extension, are written in a
+        single request. Other schemes stream the blocks through `smart_open`, and the
+        stream is closed before the method returns.
         """
 
         if encoder is not None:
             value = encoder(value, **kwargs)
-            return self.save(key, value)
-        elif callable(getattr(value, "read", None)):
-            copyfileobj(value, self.connect(key))
-        else:
-            if isinstance(value, bytes):
-                self.connect(key, mode="wb").write(value)
-            elif isinstance(value, str):
-                self.connect(key, mode="w").write(value)
-            else:
-                raise TypeError(
-                    "StreamStorageProvider can only save strings and bytes. Use the encoder argument and any keyword arguments to transform the value into a bytes type object."
-                )
+        elif self.codec is not None:
+            value = self.codec.encode(value)
+        if not (
+            isinstance(value, (bytes, bytearray, memoryview, str))
+            or callable(getattr(value, "read", None))
+        ):
+            raise TypeError(
+                "StreamStorageProvider can only save strings and bytes. Use the encoder argument and any keyword arguments to transform the value into a bytes type object."
+            )
+        block_size = block_size or self.block_size
+        max_concurrency = max_concurrency or self.max_concurrency
+        blocks = self.__blocks(value, block_size)
+
+        if self.scheme in ("azure", "s3") and not self.__compressed(key):
+            first = next(blocks, b"")
+            second = next(blocks, None)
+            if second is not None:
+                blocks = chain((first, second), blocks)
+                match self.scheme:
+                    case "azure":
+                        return self.__upload_azure(key, blocks, max_concurrency)
+                    case "s3":
+                        return self.__upload_s3(key, blocks, max_concurrency)
+            blocks = iter((first,))
+        with self.connect(key, mode="wb") as stream:
+            # Bindings with an encoding open a text wrapper, the blocks are already encoded
+            raw = getattr(stream, "buffer", stream)
+            for block in blocks:
+                raw.write(block)
+
+    def __decode(self, key: str, data: bytes, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Decode downloaded bytes with a decoder, the codec of the binding, or as text.
+
+        Parameters
+        ----------
+        key : str
+            The key the bytes were downloaded from.
+        data : bytes
+            The downloaded bytes.
+        decoder : Callable, optional
+            The decoder function, called with a binary file object, by default None.
+        **kwargs : dict
+            Additional keyword arguments, passed to the decoder.
+
+        Returns
+        -------
+        Any
+            The decoded value.
+
+        Notes
+        -----
+        The bytes are decompressed and decoded as `load()` reads them through `smart_open`:
+        keys compressed by extension or by the `compression` of the binding are decompressed,
+        and text is decoded with the `encoding` of the binding.
+        """
+
+        if self.__compressed(key):
+            data = compression_wrapper(
+                BytesIO(data),
+                "rb",
+                self.config.get("compression", "infer_from_extension"),
+                filename=key,
+            ).read()
+        if decoder:
+            return decoder(BytesIO(data), **kwargs)
+        if self.codec is not None:
+            return self.codec.decode(data)
+        return data.decode(self.config.get("encoding") or "utf-8")
+
+    def __blocks(self, value: Any, block_size: int) -> Iterator[bytes]:
+        """
+        Split a value into blocks of bytes.
+
+        Parameters
+        ----------
+        value : Any
+            A string, a bytes-like object or a file-like object.
+        block_size : int
+            The size in bytes of each block.
+
+        Returns
+        -------
+        Iterator[bytes]
+            The blocks of the value. Only the last block may be shorter than `block_size`.
+        """
+
+        encoding = self.config.get("encoding") or "utf-8"
+        if isinstance(value, str):
+            value = value.encode(encoding)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            view = memoryview(value)
+            for offset in range(0, len(view), block_size):
+                yield view[offset : offset + block_size]
+            return
+        pending = b""
+        while True:
+            chunk = value.read(block_size)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode(encoding)
+            pending += chunk
+            while len(pending) >= block_size:
+                yield pending[:block_size]
+                pending = pending[block_size:]
+        if pending:
+            yield pending
+
+    def __compressed(self, key: str) -> bool:
+        """
+        Check whether `smart_open` would compress the value of a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+
+        Returns
+        -------
+        bool
+            True if the value is compressed on write, False otherwise.
+        """
+
+        compression = self.config.get("compression", "infer_from_extension")
+        if compression == "infer_from_extension":
+            return PurePosixPath(key).suffix.lower() in get_supported_extensions()
+        return compression != "disable"
+
+    def __stage(
+        self, blocks: Iterable[bytes], stage: Callable, max_concurrency: int
+    ) -> List[Any]:
+        """
+        Upload blocks concurrently, keeping at most `max_concurrency` of them in flight.
+
+        Parameters
+        ----------
+        blocks : Iterable[bytes]
+            The blocks to upload.
+        stage : Callable
+            The function uploading one block, called with the block index and the block.
+        max_concurrency : int
+            The number of blocks uploaded at once.
+
+        Returns
+        -------
+        List[Any]
+            The results of `stage`, in block order.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by `stage`. Blocks not yet submitted are not uploaded.
+        """
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = {}
+            try:
+                for index, block in enumerate(blocks):
+                    if len(pending) >= max_concurrency:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            results[pending.pop(future)] = future.result()
+                    pending[executor.submit(stage, index, block)] = index
+                for future in as_completed(pending):
+                    results[pending[future]] = future.result()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return [results[index] for index in range(len(results))]
+
+    def __blob_client(self, key: str) -> Any:
+        """
+        Get the blob client of a key for the azure_blob scheme.
+
+        Parameters
+        ----------
+        key : str
+            The key, starting with the container name.
+
+        Returns
+        -------
+        azure.storage.blob.BlobClient
+            The blob client, created from the `client` transport parameter of the binding.
+        """
+
+        container, blob = key.split("/", 1)
+        return self.config["transport_params"]["client"].get_blob_client(
+            container, blob
+        )
+
+    def __s3_client(self) -> Any:
+        """
+        Get the service client for the s3 scheme.
+
+        Returns
+        -------
+        Any
+            The `client` transport parameter of the binding, or a default boto3 client
+            created once per provider.
+        """
+
+        if "client" not in self.config.get("transport_params", {}):
+            import boto3
+
+            self.config["transport_params"] = {
+                **self.config.get("transport_params", {}),
+                "client": boto3.client("s3"),
+            }
+        return self.config["transport_params"]["client"]
+
+    def __upload_azure(
+        self, key: str, blocks: Iterable[bytes], max_concurrency: int
+    ) -> None:
+        """
+        Upload the blocks of a blob concurrently and commit them as its new content.
+
+        Parameters
+        ----------
+        key : str
+            The key, starting with the container name.
+        blocks : Iterable[bytes]
+            The blocks of the value.
+        max_concurrency : int
+            The number of blocks uploaded at once.
+
+        Notes
+        -----
+        Staged blocks that are never committed are discarded by the service after a week.
+        """
+
+        client = self.__blob_client(key)
+
+        def stage(index: int, block: bytes) -> str:
+            # Block ids of a blob must all have the same length
+            block_id = f"{index:08d}"
+            client.stage_block(block_id, bytes(block), length=len(block))
+            return block_id
+
+        client.commit_block_list(self.__stage(blocks, stage, max_concurrency))
+
+    def __upload_s3(
+        self, key: str, blocks: Iterable[bytes], max_concurrency: int
+    ) -> None:
+        """
+        Upload the parts of an object concurrently and complete the multipart upload.
+
+        Parameters
+        ----------
+        key : str
+            The key, starting with the bucket name.
+        blocks : Iterable[bytes]
+            The blocks of the value. Every block but the last must be at least 5 MiB.
+        max_concurrency : int
+            The number of parts uploaded at once.
 
-    def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        Notes
+        -----
+        The multipart upload is aborted if any part fails, so no parts are left behind.
+        """
+
+        client = self.__s3_client()
+        bucket, name = key.split("/", 1)
+        upload_id = client.create_multipart_upload(Bucket=bucket, Key=name)["UploadId"]
+
+        def stage(index: int, block: bytes) -> Dict[str, Any]:
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=name,
+                UploadId=upload_id,
+                PartNumber=index + 1,
+                Body=bytes(block),
+            )
+            return {"ETag": response["ETag"], "PartNumber": index + 1}
+
+        try:
+            parts = self.__stage(blocks, stage, max_concurrency)
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            client.abort_multipart_upload(Bucket=bucket, Key=name, UploadId=upload_id)
+            raise
+
+    def load(
+        self, key: str, decoder: Callable = None, seekable: bool = False, **kwargs
+    ) -> Any:
         """
         Load a value from a key.
 
@@ -149,6 +563,10 @@ class StreamKeyValueProvider:
             The key associated with the value.
         decoder : Callable, optional
             The decoder function to use for decoding the value, by default None.
+        seekable : bool, optional
+            Whether the decoder receives the file object from `open_seekable()`, by default False.
+            Decoders such as `pyarrow.parquet.read_table` or `pandas.read_parquet` then only
+            fetch the byte ranges they need.
         **kwargs : dict
             Additional keyword arguments.
 
@@ -167,14 +585,245 @@ class StreamKeyValueProvider:
         Notes
         -----
         This method loads a value from the specified key using the stream-based storage mechanism.
-        If a decoder function is provided, the loaded value is decoded before returning.
+        If a decoder function is provided, it reads the value from a file object that is closed
+        once it returns or raises, otherwise the codec of the binding, if any, decodes it.
         The method uses the specified key to connect to the storage provider and reads the value
         from the connected key. The decoded or raw value is returned.
         """
 
         if decoder:
-            return decoder(self.connect(key, mode="rb"), **kwargs)
-        return self.connect(key, mode="r").read()
+            stream = self.open_seekable(key) if seekable else self.connect(key, mode="rb")
+            with stream:
+                return decoder(stream, **kwargs)
+        if self.codec is not None:
+            with self.connect(key, mode="rb") as f:
+                return self.codec.decode(f.read())
+        with self.connect(key, mode="r") as f:
+            return f.read()
+
+    def load_range(self, key: str, offset: int, length: int = None) -> bytes:
+        """
+        Load a byte range from a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        offset : int
+            The position of the first byte to read.
+        length : int, optional
+            The number of bytes to read, by default None (up to the end).
+
+        Returns
+        -------
+        bytes
+            The bytes in the range. Fewer bytes are returned if the range passes the end.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> header = provider.load_range("my_container/data.csv", 0, 1024)
+        """
+
+        with self.open_seekable(key, buffer_size=length) as f:
+            f.seek(offset)
+            return f.read(-1 if length is None else length)
+
+    def iter_chunks(self, key: str, chunk_size: int = 4 * 1024**2) -> Iterator[bytes]:
+        """
+        Iterate over the bytes of a key in chunks, without loading the whole value.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        chunk_size : int, optional
+            The maximum number of bytes per chunk, by default 4 MiB.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the value.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> for chunk in provider.iter_chunks("my_container/large.csv"):
+        >>>     process(chunk)
+
+        Notes
+        -----
+        The file object is closed when the iteration finishes or the generator is closed.
+        """
+
+        with self.open_seekable(key, buffer_size=chunk_size) as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def load_if_modified(
+        self, key: str, etag: str = None, decoder: Callable = None, **kwargs
+    ) -> Tuple[bool, str, Any]:
+        """
+        Load a value from a key only if it changed since a known ETag.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        etag : str, optional
+            The ETag of the copy already held by the caller, by default None.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Tuple[bool, str, Any]
+            Whether the value was modified, its current ETag, and the loaded value
+            (None when it was not modified).
+
+        Notes
+        -----
+        For the azure_blob scheme the download is sent with an If-None-Match header, so an
+        unchanged blob costs a 304 response without a body. Other schemes have no ETag and
+        are always loaded in full.
+        """
+
+        match self.scheme:
+            case "azure":
+                from azure.core import MatchConditions
+                from azure.core.exceptions import ResourceNotModifiedError
+
+                client = self.__blob_client(key)
+                try:
+                    downloader = (
+                        client.download_blob(
+                            etag=etag, match_condition=MatchConditions.IfModified
+                        )
+                        if etag
+                        else client.download_blob()
+                    )
+                except ResourceNotModifiedError:
+                    return False, etag, None
+                data = downloader.readall()
+                return (
+                    True,
+                    downloader.properties.etag,
+                    self.__decode(key, data, decoder, **kwargs),
+                )
+        return True, None, self.load(key, decoder, **kwargs)
+
+    def keys(self, prefix: str = "", page_size: int = None) -> Iterator[str]:
+        """
+        Iterate over the keys starting with a prefix.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix of the keys, starting with the container or bucket name, by default "".
+        page_size : int, optional
+            The number of keys fetched per listing request, by default the service default.
+
+        Returns
+        -------
+        Iterator[str]
+            The matching keys. Listing pages are fetched as the iterator is consumed.
+
+        Raises
+        ------
+        NotImplementedError
+            If the scheme cannot list keys.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> for key in provider.keys("my_container/2024/"):
+        >>>     print(key)
+
+        Notes
+        -----
+        The azure_blob, s3 and file schemes are supported. For the file scheme the prefix is
+        a path prefix, and the keys are the paths of the matching files.
+        """
+
+        match self.scheme:
+            case "azure":
+                container, name = (prefix.split("/", 1) + [""])[:2]
+                client = self.config["transport_params"]["client"].get_container_client(
+                    container
+                )
+                pages = client.list_blobs(
+                    name_starts_with=name or None, results_per_page=page_size
+                ).by_page()
+                for page in pages:
+                    for blob in page:
+                        yield f"{container}/{blob.name}"
+            case "s3":
+                bucket, name = (prefix.split("/", 1) + [""])[:2]
+                pages = self.__s3_client().get_paginator("list_objects_v2").paginate(
+                    Bucket=bucket,
+                    Prefix=name,
+                    PaginationConfig={"PageSize": page_size} if page_size else {},
+                )
+                for page in pages:
+                    for item in page.get("Contents", []):
+                        yield f"{bucket}/{item['Key']}"
+            case "file":
+                root = prefix if prefix.endswith(os.sep) else os.path.dirname(prefix)
+                for path, dirs, files in os.walk(root or "."):
+                    dirs.sort()
+                    for file in sorted(files):
+                        key = os.path.join(path, file)
+                        if not root:
+                            # Paths under the current directory are listed without "./"
+                            key = os.path.relpath(key)
+                        if key.startswith(prefix):
+                            yield key
+            case _:
+                raise NotImplementedError(
+                    f"The '{self.scheme}' scheme cannot list keys."
+                )
+
+    def scan(
+        self,
+        prefix: str = "",
+        decoder: Callable = None,
+        page_size: int = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the key-value pairs whose keys start with a prefix.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix of the keys, starting with the container or bucket name, by default "".
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        page_size : int, optional
+            The number of keys fetched per listing request, by default the service default.
+        **kwargs : dict
+            Additional keyword arguments, passed to `load()`.
+
+        Returns
+        -------
+        Iterator[Tuple[str, Any]]
+            The matching keys and their values. Each value is loaded when it is reached.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> for key, value in provider.scan("my_container/2024/", decoder=json.load):
+        >>>     print(key, value)
+        """
+
+        for key in self.keys(prefix, page_size=page_size):
+            yield key, self.load(key, decoder, **kwargs)
 
     def drop(self, key: str, **kwargs) -> None:
         """
@@ -185,7 +834,12 @@ class StreamKeyValueProvider:
         key : str
             The key associated with the value to be deleted.
         **kwargs : dict
-            Additional keyword arguments.
+            Additional keyword arguments, passed to the delete call of the service client.
+
+        Raises
+        ------
+        NotImplementedError
+            If the scheme cannot delete keys.
 
         Example
         -------
@@ -195,8 +849,465 @@ class StreamKeyValueProvider:
 
         Notes
         -----
-        This method deletes a key-value pair from the stream-based storage using the specified key.
-        Any additional keyword arguments are ignored in this implementation.
+        The azure_blob, s3 and file schemes are supported. Deleting a missing key raises
+        the error of the service, except for s3, where deletes are idempotent.
+        """
+
+        match self.scheme:
+            case "azure":
+                self.__blob_client(key).delete_blob(**kwargs)
+            case "s3":
+                bucket, name = key.split("/", 1)
+                self.__s3_client().delete_object(Bucket=bucket, Key=name, **kwargs)
+            case "file":
+                os.remove(key)
+            case _:
+                raise NotImplementedError(
+                    f"The '{self.scheme}' scheme cannot delete keys."
+                )
+
+    def drop_prefix(
+        self, prefix: str, page_size: int = None, max_workers: int = None
+    ) -> Dict[str, Any]:
+        """
+        Delete every key-value pair whose key starts with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the keys, starting with the container or bucket name.
+        page_size : int, optional
+            The number of keys fetched per listing request, by default the service default.
+        max_workers : int, optional
+            The number of concurrent delete requests, by default None (the ThreadPoolExecutor default).
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each deleted key to None, or to the exception raised while deleting it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('blob_handle')
+        >>> results = provider.drop_prefix("my_container/tmp/")
+        """
+
+        return self.drop_many(
+            self.keys(prefix, page_size=page_size), max_workers=max_workers
+        )
+
+    def save_many(
+        self,
+        items: Mapping[str, Any],
+        encoder: Callable = None,
+        max_workers: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs concurrently.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        max_workers : int, optional
+            The number of concurrent transfers, by default None (the ThreadPoolExecutor default).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while saving it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('s3_handle')
+        >>> results = provider.save_many({"my_bucket/a.txt": "A", "my_bucket/b.txt": "B"})
+        """
+
+        return map_keys(
+            lambda key: self.save(key, items[key], encoder=encoder, **kwargs),
+            items.keys(),
+            max_workers=max_workers,
+        )
+
+    def load_many(
+        self,
+        keys: Iterable[str],
+        decoder: Callable = None,
+        max_workers: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Load several values concurrently.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        max_workers : int, optional
+            The number of concurrent transfers, by default None (the ThreadPoolExecutor default).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('s3_handle')
+        >>> values = provider.load_many(["my_bucket/a.txt", "my_bucket/b.txt"])
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=max_workers,
+        )
+
+    def drop_many(
+        self, keys: Iterable[str], max_workers: int = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs concurrently.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        max_workers : int, optional
+            The number of concurrent requests, by default None (the ThreadPoolExecutor default).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while deleting it.
+
+        Notes
+        -----
+        For the azure_blob scheme the keys are deleted with batch requests of up to 256 blobs,
+        and for the s3 scheme with batch requests of up to 1000 objects. The batch requests
+        are sent concurrently. Other schemes delete the keys one by one.
         """
 
-        pass
+        match self.scheme:
+            case "azure":
+                batches = self.__batches(keys, 256)
+                delete = self.__delete_blobs
+            case "s3":
+                batches = self.__batches(keys, 1000)
+                delete = self.__delete_objects
+            case _:
+                return map_keys(
+                    lambda key: self.drop(key, **kwargs), keys, max_workers=max_workers
+                )
+        results = {}
+        for index, result in map_keys(
+            lambda index: delete(*batches[index], **kwargs),
+            range(len(batches)),
+            max_workers=max_workers,
+        ).items():
+            container, names = batches[index]
+            if isinstance(result, Exception):
+                result = [result] * len(names)
+            results.update(
+                {f"{container}/{name}": r for name, r in zip(names, result)}
+            )
+        return results
+
+    def __batches(self, keys: Iterable[str], size: int) -> List[Tuple[str, List[str]]]:
+        """
+        Group keys by container and split each group into batches.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys, each starting with its container or bucket name.
+        size : int
+            The maximum number of keys in a batch.
+
+        Returns
+        -------
+        List[Tuple[str, List[str]]]
+            The container of each batch, and the names of its keys within the container.
+        """
+
+        containers = {}
+        for key in dict.fromkeys(keys):
+            container, name = key.split("/", 1)
+            containers.setdefault(container, []).append(name)
+        return [
+            (container, names[offset : offset + size])
+            for container, names in containers.items()
+            for offset in range(0, len(names), size)
+        ]
+
+    def __delete_blobs(
+        self, container: str, names: List[str], **kwargs
+    ) -> List[Exception]:
+        """
+        Delete a batch of blobs from a container in a single request.
+
+        Parameters
+        ----------
+        container : str
+            The container name.
+        names : List[str]
+            The names of the blobs, at most 256.
+        **kwargs : dict
+            Additional keyword arguments, passed to `ContainerClient.delete_blobs`.
+
+        Returns
+        -------
+        List[Exception]
+            None for each deleted blob, or the error returned for it.
+        """
+
+        from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+
+        client = self.config["transport_params"]["client"].get_container_client(
+            container
+        )
+        responses = client.delete_blobs(*names, raise_on_any_failure=False, **kwargs)
+        return [
+            None
+            if response.status_code < 300
+            else (
+                ResourceNotFoundError
+                if response.status_code == 404
+                else HttpResponseError
+            )(response=response)
+            for response in responses
+        ]
+
+    def __delete_objects(
+        self, bucket: str, names: List[str], **kwargs
+    ) -> List[Exception]:
+        """
+        Delete a batch of objects from a bucket in a single request.
+
+        Parameters
+        ----------
+        bucket : str
+            The bucket name.
+        names : List[str]
+            The names of the objects, at most 1000.
+        **kwargs : dict
+            Additional keyword arguments, passed to `delete_objects`.
+
+        Returns
+        -------
+        List[Exception]
+            None for each deleted object, or the error returned for it.
+        """
+
+        response = self.__s3_client().delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": name} for name in names], "Quiet": True},
+            **kwargs,
+        )
+        errors = {
+            error["Key"]: OSError(f"{error.get('Code')}: {error.get('Message')}")
+            for error in response.get("Errors", [])
+        }
+        return [errors.get(name) for name in names]
+
+    async def asave(
+        self, key: str, value: Any, encoder: Callable = None, **kwargs
+    ) -> None:
+        """
+        Save a key-value pair without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a supported type.
+
+        Notes
+        -----
+        Schemes without a native asynchronous client, and keys compressed by `smart_open`,
+        run `save()` in a worker thread. Strings are encoded with the `encoding` of the binding.
+        """
+
+        if not self.is_async or self.__compressed(key):
+            return await asyncio.to_thread(self.save, key, value, encoder, **kwargs)
+        if encoder is not None:
+            value = encoder(value, **kwargs)
+        elif self.codec is not None:
+            value = self.codec.encode(value)
+        if not (
+            isinstance(value, (bytes, bytearray, memoryview, str))
+            or callable(getattr(value, "read", None))
+        ):
+            raise TypeError(
+                "StreamStorageProvider can only save strings and bytes. Use the encoder argument and any keyword arguments to transform the value into a bytes type object."
+            )
+        if isinstance(value, str):
+            value = value.encode(self.config.get("encoding") or "utf-8")
+        elif isinstance(value, (bytearray, memoryview)):
+            value = bytes(value)
+        await self.aconnect(key).upload_blob(value, overwrite=True)
+
+    async def aload(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Load a value from a key without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+            It receives a binary file object, as with `load()`.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The loaded value.
+
+        Notes
+        -----
+        Schemes without a native asynchronous client, and keys compressed by `smart_open`,
+        run `load()` in a worker thread. Text is decoded with the `encoding` of the binding.
+        """
+
+        if not self.is_async or self.__compressed(key):
+            return await asyncio.to_thread(self.load, key, decoder, **kwargs)
+        downloader = await self.aconnect(key).download_blob()
+        return self.__decode(key, await downloader.readall(), decoder, **kwargs)
+
+    async def adrop(self, key: str, **kwargs) -> None:
+        """
+        Delete a key-value pair without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Notes
+        -----
+        Schemes without a native asynchronous client run `drop()` in a worker thread.
+        """
+
+        if not self.is_async:
+            return await asyncio.to_thread(self.drop, key, **kwargs)
+        await self.aconnect(key).delete_blob(**kwargs)
+
+    async def asave_many(
+        self,
+        items: Mapping[str, Any],
+        encoder: Callable = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs concurrently without blocking the event loop.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        max_concurrency : int, optional
+            The maximum number of transfers in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while saving it.
+        """
+
+        return await amap_keys(
+            lambda key: self.asave(key, items[key], encoder=encoder, **kwargs),
+            items.keys(),
+            max_concurrency,
+        )
+
+    async def aload_many(
+        self,
+        keys: Iterable[str],
+        decoder: Callable = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Load several values concurrently without blocking the event loop.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        max_concurrency : int, optional
+            The maximum number of transfers in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+        """
+
+        return await amap_keys(
+            lambda key: self.aload(key, decoder=decoder, **kwargs),
+            keys,
+            max_concurrency,
+        )
+
+    async def adrop_many(
+        self, keys: Iterable[str], max_concurrency: int = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs concurrently without blocking the event loop.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        max_concurrency : int, optional
+            The maximum number of requests in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while deleting it.
+        """
+
+        return await amap_keys(
+            lambda key: self.adrop(key, **kwargs), keys, max_concurrency
+        )
@@ -1,5 +1,11 @@
+from libs.data.key_value import amap_keys, map_keys
+from libs.data.key_value.codecs import get_codec
+from itertools import chain
 from libs.utils.decorators import staticproperty
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+import asyncio
+import threading
+import uuid
 
 
 class TableKeyValueProvider:
@@ -36,6 +42,58 @@ class TableKeyValueProvider:
 
         return "."
 
+    @staticproperty
+    def TRANSACTION_LIMIT(self) -> int:
+        """
+        Maximum number of operations in a single table transaction.
+
+        Returns
+        -------
+        int
+            The transaction operation limit.
+        """
+
+        return 100
+
+    @staticproperty
+    def TRANSACTION_BYTES(self) -> int:
+        """
+        Maximum size in bytes of the payload of a single table transaction.
+
+        Returns
+        -------
+        int
+            The transaction payload size limit.
+        """
+
+        return 4 * 1024**2
+
+    @staticproperty
+    def PROPERTY_LIMIT(self) -> int:
+        """
+        Maximum size in bytes of a binary property.
+
+        Returns
+        -------
+        int
+            The binary property size limit.
+        """
+
+        return 64 * 1024
+
+    @staticproperty
+    def ENTITY_CHUNKS(self) -> int:
+        """
+        Number of binary properties holding encoded value chunks in a single entity.
+
+        Returns
+        -------
+        int
+            The chunk count, kept under the 1 MiB entity size limit.
+        """
+
+        return 15
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Initialize an instance of TableKeyValueProvider.
@@ -46,13 +104,30 @@ class TableKeyValueProvider:
             Additional positional arguments.
         **kwargs : dict
             Additional keyword arguments.
+            Supported optional kwargs include:
+            - client : azure.data.tables.TableServiceClient
+                The service client used by the synchronous methods.
+            - aio_client : azure.data.tables.aio.TableServiceClient
+                The service client used by the asynchronous methods. Every table client
+                created from it shares its aiohttp transport.
+            - codec : str or libs.data.key_value.codecs.Codec
+                The codec applied to values saved without an encoder and loaded without a decoder,
+                such as "orjson", "msgpack", "pickle" or "msgpack+zstd". Encoded values are stored
+                as binary properties, split across properties and sibling rows when they exceed
+                the property and entity size limits.
         """
 
         if len(args):
             self.scheme = args[0]
         if "scheme" in kwargs:
             self.scheme = kwargs.pop("scheme")
+        self.codec = get_codec(kwargs.pop("codec", None))
         self.config = {**kwargs}
+        self.clients = {}
+        self.aio_clients = {}
+        self.lock = threading.Lock()
+        # Keys whose values were last seen with sibling rows, which a new value must sweep
+        self.chunked = set()
 
     def __getitem__(self, handle: str) -> Any:
         """
@@ -94,17 +169,86 @@ class TableKeyValueProvider:
         -------
         Any
             The connection to the specified table.
+
+        Notes
+        -----
+        Clients are cached per binding, keyed by the table name and keyword arguments
+        (such as `partition_key`), so repeated calls return the same client. Every cached
+        client wraps the transport of the service client, so they share one connection pool.
         """
 
-        match self.scheme:
-            case "azure_table":
-                from .azure_table import Client as AzureTableClient
+        cache_key = (table_name, *sorted(kwargs.items()))
+        client = self.clients.get(cache_key)
+        if client is None:
+            match self.scheme:
+                case "azure_table":
+                    from .azure_table import Client as AzureTableClient
 
-                return AzureTableClient.from_service_client(
-                    service_client=self.config["client"],
-                    table_name=table_name,
-                    **kwargs,
-                )
+                    with self.lock:
+                        client = self.clients.get(cache_key)
+                        if client is None:
+                            client = self.clients[cache_key] = (
+                                AzureTableClient.from_service_client(
+                                    service_client=self.config["client"],
+                                    table_name=table_name,
+                                    **kwargs,
+                                )
+                            )
+        return client
+
+    def aconnect(self, table_name: str, **kwargs) -> Any:
+        """
+        Connect to a table with an asynchronous client.
+
+        Parameters
+        ----------
+        table_name : str
+            The name of the table.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The asynchronous connection to the specified table.
+
+        Notes
+        -----
+        Clients are cached per binding in the same way as `connect()`.
+        """
+
+        cache_key = (table_name, *sorted(kwargs.items()))
+        client = self.aio_clients.get(cache_key)
+        if client is None:
+            match self.scheme:
+                case "azure_table":
+                    from .azure_table.aio import Client as AsyncAzureTableClient
+
+                    with self.lock:
+                        client = self.aio_clients.get(cache_key)
+                        if client is None:
+                            client = self.aio_clients[cache_key] = (
+                                AsyncAzureTableClient.from_service_client(
+                                    service_client=self.config["aio_client"],
+                                    table_name=table_name,
+                                    **kwargs,
+                                )
+                            )
+        return client
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether the asynchronous methods use a native asynchronous client.
+
+        Returns
+        -------
+        bool
+            True if an `aio_client` is configured, False if the asynchronous methods
+            run the synchronous ones in a worker thread.
+        """
+
+        return self.config.get("aio_client") is not None
 
     def save(self, key: str, value: Any, encoder: Callable = None, **kwargs) -> None:
         """
@@ -120,19 +264,30 @@ class TableKeyValueProvider:
             The encoder function to use for encoding the value, by default None.
         **kwargs : dict
             Additional keyword arguments.
+
+        Notes
+        -----
+        Values encoded by the codec of the binding replace the whole entity. Values larger
+        than one entity are written to sibling rows first, so readers never see a partial
+        value, and the sibling rows of the previous value are removed afterwards. The sweep
+        costs a query, so it only runs when the new value or the previous value saved or loaded
+        through this provider has sibling rows. Sibling rows left by other processes are
+        unreachable, and removed by the next save of a value with sibling rows under the key.
         """
 
-        if encoder:
-            value = encoder(value, **kwargs)
         match self.scheme:
             case "azure_table":
-                table_name, partition_key, row_key = self.parse_key(key)
-                conn = self.connect(table_name)
-                if not hasattr(value, "keys"):
-                    value = {"value": value}
-                conn.upsert_entity(
-                    {"PartitionKey": partition_key, "RowKey": row_key, **value}
+                table_name, partition_key, entities = self.__pack(
+                    key, value, encoder, **kwargs
                 )
+                conn = self.connect(table_name)
+                if self.codec is None or encoder:
+                    conn.upsert_entity(entities[-1])
+                    return
+                for entity in entities:
+                    conn.upsert_entity(entity, mode="replace")
+                if self.__track(key, len(entities) > 1):
+                    self.__sweep(table_name, partition_key, self.__versions(entities))
 
     def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
         """
@@ -158,7 +313,148 @@ class TableKeyValueProvider:
                 table_name, partition_key, row_key = self.parse_key(key)
                 conn = self.connect(table_name)
                 value = conn.get_entity(partition_key=partition_key, row_key=row_key)
-        return decoder(value) if decoder else value
+                if self.__is_packed(value):
+                    self.__track(key, bool(value.get("chunk_rows")))
+                return self.__unpack(conn, value, decoder)
+
+    def load_if_modified(
+        self, key: str, etag: str = None, decoder: Callable = None, **kwargs
+    ) -> Tuple[bool, str, Any]:
+        """
+        Load a value from the storage only if it changed since a known ETag.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        etag : str, optional
+            The ETag of the copy already held by the caller, by default None.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Tuple[bool, str, Any]
+            Whether the value was modified, its current ETag, and the loaded value
+            (None when it was not modified).
+
+        Notes
+        -----
+        The table service has no conditional read, so revalidation is a metadata-only
+        point query that projects just the RowKey. The full entity is only fetched
+        when its ETag differs.
+        """
+
+        match self.scheme:
+            case "azure_table":
+                table_name, partition_key, row_key = self.parse_key(key)
+                conn = self.connect(table_name)
+                if etag:
+                    current = conn.get_entity(
+                        partition_key=partition_key, row_key=row_key, select=["RowKey"]
+                    ).metadata["etag"]
+                    if current == etag:
+                        return False, etag, None
+                value = conn.get_entity(partition_key=partition_key, row_key=row_key)
+                if self.__is_packed(value):
+                    self.__track(key, bool(value.get("chunk_rows")))
+                return True, value.metadata["etag"], self.__unpack(conn, value, decoder)
+
+    def scan(
+        self,
+        table: str,
+        partition: str = None,
+        row_prefix: str = None,
+        row_range: Tuple[str, str] = None,
+        select: List[str] = None,
+        filter: str = None,
+        parameters: Dict[str, Any] = None,
+        page_size: int = None,
+        decoder: Callable = None,
+    ) -> Iterator[Any]:
+        """
+        Iterate over the entities of a table matching a key range.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+        partition : str, optional
+            The partition key to scan, by default None (every partition).
+        row_prefix : str, optional
+            The prefix of the row keys, by default None.
+        row_range : Tuple[str, str], optional
+            The lower (inclusive) and upper (exclusive) row keys, either of which may be None,
+            by default None.
+        select : List[str], optional
+            The properties to return, by default None (every property).
+        filter : str, optional
+            An additional OData filter, combined with the key range, by default None.
+        parameters : Dict[str, Any], optional
+            The values of the `@name` parameters used in `filter`, by default None.
+        page_size : int, optional
+            The number of entities fetched per request, by default the service default (1000).
+        decoder : Callable, optional
+            The decoder function to use for decoding each entity, by default None.
+
+        Returns
+        -------
+        Iterator[Any]
+            The matching entities, ordered by partition and row key.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('table_handle')
+        >>> for entity in provider.scan("table", partition="2024", row_prefix="05-", select=["RowKey", "total"]):
+        >>>     print(entity["RowKey"], entity["total"])
+
+        Notes
+        -----
+        The key range, the projection and the page size are sent to the service, so only
+        the matching properties of the matching entities are transferred. Pages are fetched
+        as the iterator is consumed, following the continuation tokens of the service.
+        """
+
+        conditions = []
+        bindings = {**(parameters or {})}
+        if partition is not None:
+            conditions.append("PartitionKey eq @scan_partition")
+            bindings["scan_partition"] = partition
+        lower, upper = row_range or (None, None)
+        if row_prefix:
+            # The first key after every key starting with the prefix
+            prefix_upper = row_prefix[:-1] + chr(ord(row_prefix[-1]) + 1)
+            lower = max(lower or row_prefix, row_prefix)
+            upper = min(upper or prefix_upper, prefix_upper)
+        if lower is not None:
+            conditions.append("RowKey ge @scan_lower")
+            bindings["scan_lower"] = lower
+        if upper is not None:
+            conditions.append("RowKey lt @scan_upper")
+            bindings["scan_upper"] = upper
+        if filter:
+            # The SDK substitutes @parameters word by word, so the parentheses need spaces
+            conditions.append(f"( {filter} )")
+
+        match self.scheme:
+            case "azure_table":
+                conn = self.connect(table)
+                if conditions:
+                    entities = conn.query_entities(
+                        " and ".join(conditions),
+                        parameters=bindings,
+                        select=select,
+                        results_per_page=page_size,
+                    )
+                else:
+                    entities = conn.list_entities(
+                        select=select, results_per_page=page_size
+                    )
+        for entity in entities:
+            yield decoder(entity) if decoder else entity
 
     def drop(self, key: str, **kwargs) -> None:
         """
@@ -177,6 +473,855 @@ class TableKeyValueProvider:
                 table_name, partition_key, row_key = self.parse_key(key)
                 conn = self.connect(table_name)
                 conn.delete_entity(partition_key=partition_key, row_key=row_key)
+                if self.codec is not None and self.__track(key, False):
+                    self.__sweep(table_name, partition_key, {row_key: None})
+
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in the storage using batched transactions.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to the exception that caused it (or its transaction) to fail.
+
+        Notes
+        -----
+        Entities are grouped by table and PartitionKey and submitted in transactions of up to
+        TRANSACTION_LIMIT operations. A transaction either succeeds or fails as a whole, so a
+        failure is reported for every key in that transaction. With a codec, the sibling rows
+        of values larger than one entity are written concurrently before the transactions.
+        """
+
+        match self.scheme:
+            case "azure_table":
+                if self.codec is None or encoder:
+                    return self.__transact(
+                        map_keys(
+                            lambda key: self.__upsert(key, items[key], encoder, **kwargs),
+                            items.keys(),
+                            max_workers=1,
+                        )
+                    )
+                packed = map_keys(
+                    lambda key: self.__pack(key, items[key]), items.keys(), max_workers=1
+                )
+                # Sibling rows are too large to share a transaction and are written first
+                spilled = map_keys(
+                    lambda key: [
+                        self.connect(packed[key][0]).upsert_entity(entity, mode="replace")
+                        for entity in packed[key][2][:-1]
+                    ],
+                    [
+                        key
+                        for key, pack in packed.items()
+                        if not isinstance(pack, Exception) and len(pack[2]) > 1
+                    ],
+                )
+                operations = {}
+                for key, pack in packed.items():
+                    if isinstance(pack, Exception):
+                        operations[key] = pack
+                    elif isinstance(spilled.get(key), Exception):
+                        operations[key] = spilled[key]
+                    else:
+                        table_name, partition_key, entities = pack
+                        operations[key] = (
+                            table_name,
+                            partition_key,
+                            ("upsert", entities[-1], {"mode": "replace"}),
+                        )
+                results = self.__transact(operations)
+                self.__sweep_many(
+                    {
+                        key: self.__versions(packed[key][2])
+                        for key, result in results.items()
+                        if not isinstance(result, Exception)
+                        and self.__track(key, len(packed[key][2]) > 1)
+                    }
+                )
+                return results
+
+    def load_many(
+        self,
+        keys: Iterable[str],
+        decoder: Callable = None,
+        max_workers: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Load several values from the storage concurrently.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        max_workers : int, optional
+            The number of concurrent requests, by default None (the ThreadPoolExecutor default).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+
+        Notes
+        -----
+        Table transactions cannot contain reads, so each entity is read with its own
+        point query and the queries are issued concurrently.
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=max_workers,
+        )
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs from the storage using batched transactions.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to the exception that caused it (or its transaction) to fail.
+        """
+
+        match self.scheme:
+            case "azure_table":
+                results = self.__transact(map_keys(self.__delete, keys, max_workers=1))
+                if self.codec is not None:
+                    self.__sweep_many(
+                        {
+                            key: {self.parse_key(key)[2]: None}
+                            for key, result in results.items()
+                            if not isinstance(result, Exception) and self.__track(key, False)
+                        }
+                    )
+                return results
+
+    async def asave(
+        self, key: str, value: Any, encoder: Callable = None, **kwargs
+    ) -> None:
+        """
+        Save a key-value pair in the storage without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Notes
+        -----
+        Without an `aio_client`, or with a codec, `save()` runs in a worker thread.
+        """
+
+        if not self.is_async or self.codec is not None:
+            return await asyncio.to_thread(self.save, key, value, encoder, **kwargs)
+        match self.scheme:
+            case "azure_table":
+                table_name, _, (_, entity) = self.__upsert(
+                    key, value, encoder, **kwargs
+                )
+                await self.aconnect(table_name).upsert_entity(entity)
+
+    async def aload(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Load a value from the storage without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The loaded value.
+
+        Notes
+        -----
+        Without an `aio_client`, `load()` runs in a worker thread.
+        """
+
+        if not self.is_async:
+            return await asyncio.to_thread(self.load, key, decoder, **kwargs)
+        match self.scheme:
+            case "azure_table":
+                table_name, partition_key, row_key = self.parse_key(key)
+                conn = self.aconnect(table_name)
+                value = await conn.get_entity(
+                    partition_key=partition_key, row_key=row_key
+                )
+                if decoder or not self.__is_packed(value):
+                    return decoder(value) if decoder else value
+                self.__track(key, bool(value.get("chunk_rows")))
+                siblings = [
+                    await conn.get_entity(partition_key=partition_key, row_key=row)
+                    for row in self.__siblings(value)
+                ]
+                return self.codec.decode(self.__join([value, *siblings]))
+
+    async def adrop(self, key: str, **kwargs) -> None:
+        """
+        Delete a key-value pair from the storage without blocking the event loop.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Notes
+        -----
+        Without an `aio_client`, or with a codec, `drop()` runs in a worker thread.
+        """
+
+        if not self.is_async or self.codec is not None:
+            return await asyncio.to_thread(self.drop, key, **kwargs)
+        match self.scheme:
+            case "azure_table":
+                table_name, partition_key, row_key = self.parse_key(key)
+                await self.aconnect(table_name).delete_entity(
+                    partition_key=partition_key, row_key=row_key
+                )
+
+    async def asave_many(
+        self,
+        items: Mapping[str, Any],
+        encoder: Callable = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs using concurrent asynchronous transactions.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        max_concurrency : int, optional
+            The maximum number of transactions in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to the exception that caused it (or its transaction) to fail.
+
+        Notes
+        -----
+        Without an `aio_client`, or with a codec, `save_many()` runs in a worker thread.
+        """
+
+        if not self.is_async or self.codec is not None:
+            return await asyncio.to_thread(self.save_many, items, encoder, **kwargs)
+        match self.scheme:
+            case "azure_table":
+                return await self.__atransact(
+                    map_keys(
+                        lambda key: self.__upsert(key, items[key], encoder, **kwargs),
+                        items.keys(),
+                        max_workers=1,
+                    ),
+                    max_concurrency,
+                )
+
+    async def aload_many(
+        self,
+        keys: Iterable[str],
+        decoder: Callable = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Load several values from the storage using concurrent asynchronous point reads.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        max_concurrency : int, optional
+            The maximum number of requests in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+        """
+
+        return await amap_keys(
+            lambda key: self.aload(key, decoder=decoder, **kwargs),
+            keys,
+            max_concurrency,
+        )
+
+    async def adrop_many(
+        self, keys: Iterable[str], max_concurrency: int = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs using concurrent asynchronous transactions.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        max_concurrency : int, optional
+            The maximum number of transactions in flight at once, by default None (unbounded).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to the exception that caused it (or its transaction) to fail.
+
+        Notes
+        -----
+        Without an `aio_client`, or with a codec, `drop_many()` runs in a worker thread.
+        """
+
+        if not self.is_async or self.codec is not None:
+            return await asyncio.to_thread(self.drop_many, keys, **kwargs)
+        match self.scheme:
+            case "azure_table":
+                return await self.__atransact(
+                    map_keys(self.__delete, keys, max_workers=1), max_concurrency
+                )
+
+    def __transact(self, operations: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit table operations in transactions grouped by table and PartitionKey.
+
+        Parameters
+        ----------
+        operations : Dict[str, Any]
+            A dictionary mapping each key to a (table_name, partition_key, operation) tuple,
+            or to the exception raised while preparing it.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to an exception.
+        """
+
+        results, chunks = self.__chunk(operations)
+        for table_name, chunk in chunks:
+            try:
+                metadata = self.connect(table_name).submit_transaction(
+                    [op for _, op in chunk]
+                )
+                results.update(zip([key for key, _ in chunk], metadata))
+            except Exception as e:
+                results.update({key: e for key, _ in chunk})
+        return {key: results[key] for key in operations.keys()}
+
+    async def __atransact(
+        self, operations: Dict[str, Any], max_concurrency: int = None
+    ) -> Dict[str, Any]:
+        """
+        Submit table operations in concurrent asynchronous transactions grouped by table
+        and PartitionKey.
+
+        Parameters
+        ----------
+        operations : Dict[str, Any]
+            A dictionary mapping each key to a (table_name, partition_key, operation) tuple,
+            or to the exception raised while preparing it.
+        max_concurrency : int, optional
+            The maximum number of transactions in flight at once, by default None (unbounded).
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to the metadata returned for its operation,
+            or to an exception.
+        """
+
+        results, chunks = self.__chunk(operations)
+
+        async def submit(i: int):
+            table_name, chunk = chunks[i]
+            return await self.aconnect(table_name).submit_transaction(
+                [op for _, op in chunk]
+            )
+
+        submitted = await amap_keys(submit, range(len(chunks)), max_concurrency)
+        for i, metadata in submitted.items():
+            keys = [key for key, _ in chunks[i][1]]
+            if isinstance(metadata, Exception):
+                results.update({key: metadata for key in keys})
+            else:
+                results.update(zip(keys, metadata))
+        return {key: results[key] for key in operations.keys()}
+
+    def __chunk(
+        self, operations: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, List[Tuple[str, Tuple[str, dict]]]]]]:
+        """
+        Split table operations into transaction-sized chunks.
+
+        Parameters
+        ----------
+        operations : Dict[str, Any]
+            A dictionary mapping each key to a (table_name, partition_key, operation) tuple,
+            or to the exception raised while preparing it.
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], List[Tuple[str, List[Tuple[str, Tuple[str, dict]]]]]]
+            The exceptions raised while preparing operations, keyed by key, and a list of
+            (table_name, [(key, operation), ...]) chunks. Each chunk shares one PartitionKey,
+            holds at most TRANSACTION_LIMIT operations, and has an estimated payload of at most
+            TRANSACTION_BYTES. Operations on entities over a quarter of that limit, such as
+            values chunked close to the entity size limit, are submitted on their own, so a
+            failure of one large entity fails no other key.
+        """
+
+        results = {}
+        groups = {}
+        for key, operation in operations.items():
+            if isinstance(operation, Exception):
+                results[key] = operation
+            else:
+                groups.setdefault(operation[:2], []).append((key, operation[2]))
+        chunks = []
+        for (table_name, _), group in groups.items():
+            chunk, size = [], 0
+            for key, operation in group:
+                payload = self.__payload(operation)
+                if payload > self.TRANSACTION_BYTES // 4:
+                    chunks.append((table_name, [(key, operation)]))
+                    continue
+                if (
+                    len(chunk) == self.TRANSACTION_LIMIT
+                    or size + payload > self.TRANSACTION_BYTES
+                ):
+                    chunks.append((table_name, chunk))
+                    chunk, size = [], 0
+                chunk.append((key, operation))
+                size += payload
+            if chunk:
+                chunks.append((table_name, chunk))
+        return results, chunks
+
+    def __payload(self, operation: Tuple[str, dict]) -> int:
+        """
+        Estimate the size of a transaction operation in the payload of its transaction.
+
+        Parameters
+        ----------
+        operation : Tuple[str, dict]
+            The transaction operation.
+
+        Returns
+        -------
+        int
+            The estimated size in bytes. Binary properties are sent base64-encoded, so they
+            count for 4/3 of their size, and each operation carries about 1 KiB of headers.
+        """
+
+        size = 1024
+        for name, value in operation[1].items():
+            match value:
+                case bytes() | bytearray():
+                    size += len(name) + 4 * -(-len(value) // 3) + 64
+                case str():
+                    size += len(name) + len(value.encode()) + 8
+                case _:
+                    size += len(name) + 64
+        return size
+
+    def __upsert(
+        self, key: str, value: Any, encoder: Callable = None, **kwargs
+    ) -> Tuple[str, str, Tuple[str, dict]]:
+        """
+        Prepare an upsert transaction operation for a key-value pair.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Tuple[str, str, Tuple[str, dict]]
+            The table name, the partition key, and the transaction operation.
+        """
+
+        table_name, partition_key, entities = self.__pack(key, value, encoder, **kwargs)
+        return table_name, partition_key, ("upsert", entities[-1])
+
+    def __pack(
+        self, key: str, value: Any, encoder: Callable = None, **kwargs
+    ) -> Tuple[str, str, List[dict]]:
+        """
+        Convert a key-value pair into the entities that store it.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+            Without an encoder, the codec of the binding encodes the value, if any.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Tuple[str, str, List[dict]]
+            The table name, the partition key, and the entities. The main entity comes last,
+            after the sibling rows of a value larger than one entity.
+        """
+
+        table_name, partition_key, row_key = self.parse_key(key)
+        if encoder:
+            value = encoder(value, **kwargs)
+        elif self.codec is not None:
+            data = self.codec.encode(value)
+            size = self.PROPERTY_LIMIT
+            chunks = [data[i : i + size] for i in range(0, len(data), size)] or [b""]
+            rows = [
+                chunks[i : i + self.ENTITY_CHUNKS]
+                for i in range(0, len(chunks), self.ENTITY_CHUNKS)
+            ]
+            main = {
+                "PartitionKey": partition_key,
+                "RowKey": row_key,
+                **self.__properties(rows[0]),
+            }
+            if len(rows) == 1:
+                return table_name, partition_key, [main]
+            # Versioned sibling rows stay readable through the previous main entity
+            version = uuid.uuid4().hex[:8]
+            main.update(chunk_rows=len(rows) - 1, chunk_version=version)
+            return (
+                table_name,
+                partition_key,
+                [
+                    {
+                        "PartitionKey": partition_key,
+                        "RowKey": f"{row_key}~{version}{i:04d}",
+                        "chunk_of": row_key,
+                        **self.__properties(chunks),
+                    }
+                    for i, chunks in enumerate(rows[1:], 1)
+                ]
+                + [main],
+            )
+        if not hasattr(value, "keys"):
+            value = {"value": value}
+        return (
+            table_name,
+            partition_key,
+            [{"PartitionKey": partition_key, "RowKey": row_key, **value}],
+        )
+
+    def __properties(self, chunks: List[bytes]) -> Dict[str, bytes]:
+        """
+        Name the binary properties holding the chunks of an encoded value.
+
+        Parameters
+        ----------
+        chunks : List[bytes]
+            The chunks stored in one entity.
+
+        Returns
+        -------
+        Dict[str, bytes]
+            The chunks, keyed "value", "value_1", "value_2", and so on.
+        """
+
+        return {
+            ("value" if i == 0 else f"value_{i}"): chunk for i, chunk in enumerate(chunks)
+        }
+
+    def __is_packed(self, entity: Mapping[str, Any]) -> bool:
+        """
+        Check whether an entity holds a value encoded by the codec of the binding.
+
+        Parameters
+        ----------
+        entity : Mapping[str, Any]
+            The main entity of a key.
+
+        Returns
+        -------
+        bool
+            True if the binding has a codec and the entity stores a binary value.
+        """
+
+        return self.codec is not None and isinstance(entity.get("value"), bytes)
+
+    def __siblings(self, entity: Mapping[str, Any]) -> List[str]:
+        """
+        List the row keys of the sibling rows of a main entity.
+
+        Parameters
+        ----------
+        entity : Mapping[str, Any]
+            The main entity of a key.
+
+        Returns
+        -------
+        List[str]
+            The row keys of the sibling rows, in chunk order.
+        """
+
+        version = entity.get("chunk_version")
+        return [
+            f"{entity['RowKey']}~{version}{i:04d}"
+            for i in range(1, (entity.get("chunk_rows") or 0) + 1)
+        ]
+
+    def __join(self, entities: List[Mapping[str, Any]]) -> bytes:
+        """
+        Reassemble an encoded value from its main entity and sibling rows.
+
+        Parameters
+        ----------
+        entities : List[Mapping[str, Any]]
+            The main entity followed by its sibling rows.
+
+        Returns
+        -------
+        bytes
+            The encoded value.
+        """
+
+        chunks = []
+        for entity in entities:
+            chunks.append(entity["value"])
+            i = 1
+            while f"value_{i}" in entity:
+                chunks.append(entity[f"value_{i}"])
+                i += 1
+        return b"".join(chunks)
+
+    def __unpack(
+        self, conn: Any, entity: Mapping[str, Any], decoder: Callable = None
+    ) -> Any:
+        """
+        Decode the value stored by a main entity.
+
+        Parameters
+        ----------
+        conn : Any
+            The connection to the table.
+        entity : Mapping[str, Any]
+            The main entity of a key.
+        decoder : Callable, optional
+            The decoder function to use for decoding the entity, by default None.
+
+        Returns
+        -------
+        Any
+            The decoded value. Entities that do not store a binary value, such as those saved
+            before the codec was configured, are returned as they are.
+        """
+
+        if decoder or not self.__is_packed(entity):
+            return decoder(entity) if decoder else entity
+        siblings = [
+            conn.get_entity(partition_key=entity["PartitionKey"], row_key=row)
+            for row in self.__siblings(entity)
+        ]
+        return self.codec.decode(self.__join([entity, *siblings]))
+
+    def __versions(self, entities: List[dict]) -> Dict[str, str]:
+        """
+        Get the sibling row version of the main entity of a packed value.
+
+        Parameters
+        ----------
+        entities : List[dict]
+            The entities returned by `__pack()`.
+
+        Returns
+        -------
+        Dict[str, str]
+            The row key of the main entity, mapped to its sibling row version (None if the
+            value has no sibling rows).
+        """
+
+        return {entities[-1]["RowKey"]: entities[-1].get("chunk_version")}
+
+    def __track(self, key: str, chunked: bool) -> bool:
+        """
+        Record whether the value of a key has sibling rows.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+        chunked : bool
+            Whether the current value of the key has sibling rows.
+
+        Returns
+        -------
+        bool
+            True if the current or the previously known value of the key has sibling rows,
+            that is, if sibling rows may need to be swept.
+        """
+
+        with self.lock:
+            swept = chunked or key in self.chunked
+            if chunked:
+                self.chunked.add(key)
+            else:
+                self.chunked.discard(key)
+        return swept
+
+    def __sweep(
+        self, table_name: str, partition_key: str, versions: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Delete the sibling rows left over by previous values of some rows.
+
+        Parameters
+        ----------
+        table_name : str
+            The name of the table.
+        partition_key : str
+            The partition key of the rows.
+        versions : Dict[str, str]
+            The row keys of the main entities, mapped to the sibling row version to keep
+            (None to delete every sibling row).
+
+        Returns
+        -------
+        Dict[str, Any]
+            The results of the delete operations, as returned by `__transact()`.
+
+        Notes
+        -----
+        Sibling rows sort right after their main entity, so a narrow range query per row
+        finds them without reading the rows in between. The queries run concurrently, and only
+        the RowKey and chunk_of properties are transferred.
+        """
+
+        found = map_keys(
+            lambda owner: list(
+                self.scan(
+                    table_name,
+                    partition=partition_key,
+                    row_range=(owner + "~", owner + "~~"),
+                    select=["RowKey", "chunk_of"],
+                    filter="chunk_of ge ''",
+                )
+            ),
+            versions.keys(),
+        )
+        errors = [error for error in found.values() if isinstance(error, Exception)]
+        stale = {}
+        for entity in chain.from_iterable(
+            entities for entities in found.values() if not isinstance(entities, Exception)
+        ):
+            row_key, owner = entity["RowKey"], entity["chunk_of"]
+            if owner in versions and not (
+                versions[owner] and row_key.startswith(f"{owner}~{versions[owner]}")
+            ):
+                stale[f"{table_name}.{partition_key}.{row_key}"] = (
+                    table_name,
+                    partition_key,
+                    ("delete", {"PartitionKey": partition_key, "RowKey": row_key}),
+                )
+        results = self.__transact(stale)
+        if errors:
+            raise errors[0]
+        return results
+
+    def __sweep_many(self, versions: Dict[str, Dict[str, str]]) -> None:
+        """
+        Delete the sibling rows left over by previous values, grouped by partition.
+
+        Parameters
+        ----------
+        versions : Dict[str, Dict[str, str]]
+            The keys of the main entities, mapped to the versions passed to `__sweep()`.
+        """
+
+        groups = {}
+        for key, version in versions.items():
+            table_name, partition_key, _ = self.parse_key(key)
+            groups.setdefault((table_name, partition_key), {}).update(version)
+        for (table_name, partition_key), group in groups.items():
+            self.__sweep(table_name, partition_key, group)
+
+    def __delete(self, key: str) -> Tuple[str, str, Tuple[str, dict]]:
+        """
+        Prepare a delete transaction operation for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+
+        Returns
+        -------
+        Tuple[str, str, Tuple[str, dict]]
+            The table name, the partition key, and the transaction operation.
+        """
+
+        table_name, partition_key, row_key = self.parse_key(key)
+        return (
+            table_name,
+            partition_key,
+            ("delete", {"PartitionKey": partition_key, "RowKey": row_key}),
+        )
 
     def parse_key(self, key: str):
         """
@@ -1,6 +1,8 @@
+from libs.data.key_value import map_keys
 from libs.utils.decorators import staticproperty
-from libs.utils.threaded import current
-from typing import Any, Callable, List
+from libs.utils.threaded import store
+from contextvars import Context
+from typing import Any, Callable, Dict, Iterable, List, Mapping
 
 
 class ThreadKeyValueProvider:
@@ -8,7 +10,8 @@ class ThreadKeyValueProvider:
     Thread-based key-value storage provider.
 
     This class provides methods to save, load, and delete key-value pairs
-    using thread-based storage mechanisms.
+    using thread-based storage mechanisms. Values are held in context variables,
+    so they are scoped to the current thread or asyncio task.
     """
 
     @staticproperty
@@ -62,7 +65,7 @@ class ThreadKeyValueProvider:
 
         if not hasattr(cls, "instance"):
             cls.instance = super(ThreadKeyValueProvider, cls).__new__(cls)
-            return cls.instance
+        return cls.instance
 
     def __getitem__(self, handle: str) -> Any:
         """
@@ -119,11 +122,11 @@ class ThreadKeyValueProvider:
         -----
         This method saves a key-value pair in the thread-based storage.
         If an encoder function is provided, the value is encoded before saving.
-        The method stores the encoded or original value in the thread-local storage
+        The method stores the encoded or original value in the current context
         using the specified key.
         """
 
-        current.__setattr__(key, encoder(value) if encoder else value)
+        store.set(key, encoder(value) if encoder else value)
 
     def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
         """
@@ -143,6 +146,11 @@ class ThreadKeyValueProvider:
         Any
             The loaded value.
 
+        Raises
+        ------
+        KeyError
+            If the key is not set in the current context.
+
         Example
         -------
         >>> from libs.data import from_bind
@@ -155,15 +163,11 @@ class ThreadKeyValueProvider:
         -----
         This method retrieves a value from the thread-based storage using the specified key.
         If a decoder function is provided, the retrieved value is decoded before returning.
-        The method retrieves the value from the thread-local storage using the specified key.
+        The method retrieves the value from the current context using the specified key.
         The decoded or raw value is returned.
         """
 
-        return (
-            decoder(current.__getattribute__(key)._get_current_object())
-            if decoder
-            else current.__getattribute__(key)._get_current_object()
-        )
+        return decoder(store.get(key)) if decoder else store.get(key)
 
     def drop(self, key: str) -> None:
         """
@@ -174,6 +178,11 @@ class ThreadKeyValueProvider:
         key : str
             The key associated with the value to be deleted.
 
+        Raises
+        ------
+        KeyError
+            If the key is not set in the current context.
+
         Example
         -------
         >>> from libs.data import from_bind
@@ -184,7 +193,130 @@ class ThreadKeyValueProvider:
         Notes
         -----
         This method deletes a key-value pair from the thread-based storage using the specified key.
-        It removes the key from the thread-local storage.
+        It removes the key from the current context only.
+        """
+
+        store.delete(key)
+
+    def snapshot(self) -> Context:
+        """
+        Capture the key-value pairs of the current context.
+
+        Returns
+        -------
+        Context
+            The snapshot, an O(1) copy of the current context.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('thread_handle')
+        >>> snapshot = provider.snapshot()
+        >>> provider.save("my_key", "my_value")
+        >>> provider.restore(snapshot)
+        """
+
+        return store.snapshot()
+
+    def restore(self, snapshot: Context) -> None:
+        """
+        Restore the key-value pairs captured by `snapshot()` in the current context.
+
+        Parameters
+        ----------
+        snapshot : Context
+            The snapshot to restore. Keys saved after it was taken are dropped.
+        """
+
+        store.restore(snapshot)
+
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in the thread-based storage.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while saving it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('thread_handle')
+        >>> provider.save_many({"key1": "value1", "key2": "value2"})
+        """
+
+        return map_keys(
+            lambda key: self.save(key, items[key], encoder=encoder, **kwargs),
+            items.keys(),
+            max_workers=1,
+        )
+
+    def load_many(
+        self, keys: Iterable[str], decoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Load several values from the thread-based storage.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('thread_handle')
+        >>> values = provider.load_many(["key1", "key2"])
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=1,
+        )
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs from the thread-based storage.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to None, or to the exception raised while deleting it.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('thread_handle')
+        >>> provider.drop_many(["key1", "key2"])
         """
 
-        current.__delattr__(key)
+        return map_keys(self.drop, keys, max_workers=1)
@@ -0,0 +1,359 @@
+from libs.data.key_value import map_keys
+from libs.data.key_value.ram import MemoryKeyValueProvider, sizeof
+from libs.utils.decorators import staticproperty
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+import threading
+import time
+
+
+class TieredKeyValueProvider:
+    """
+    Read-through tiered key-value storage provider.
+
+    This class layers a local in-memory tier over a remote key-value binding.
+    Hot keys are served from the local tier, and stale copies are revalidated
+    against the remote binding's ETag so unchanged values are not fetched again.
+    Writes go to the remote binding and drop the local copy.
+    """
+
+    @staticproperty
+    def SUPPORTED_SCHEMES(self) -> List[str]:
+        """
+        List of supported schemes.
+
+        Returns
+        -------
+        List[str]
+            A list of supported schemes.
+        """
+
+        return ["tiered"]
+
+    @staticproperty
+    def scheme(self) -> str:
+        """
+        Scheme supported by the provider.
+
+        Returns
+        -------
+        str
+            The supported scheme.
+        """
+
+        return self.SUPPORTED_SCHEMES[0]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize an instance of TieredKeyValueProvider.
+
+        Parameters
+        ----------
+        *args : tuple
+            Additional positional arguments.
+        **kwargs : dict
+            Additional keyword arguments.
+            Supported kwargs include:
+            - backend : str or KeyValueProvider
+                The handle of the remote binding, or the remote provider itself.
+                Handles are resolved on first use, so the remote binding may be
+                registered after this one.
+            - max_age : float
+                The number of seconds a local copy is served without revalidation,
+                by default 0 (every read revalidates).
+            - max_entries, max_bytes, ttl, policy
+                Limits of the local tier, as accepted by the ram scheme.
+
+        Example
+        -------
+        >>> from libs.data import register_binding
+        >>> register_binding(
+        >>>     "cached_tables",
+        >>>     "KeyValue",
+        >>>     "tiered",
+        >>>     backend="some_azure_tables",
+        >>>     max_age=30,
+        >>>     max_entries=10000,
+        >>> )
+        """
+
+        self.backend = kwargs.pop("backend")
+        self.max_age: float = kwargs.pop("max_age", 0)
+        kwargs.pop("scheme", None)
+        # Local entries are (etag, fetched_at, value) tuples, sized by their value.
+        size = kwargs.get("sizeof", sizeof)
+        self.local = MemoryKeyValueProvider(
+            **{**kwargs, "sizeof": lambda entry: size(entry[2])}
+        )
+        self.lock = threading.Lock()
+        self.__stats = {"fresh": 0, "not_modified": 0, "fetched": 0}
+
+    @property
+    def remote(self) -> Any:
+        """
+        The remote key-value provider.
+
+        Returns
+        -------
+        Any
+            The provider bound to the `backend` handle, or the `backend` provider itself.
+        """
+
+        if isinstance(self.backend, str):
+            from libs.data import from_bind
+
+            return from_bind(self.backend)
+        return self.backend
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics for both tiers.
+
+        Returns
+        -------
+        Dict[str, int]
+            The local tier statistics, plus the number of reads served fresh from the
+            local tier, revalidated as not modified, and fetched from the remote binding.
+        """
+
+        with self.lock:
+            return {**self.local.stats, **self.__stats}
+
+    def __getitem__(self, handle: str) -> Any:
+        """
+        Retrieve an item using a handle.
+
+        Parameters
+        ----------
+        handle : str
+            The handle associated with the item.
+
+        Returns
+        -------
+        Any
+            The retrieved item.
+        """
+
+        return self.load(key=handle)
+
+    def save(self, key: str, value: Any, encoder: Callable = None, **kwargs) -> None:
+        """
+        Save a key-value pair in the remote binding and drop it from the local tier.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        value : Any
+            The value to be saved.
+        encoder : Callable, optional
+            The encoder function to use for encoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('cached_tables')
+        >>> provider.save("table.partition.row", {"column": "value"})
+
+        Notes
+        -----
+        The value given is not what reads return once decoded, such as the full entity of an
+        azure_table binding, so the local copy is dropped and the next read fetches the value.
+        """
+
+        try:
+            self.remote.save(key, value, encoder=encoder, **kwargs)
+        finally:
+            self.invalidate(key)
+
+    def load(self, key: str, decoder: Callable = None, **kwargs) -> Any:
+        """
+        Load a value, serving it from the local tier when it is fresh or unchanged.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value.
+        decoder : Callable, optional
+            The decoder function to use for decoding the value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Any
+            The loaded value.
+
+        Example
+        -------
+        >>> from libs.data import from_bind
+        >>> provider = from_bind('cached_tables')
+        >>> value = provider.load("table.partition.row")
+
+        Notes
+        -----
+        The local tier keeps decoded values, so a key should always be read with the same decoder.
+        Local copies younger than `max_age` are returned as-is. Older copies are revalidated
+        with the remote binding's `load_if_modified()`, which costs a 304 or a metadata-only
+        call when the value is unchanged. Remote bindings without `load_if_modified()` are
+        loaded in full.
+        """
+
+        try:
+            etag, fetched_at, value = self.local.load(key)
+        except KeyError:
+            etag, fetched_at, value = None, None, None
+        now = time.monotonic()
+        if fetched_at is not None and now - fetched_at < self.max_age:
+            self.__count("fresh")
+            return value
+
+        remote = self.remote
+        try:
+            if hasattr(remote, "load_if_modified"):
+                modified, etag, loaded = remote.load_if_modified(
+                    key, etag=etag, decoder=decoder, **kwargs
+                )
+            else:
+                modified, etag = True, None
+                loaded = remote.load(key, decoder=decoder, **kwargs)
+        except Exception:
+            # The remote copy is gone or unreachable, so the local copy cannot be trusted
+            self.invalidate(key)
+            raise
+        if modified:
+            self.__count("fetched")
+            value = loaded
+        else:
+            self.__count("not_modified")
+        self.local.save(key, (etag, now, value))
+        return value
+
+    def drop(self, key: str, **kwargs) -> None:
+        """
+        Delete a key-value pair from the remote binding and the local tier.
+
+        Parameters
+        ----------
+        key : str
+            The key associated with the value to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+        """
+
+        self.remote.drop(key, **kwargs)
+        self.invalidate(key)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a key from the local tier only.
+
+        Parameters
+        ----------
+        key : str
+            The key to remove.
+        """
+
+        try:
+            self.local.drop(key)
+        except KeyError:
+            pass
+
+    def save_many(
+        self, items: Mapping[str, Any], encoder: Callable = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Save several key-value pairs in the remote binding and drop them from the local tier.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            The values to be saved, keyed by their keys.
+        encoder : Callable, optional
+            The encoder function to use for encoding each value, by default None.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The per-key results of the remote binding. Every key is dropped from the local
+            tier, so the next read of a saved key fetches it from the remote binding.
+        """
+
+        try:
+            return self.remote.save_many(items, encoder=encoder, **kwargs)
+        finally:
+            for key in items.keys():
+                self.invalidate(key)
+
+    def load_many(
+        self,
+        keys: Iterable[str],
+        decoder: Callable = None,
+        max_workers: int = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Load several values, revalidating stale local copies concurrently.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values.
+        decoder : Callable, optional
+            The decoder function to use for decoding each value, by default None.
+        max_workers : int, optional
+            The number of concurrent revalidations, by default None (the ThreadPoolExecutor default).
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each key to its value, or to the exception raised while loading it.
+        """
+
+        return map_keys(
+            lambda key: self.load(key, decoder=decoder, **kwargs),
+            keys,
+            max_workers=max_workers,
+        )
+
+    def drop_many(self, keys: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete several key-value pairs from the remote binding and the local tier.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys associated with the values to be deleted.
+        **kwargs : dict
+            Additional keyword arguments.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The per-key results of the remote binding.
+        """
+
+        keys = list(keys)
+        results = self.remote.drop_many(keys, **kwargs)
+        for key in keys:
+            self.invalidate(key)
+        return results
+
+    def __count(self, name: str) -> None:
+        """
+        Increment a read counter.
+
+        Parameters
+        ----------
+        name : str
+            The counter to increment.
+        """
+
+        with self.lock:
+            self.__stats[name] += 1
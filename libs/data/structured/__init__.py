@@ -1,8 +1,17 @@
 import functools
 from libs.utils.decorators import staticproperty, immutable_arguments
 from libs.utils.pluginloader import load
-from typing import Any, List, Protocol, runtime_checkable
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Protocol, Set, Tuple, runtime_checkable
+import importlib
 import inspect
+import re
+
+# Static manifest mapping each scheme to the module that provides it.
+# Provider modules are only imported when a binding asks for one of their schemes.
+_MANIFEST: Dict[str, str] = {
+    "sql": f"{__name__}.sqlalchemy",
+}
 
 
 @runtime_checkable
@@ -169,6 +178,10 @@ class StructuredRegistry:
     """
 
     _providers = []
+    _index: Dict[str, Any] = {}
+    _regex: List[Tuple[Callable[[str], Any], Any]] = []
+    _schemes: List[str] = list(_MANIFEST.keys())
+    _loaded: Set[str] = set()
 
     @classmethod
     def get_protocol(cls) -> Protocol:
@@ -200,6 +213,63 @@ class StructuredRegistry:
             raise TypeError("Only Structured Providers can be registered.")
         if provider_class not in cls._providers:
             cls._providers.append(provider_class)
+            cls.reindex()
+
+    @classmethod
+    def reindex(cls) -> None:
+        """
+        Rebuild the scheme-to-provider index and the regular expression table.
+
+        Notes
+        -----
+        This method is called by `register()`, so lookups never have to evaluate
+        SUPPORTED_SCHEMES or recompile SUPPORTED_SCHEMES_REGEX on the registered providers.
+        SUPPORTED_SCHEMES_REGEX may be a pattern string, a list of pattern strings,
+        a compiled pattern, or a callable that takes a scheme and returns a truthy value.
+        """
+
+        index = {}
+        regex = []
+        for provider in cls._providers:
+            for scheme in provider.SUPPORTED_SCHEMES:
+                index.setdefault(scheme, provider)
+            if hasattr(provider, "SUPPORTED_SCHEMES_REGEX"):
+                patterns = provider.SUPPORTED_SCHEMES_REGEX
+                if isinstance(patterns, (str, re.Pattern)) or callable(patterns):
+                    patterns = [patterns]
+                for pattern in patterns:
+                    if isinstance(pattern, str):
+                        pattern = re.compile(pattern)
+                    regex.append(
+                        (
+                            pattern.fullmatch
+                            if isinstance(pattern, re.Pattern)
+                            else pattern,
+                            provider,
+                        )
+                    )
+        cls._index = index
+        cls._regex = regex
+        cls._schemes = list(dict.fromkeys([*_MANIFEST.keys(), *index.keys()]))
+
+    @classmethod
+    def supports(cls, scheme: str) -> bool:
+        """
+        Check whether a scheme is declared in the manifest, by a registered provider,
+        or matches a registered regular expression scheme.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme to check.
+
+        Returns
+        -------
+        bool
+            True if the scheme is supported, False otherwise.
+        """
+
+        return scheme in _MANIFEST or scheme in cls._index or cls.regex_schemes(scheme)
 
     @classmethod
     @immutable_arguments
@@ -236,14 +306,8 @@ class StructuredRegistry:
         Additional arguments and keyword arguments are passed to the provider class constructor.
         """
 
-        provider_class = None
-        for provider in cls._providers:
-            if scheme in provider.SUPPORTED_SCHEMES:
-                provider_class = provider
-                break
-            if cls.regex_schemes(scheme):
-                provider_class = provider
-                break
+        cls.load_scheme(scheme)
+        provider_class = cls._index.get(scheme) or cls.match_regex(scheme)
         # if not provider_class:
         #     raise ValueError(
         #         f"Storage provider for the '{scheme}' scheme is not supported."
@@ -267,14 +331,13 @@ class StructuredRegistry:
 
         Notes
         -----
-        This method returns a list of all supported schemes by querying each registered provider.
+        This method returns the schemes declared in the provider manifest, followed by any
+        schemes of registered providers that are not declared in the manifest.
+        Provider modules are not imported to build this list, and the list is only rebuilt
+        when a provider is registered.
         """
 
-        return [
-            scheme
-            for provider in cls._providers
-            for scheme in provider.SUPPORTED_SCHEMES
-        ]
+        return cls._schemes
 
     @classmethod
     def regex_schemes(cls, scheme: str) -> bool:
@@ -301,11 +364,28 @@ class StructuredRegistry:
         This method checks if the specified scheme matches any of the regular expression schemes defined by the registered providers.
         """
 
-        for provider in cls._providers:
-            if hasattr(provider, "SUPPORTED_SCHEMES_REGEX"):
-                if provider.SUPPORTED_SCHEMES_REGEX(scheme):
-                    return True
-        return False
+        return cls.match_regex(scheme) is not None
+
+    @classmethod
+    def match_regex(cls, scheme: str) -> Any:
+        """
+        Get the first registered provider whose regular expression schemes match a scheme.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme to match.
+
+        Returns
+        -------
+        Any
+            The matching provider class, or None if no pattern matches.
+        """
+
+        for match, provider in cls._regex:
+            if match(scheme):
+                return provider
+        return None
 
     @classmethod
     def load_modules(cls) -> None:
@@ -318,10 +398,47 @@ class StructuredRegistry:
         """
 
         for module in load(path=__file__, file_mode="all", depth=-1):
-            for _, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and isinstance(obj, StructuredProvider)
-                    and obj != StructuredProvider
-                ):
-                    StructuredRegistry.register(obj)
+            cls.register_module(module)
+
+    @classmethod
+    def load_scheme(cls, scheme: str) -> None:
+        """
+        Import the provider module declared for a scheme and register its providers.
+
+        Parameters
+        ----------
+        scheme : str
+            The scheme whose provider module should be loaded.
+
+        Notes
+        -----
+        Schemes that are not declared in the manifest and not matched by an already
+        registered provider, such as those only matched by the SUPPORTED_SCHEMES_REGEX of
+        an unloaded provider, fall back to `load_modules()`.
+        """
+
+        if scheme in _MANIFEST:
+            if _MANIFEST[scheme] not in cls._loaded:
+                cls.register_module(importlib.import_module(_MANIFEST[scheme]))
+                cls._loaded.add(_MANIFEST[scheme])
+        elif scheme not in cls._index and not cls.regex_schemes(scheme):
+            cls.load_modules()
+
+    @classmethod
+    def register_module(cls, module: ModuleType) -> None:
+        """
+        Register any Structured Providers found in a module.
+
+        Parameters
+        ----------
+        module : ModuleType
+            The module to scan for provider classes.
+        """
+
+        for _, obj in inspect.getmembers(module):
+            if (
+                inspect.isclass(obj)
+                and isinstance(obj, StructuredProvider)
+                and obj != StructuredProvider
+            ):
+                cls.register(obj)
@@ -1,20 +1,33 @@
 # File: libs/data/structured/sqlalchemy/__init__.py
 
+from contextlib import contextmanager
 from libs.utils.decorators import staticproperty
 from .interface import QueryFrame
+from .cache import ResultCache
+from .pool import PoolMetrics
+from .snapshot import fingerprint, load_snapshot, save_snapshot, snapshot_key
 from .marshmallow import extend_models as extend_models_marshmallow, schema
 from .utils import extend_models as extend_models_base, name_for_collection_relationship
 from sqlalchemy import (
     create_engine,
+    inspect,
     Column,
     Engine,
     Integer,
     MetaData,
     PrimaryKeyConstraint,
+    Table,
+    TextClause,
+    bindparam,
+    text,
 )
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.automap import automap_base, AutomapBase
-from sqlalchemy.orm import Session
-from typing import Any, Callable, List
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+import importlib
+import threading
 import uuid
 
 MODEL_EXTENSION_STEPS: List[Callable] = [
@@ -23,6 +36,38 @@ MODEL_EXTENSION_STEPS: List[Callable] = [
 ]
 
 
+def prime_table(table: Table) -> None:
+    """
+    Give a primary key to a reflected table without one.
+
+    Parameters
+    ----------
+    table : Table
+        The reflected table.
+
+    Notes
+    -----
+    Primed tables are flagged with `table.info["primed"]`.
+    """
+
+    # Check if the table has a primary key defined
+    if not table.primary_key:
+        # Remember that the database does not enforce the key, so upserts cannot rely on it
+        table.info["primed"] = True
+        # Iterate over each column in the table
+        for col in table.c:
+            # Check if the column name indicates a primary key
+            c = col.name.lower()
+            if c in ["id", "uuid", "guid"] or c[-3:] == "_id":
+                # Set the column as the primary key
+                col.primary_key = True
+                table.append_constraint(PrimaryKeyConstraint(col))
+        # If no primary key is found, add a fake primary key column
+        if not table.primary_key:
+            table.append_column(Column("fake_pk_id", Integer, primary_key=True))
+            table.append_constraint(PrimaryKeyConstraint("fake_pk_id"))
+
+
 class SQLAlchemyStructuredProvider:
     """
     Structured data storage provider using SQLAlchemy.
@@ -171,15 +216,53 @@ class SQLAlchemyStructuredProvider:
             - schemas : List[str]
                 The list of schemas to reflect and consider for models.
                 If provided, the `schema` parameter will be ignored.
+            - snapshot : str or KeyValueProvider
+                Where to keep snapshots of the reflected metadata: a directory path,
+                the handle of a key-value binding, or a key-value provider.
+                Snapshots are reused until the schema fingerprint of the database changes.
+            - snapshot_prefix : str
+                The prefix of the snapshot keys in the key-value binding, by default "".
+            - pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping
+                The connection pool configuration, passed to `create_engine` with
+                the other remaining kwargs. `pool_pre_ping` defaults to True, as does
+                `fast_executemany` on mssql+pyodbc.
+                This parameter is ignored if `engine` is provided.
+            - cache : bool, str or KeyValueProvider
+                Whether query results and counts are cached: True for a private in-memory store,
+                or the handle of a key-value binding, or a key-value provider, by default None.
+            - cache_ttl : float
+                The number of seconds results are served from the cache, by default 60.
+            - cache_prefix : str
+                The prefix of the cache keys in the key-value binding, by default "".
+            - lazy : bool
+                Whether each table is reflected, mapped and extended on first access
+                rather than all of them on initialization, by default False.
+                Lazy providers do not use snapshots, and `get_schema()` only covers the tables mapped so far.
 
         Examples
         --------
         >>> provider = SQLAlchemyStructuredProvider(engine='sqlite:///:memory:')
+        >>> provider = SQLAlchemyStructuredProvider(
+        >>>     url="mssql+pymssql://<username>:<password>@<host>:<port>/<database>",
+        >>>     schemas=["esquire", "dbo"],
+        >>>     snapshot="/var/cache/sqlalchemy",
+        >>> )
+        >>> provider = SQLAlchemyStructuredProvider(
+        >>>     url="mssql+pymssql://<username>:<password>@<host>:<port>/<database>",
+        >>>     schemas=["esquire", "dbo"],
+        >>>     lazy=True,
+        >>> )
+        >>> provider = SQLAlchemyStructuredProvider(
+        >>>     url="mssql+pymssql://<username>:<password>@<host>:<port>/<database>",
+        >>>     pool_size=10,
+        >>>     max_overflow=20,
+        >>>     pool_recycle=1800,
+        >>> )
 
         Notes
         -----
         This method initializes the SQLAlchemyStructuredProvider by setting up the underlying database engine and metadata.
-        It reflects the database tables, prepares the base automap, and extends the models.
+        It reflects the database tables, or loads them from a snapshot, prepares the base automap, and extends the models.
         It also sets up the session and provides access to the models for performing CRUD operations on the structured data.
         """
 
@@ -196,6 +279,30 @@ class SQLAlchemyStructuredProvider:
             "schemas", [s] if (s := kwargs.pop("schema", None)) else None
         )
 
+        # Determine where reflection snapshots are kept (if anywhere)
+        snapshot = kwargs.pop("snapshot", None)
+        snapshot_prefix: str = kwargs.pop("snapshot_prefix", "")
+
+        # Determine whether tables are reflected and mapped on first access
+        self.lazy: bool = kwargs.pop("lazy", False)
+
+        # Set up the result cache (if enabled)
+        cache = kwargs.pop("cache", None)
+        cache_ttl: float = kwargs.pop("cache_ttl", 60)
+        cache_prefix: str = kwargs.pop("cache_prefix", "")
+        self.cache: ResultCache = (
+            ResultCache(cache, cache_ttl, cache_prefix) if cache else None
+        )
+
+        # Check connections before use, since idle connections get dropped by the server
+        if "url" in kw:
+            kwargs.setdefault("pool_pre_ping", True)
+            # Send executemany batches in one round trip where the driver supports it
+            if (url := make_url(kwargs["url"])).get_backend_name() == "mssql" and (
+                url.get_driver_name() == "pyodbc"
+            ):
+                kwargs.setdefault("fast_executemany", True)
+
         # Set up the database engine
         self.engine: Engine = (
             kwargs.pop("engine")
@@ -207,69 +314,253 @@ class SQLAlchemyStructuredProvider:
         if not self.engine:
             raise Exception("No engine configuration values specified.")
 
-        # Create the metadata object
-        self.metadata = MetaData()
-
-        def prime_table(table):
-            # Check if the table has a primary key defined
-            if not table.primary_key:
-                # Iterate over each column in the table
-                for col in table.c:
-                    # Check if the column name indicates a primary key
-                    c = col.name.lower()
-                    if c in ["id", "uuid", "guid"] or c[-3:] == "_id":
-                        # Set the column as the primary key
-                        col.primary_key = True
-                        table.append_constraint(PrimaryKeyConstraint(col))
-                # If no primary key is found, add a fake primary key column
-                if not table.primary_key:
-                    table.append_column(Column("fake_pk_id", Integer, primary_key=True))
-                    table.append_constraint(PrimaryKeyConstraint("fake_pk_id"))
-
-        # Reflect the database tables
+        # Serialize reflection and mapping between threads
+        self.lock = threading.RLock()
+        self.__fks: dict = None
+
+        # Load the reflected metadata from the snapshot, or reflect the database
+        self.metadata: MetaData = (
+            MetaData() if self.lazy else self.load_metadata(snapshot, snapshot_prefix)
+        )
+
+        # Create the base automap
+        self.base: AutomapBase = automap_base(metadata=self.metadata)
+
+        # Measure the connection pool
+        self.metrics = PoolMetrics(self.engine)
+
+        # Set up the session factory. Objects stay readable once their session is closed
+        self.session: sessionmaker = sessionmaker(self.engine, expire_on_commit=False)
+
+        # Prepare the base automap and extend the models
+        self.models = None
+        self.prepare()
+
+    def load_metadata(self, snapshot: Any = None, prefix: str = "") -> MetaData:
+        """
+        Load the reflected metadata from a snapshot, or reflect it.
+
+        Parameters
+        ----------
+        snapshot : Any, optional
+            A directory path, a key-value binding handle, or a key-value provider, by default None.
+            Without a snapshot target, the database is always reflected.
+        prefix : str, optional
+            The prefix of the snapshot key, by default "".
+
+        Returns
+        -------
+        MetaData
+            The reflected metadata, with primary keys primed.
+
+        Notes
+        -----
+        Snapshots are keyed by the URL (without password), the schemas, and a fingerprint of the
+        database schema, so any DDL on the reflected schemas leads to a new reflection.
+        Dialects without a cheap fingerprint are always reflected.
+        """
+
+        if snapshot is None or (digest := fingerprint(self.engine, self.schemas)) is None:
+            return self.reflect()
+        key = f"{prefix}{snapshot_key(self.engine, self.schemas, digest)}"
+        metadata = load_snapshot(snapshot, key)
+        if metadata is None:
+            metadata = self.reflect()
+            save_snapshot(snapshot, key, metadata)
+        return metadata
+
+    def reflect(self) -> MetaData:
+        """
+        Reflect the database tables and views.
+
+        Returns
+        -------
+        MetaData
+            The reflected metadata, with primary keys primed.
+
+        Notes
+        -----
+        Tables without a primary key get one on their id, uuid, guid or *_id columns,
+        or a `fake_pk_id` column, so that automap can map them.
+        """
+
+        metadata = MetaData()
         if self.schemas:
             # Reflect tables for specific schemas
             for s in self.schemas:
                 # Reflect tables for the given schema and include views
-                self.metadata.reflect(bind=self.engine, schema=s, views=True)
-                for table in self.metadata.tables.values():
-                    # Check if the table belongs to the current schema
-                    if table.schema == s:
-                        # Update the table's primary key if necessary
-                        prime_table(table)
+                metadata.reflect(bind=self.engine, schema=s, views=True)
         else:
             # Reflect tables for all schemas and include views
-            self.metadata.reflect(bind=self.engine, views=True)
-            for table in self.metadata.tables.values():
+            metadata.reflect(bind=self.engine, views=True)
+        for table in metadata.tables.values():
+            # Check if the table belongs to a reflected schema, rather than to a referred one
+            if not self.schemas or table.schema in self.schemas:
                 # Update the table's primary key if necessary
                 prime_table(table)
+        return metadata
 
-        # Create the base automap
-        self.base: AutomapBase = automap_base(metadata=self.metadata)
+    def prepare(self) -> list:
+        """
+        Map the reflected tables that are not mapped yet and extend their models.
 
-        # Set up the session
-        self.session: Callable = lambda: Session(self.engine)
+        Returns
+        -------
+        list
+            The newly mapped models.
 
-        # Prepare the base automap
-        self.base.prepare(
-            modulename_for_table=self.modulename_for_table,
-            name_for_collection_relationship=name_for_collection_relationship,
-        )
+        Notes
+        -----
+        Automap only maps the tables added to the metadata since the previous call,
+        and relationships between new and existing models are added to both sides.
+        """
+
+        with self.lock:
+            mapped = set(self.base.registry.mappers)
+            # Prepare the base automap
+            self.base.prepare(
+                modulename_for_table=self.modulename_for_table,
+                name_for_collection_relationship=name_for_collection_relationship,
+            )
+            # Retrieve the models for the provider's ID
+            self.models = self.base.by_module.get(self.id)
+            models = [
+                mapper.class_
+                for mapper in self.base.registry.mappers
+                if mapper not in mapped
+            ]
+            # Extend the models with additional functionality
+            if models:
+                for func in MODEL_EXTENSION_STEPS:
+                    func(models=models, session=self.session)
+            return models
+
+    def model(self, schema_name: str, table_name: str) -> Any:
+        """
+        Get the model of a table, reflecting and mapping it first in lazy mode.
+
+        Parameters
+        ----------
+        schema_name : str
+            The schema name, or None for the default schema.
+        table_name : str
+            The table name.
+
+        Returns
+        -------
+        Any
+            The model of the table.
+
+        Raises
+        ------
+        KeyError
+            If the table does not exist or cannot be mapped.
+
+        Examples
+        --------
+        >>> model = provider.model("dbo", "table1")
+        """
 
-        # Retrieve the models for the provider's ID
-        self.models = self.base.by_module.get(self.id)
-
-        # Extend the models with additional functionality
-        if hasattr(self.models, "keys"):
-            for func in MODEL_EXTENSION_STEPS:
-                func(
-                    models=[
-                        self.models[schema][model]
-                        for schema in self.models.keys()
-                        for model in self.models[schema].keys()
-                    ],
-                    session=self.session,
+        schema_name = schema_name or self.DEFAULT_SCHEMA
+        if (model := self.__mapped(schema_name, table_name)) is None and self.lazy:
+            with self.lock:
+                if (model := self.__mapped(schema_name, table_name)) is None:
+                    self.reflect_table(schema_name, table_name)
+                    self.prepare()
+                    model = self.__mapped(schema_name, table_name)
+        if model is None:
+            raise KeyError(f"{schema_name}{self.RESOURCE_TYPE_DELIMITER}{table_name}")
+        return model
+
+    def reflect_table(self, schema_name: str, table_name: str) -> None:
+        """
+        Reflect a single table or view, with the tables its relationships need.
+
+        Parameters
+        ----------
+        schema_name : str
+            The schema name, or the default schema.
+        table_name : str
+            The table name.
+
+        Raises
+        ------
+        KeyError
+            If the table does not exist.
+
+        Notes
+        -----
+        Automap only adds relationships between models mapped in the same `prepare()` call,
+        so the tables referring to the table are reflected along with it, and the tables
+        referred to by any of them are reflected through their foreign keys.
+        """
+
+        schema = None if schema_name == self.DEFAULT_SCHEMA else schema_name
+        with self.lock:
+            reflected = set(self.metadata.tables)
+            try:
+                self.metadata.reflect(
+                    bind=self.engine, schema=schema, only=[table_name], views=True
                 )
+            except InvalidRequestError:
+                raise KeyError(f"{schema_name}{self.RESOURCE_TYPE_DELIMITER}{table_name}")
+            for (referring_schema, referring_table), keys in self.__foreign_keys().items():
+                if any(
+                    key["referred_schema"] == schema and key["referred_table"] == table_name
+                    for key in keys
+                ):
+                    self.metadata.reflect(
+                        bind=self.engine, schema=referring_schema, only=[referring_table]
+                    )
+            for name, table in self.metadata.tables.items():
+                # Update the primary key of new tables of the reflected schemas if necessary
+                if name not in reflected and (
+                    not self.schemas or table.schema in self.schemas
+                ):
+                    prime_table(table)
+
+    def __foreign_keys(self) -> dict:
+        """
+        Get the foreign keys of the tables of the reflected schemas.
+
+        Returns
+        -------
+        dict
+            The foreign keys of each table, keyed by (schema, table) tuples.
+            They are listed once per provider, in a single query per schema where the dialect allows it.
+        """
+
+        with self.lock:
+            if self.__fks is None:
+                inspector = inspect(self.engine)
+                self.__fks = {
+                    key: value
+                    for schema in self.schemas or [None]
+                    for key, value in inspector.get_multi_foreign_keys(
+                        schema=schema
+                    ).items()
+                }
+            return self.__fks
+
+    def __mapped(self, schema_name: str, table_name: str) -> Any:
+        """
+        Get the model of a table if it is mapped.
+
+        Parameters
+        ----------
+        schema_name : str
+            The schema name.
+        table_name : str
+            The table name.
+
+        Returns
+        -------
+        Any
+            The model of the table, or None.
+        """
+
+        schema = self.models.get(schema_name) if self.models else None
+        return schema.get(table_name) if schema else None
 
     def __getitem__(self, handle):
         """
@@ -295,16 +586,16 @@ class SQLAlchemyStructuredProvider:
         This method retrieves a QueryFrame object for the specified handle, which represents structured data.
         """
 
-        selected = self.models
         selectors = handle.split(self.RESOURCE_TYPE_DELIMITER)
         if self.schemas:
             if selectors[0] not in self.schemas:
                 selectors = [self.schemas[0]] + selectors
         else:
             selectors = [self.DEFAULT_SCHEMA] + selectors
-        for selector in selectors:
+        selected = self.model(*selectors[:2])
+        for selector in selectors[2:]:
             selected = selected[selector]
-        return QueryFrame(selected, self.session)
+        return QueryFrame(selected, self.session, self.cache)
 
     def connect(self) -> Session:
         """
@@ -327,6 +618,54 @@ class SQLAlchemyStructuredProvider:
 
         return self.session()
 
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Open a session for the duration of a block.
+
+        Returns
+        -------
+        Iterator[Session]
+            A SQLAlchemy Session object. The transaction is committed if the block succeeds and
+            rolled back otherwise, and the session is closed, returning its connection to the pool.
+
+        Examples
+        --------
+        >>> with provider.session_scope() as session:
+        >>>     session.add(model(**value))
+        """
+
+        with self.session() as session:
+            with session.begin():
+                yield session
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Connection pool statistics.
+
+        Returns
+        -------
+        Dict[str, float]
+            The pool size and connections checked in, checked out and in overflow, along with
+            the cumulative number of connections opened, checkouts, checkins, invalidations
+            and timeouts, and the total and maximum time checkouts waited, in seconds.
+            With a result cache, its hits, misses, invalidations and errors are prefixed with "cache_".
+
+        Examples
+        --------
+        >>> provider.stats["checked_out"]
+        """
+
+        return {
+            **self.metrics.stats,
+            **(
+                {f"cache_{name}": value for name, value in self.cache.stats.items()}
+                if self.cache
+                else {}
+            ),
+        }
+
     def save(
         self,
         key: str,
@@ -360,18 +699,188 @@ class SQLAlchemyStructuredProvider:
         This method saves a value to the specified key in the structured data storage.
         """
 
-        session = self.session()
         if not model:
             if not table_name and not schema_name:
                 schema_name, table_name, primary_key = self.parse_key(key)
-            model = self.models[schema_name or self.DEFAULT_SCHEMA][table_name]
-        record = session.query(model).get(primary_key)
-        if record:
-            for k, v in value.items():
-                setattr(record, k, v)
-        else:
-            session.add(model(**value))
-        session.commit()
+            model = self.model(schema_name, table_name)
+        with self.session_scope() as session:
+            record = session.get(model, primary_key)
+            if record:
+                for k, v in value.items():
+                    setattr(record, k, v)
+            else:
+                session.add(model(**value))
+        self.invalidate(model)
+
+    def save_many(
+        self,
+        key: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000,
+        schema_name: str = None,
+        table_name: str = None,
+        model: Any = None,
+    ) -> int:
+        """
+        Insert or update several rows of a table in a single transaction.
+
+        Parameters
+        ----------
+        key : str
+            The key of the table, as 'schema.table'.
+        rows : Iterable[Dict[str, Any]]
+            The rows to save, as dictionaries of column values including the primary key.
+        batch_size : int, optional
+            The number of rows sent per statement, by default 1000.
+        schema_name : str, optional
+            The schema name, by default None.
+        table_name : str, optional
+            The table name, by default None.
+        model : Any, optional
+            The model to use, by default None.
+
+        Returns
+        -------
+        int
+            The number of rows saved.
+
+        Examples
+        --------
+        >>> provider.save_many('schema.table', [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+        Notes
+        -----
+        Each batch is sent as one executemany of a dialect-specific upsert: MERGE on SQL Server,
+        and INSERT ... ON CONFLICT DO UPDATE on SQLite and PostgreSQL. Tables with a fake primary key
+        are only inserted into. Other dialects, and SQLite or PostgreSQL tables whose primary key is
+        not enforced by the database, fall back to an UPDATE per row followed by an INSERT when no
+        row was updated. Either all the rows are saved or none is.
+        """
+
+        if not model:
+            if not table_name and not schema_name:
+                schema_name, table_name, _ = self.parse_key(key)
+            model = self.model(schema_name, table_name)
+        table: Table = model.__table__
+        saved = 0
+        with self.engine.begin() as connection:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == batch_size:
+                    saved += self.__upsert(connection, table, batch)
+                    batch = []
+            if batch:
+                saved += self.__upsert(connection, table, batch)
+        self.invalidate(model)
+        return saved
+
+    def __upsert(self, connection: Connection, table: Table, rows: List[dict]) -> int:
+        """
+        Insert or update a batch of rows.
+
+        Parameters
+        ----------
+        connection : Connection
+            The connection, within a transaction.
+        table : Table
+            The table.
+        rows : List[dict]
+            The rows to save.
+
+        Returns
+        -------
+        int
+            The number of rows saved.
+        """
+
+        # Rows are sent together only if they set the same columns, so that no column is overwritten with NULL
+        groups: Dict[tuple, List[dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+        keys = [column.name for column in table.primary_key]
+        dialect = self.engine.dialect.name
+        for columns, group in groups.items():
+            values = [column for column in columns if column not in keys]
+            if "fake_pk_id" in keys:
+                connection.execute(table.insert(), group)
+            elif dialect == "mssql":
+                connection.execute(
+                    self.__merge(table, columns, keys),
+                    [{f"p{i}": row[column] for i, column in enumerate(columns)} for row in group],
+                )
+            elif dialect in ("sqlite", "postgresql") and not table.info.get("primed"):
+                insert = importlib.import_module(f"sqlalchemy.dialects.{dialect}").insert(
+                    table
+                )
+                connection.execute(
+                    insert.on_conflict_do_update(
+                        index_elements=keys,
+                        set_={column: insert.excluded[column] for column in values},
+                    )
+                    if values
+                    else insert.on_conflict_do_nothing(index_elements=keys),
+                    group,
+                )
+            else:
+                for row in group:
+                    where = [table.c[key] == row[key] for key in keys]
+                    if values:
+                        updated = connection.execute(
+                            table.update()
+                            .where(*where)
+                            .values({column: row[column] for column in values})
+                        ).rowcount
+                    else:
+                        updated = connection.execute(
+                            table.select().where(*where).limit(1)
+                        ).first()
+                    if not updated:
+                        connection.execute(table.insert().values(row))
+        return len(rows)
+
+    def __merge(self, table: Table, columns: tuple, keys: List[str]) -> TextClause:
+        """
+        Build a SQL Server MERGE statement upserting one row.
+
+        Parameters
+        ----------
+        table : Table
+            The table.
+        columns : tuple
+            The columns set by the rows.
+        keys : List[str]
+            The primary key columns.
+
+        Returns
+        -------
+        TextClause
+            The statement, with the parameters p0, p1, ... bound to the columns in order,
+            to be executed with many rows.
+        """
+
+        quote = self.engine.dialect.identifier_preparer.quote
+        target = self.engine.dialect.identifier_preparer.format_table(table)
+        names = [quote(column) for column in columns]
+        parameters = [f":p{i}" for i in range(len(columns))]
+        values = [quote(column) for column in columns if column not in keys]
+        return text(
+            f"MERGE INTO {target} WITH (HOLDLOCK) AS target "
+            f"USING (VALUES ({', '.join(parameters)})) AS source ({', '.join(names)}) "
+            f"ON {' AND '.join(f'target.{quote(key)} = source.{quote(key)}' for key in keys)} "
+            + (
+                f"WHEN MATCHED THEN UPDATE SET {', '.join(f'target.{name} = source.{name}' for name in values)} "
+                if values
+                else ""
+            )
+            + f"WHEN NOT MATCHED THEN INSERT ({', '.join(names)}) "
+            f"VALUES ({', '.join(f'source.{name}' for name in names)});"
+        ).bindparams(
+            *(
+                bindparam(f"p{i}", type_=table.c[column].type)
+                for i, column in enumerate(columns)
+            )
+        )
 
     def load(
         self,
@@ -406,14 +915,16 @@ class SQLAlchemyStructuredProvider:
         Notes
         -----
         This method loads a value from the specified key in the structured data storage.
+        The session is closed before returning, so the record is detached: its columns stay readable,
+        while its relationships have to be loaded within `session_scope()`.
         """
 
-        session = self.session()
         if not model:
             if not table_name and not schema_name:
                 schema_name, table_name, primary_key = self.parse_key(key)
-            model = self.models[schema_name or self.DEFAULT_SCHEMA][table_name]
-        return session.query(model).get(primary_key)
+            model = self.model(schema_name, table_name)
+        with self.session() as session:
+            return session.get(model, primary_key)
 
     def filter(
         self, filters: List[str], decoder: Callable = None, **kwargs
@@ -477,13 +988,36 @@ class SQLAlchemyStructuredProvider:
         This method deletes the record with the specified key from the structured data storage.
         """
 
-        session = self.session()
         if not model:
             if not table_name and not schema_name:
                 schema_name, table_name, primary_key = self.parse_key(key)
-            model = self.models[schema_name or self.DEFAULT_SCHEMA][table_name]
-        session.delete(session.query(model).get(primary_key))
-        session.commit()
+            model = self.model(schema_name, table_name)
+        with self.session_scope() as session:
+            session.delete(session.get(model, primary_key))
+        self.invalidate(model)
+
+    def invalidate(self, model: Any) -> None:
+        """
+        Invalidate the cached results reading the table of a model.
+
+        Parameters
+        ----------
+        model : Any
+            The model whose table was written to.
+
+        Examples
+        --------
+        >>> provider.invalidate(provider.model("dbo", "table1"))
+
+        Notes
+        -----
+        Writes through `save()`, `save_many()` and `drop()` invalidate their table. Writes made
+        through other means, such as sessions or other processes not sharing the cache binding,
+        are only picked up once cached results expire.
+        """
+
+        if self.cache:
+            self.cache.invalidate([model.__table__.fullname])
 
     def parse_key(self, key: str):
         """
@@ -0,0 +1,357 @@
+from collections import OrderedDict
+from libs.data.key_value import is_missing
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.util import find_tables
+from typing import Any, Callable, Dict, Iterable, Tuple
+import hashlib
+import pickle
+import threading
+import time
+
+
+class ResultCache:
+    """
+    Cache of query results backed by a key-value binding.
+
+    Entries are keyed by the compiled statement, its bound parameters, and the write versions
+    of the tables it reads. Writing to a table bumps its version, which makes every entry reading
+    the table unreachable, so invalidation costs one write however many entries there are.
+    Versions are kept in the binding itself, so processes sharing a remote binding see each
+    other's invalidations. Any key-value binding works: the not-found errors of each provider,
+    such as FileNotFoundError or ResourceNotFoundError, count as misses.
+
+    Entries are pickled, and unpickled when read, so the binding must only be writable by
+    trusted processes: anyone able to write to a shared binding can run code in every reader.
+    """
+
+    def __init__(self, store: Any = True, ttl: float = 60, prefix: str = "") -> None:
+        """
+        Initialize an instance of ResultCache.
+
+        Parameters
+        ----------
+        store : Any, optional
+            The handle of a key-value binding, a key-value provider, or True for a private
+            in-memory store, by default True.
+        ttl : float, optional
+            The number of seconds a result is served from the cache, by default 60.
+        prefix : str, optional
+            The prefix of the keys in the binding, by default "".
+        """
+
+        if store is True:
+            from libs.data.key_value.ram import MemoryKeyValueProvider
+
+            store = MemoryKeyValueProvider(max_entries=4096)
+        self.store = store
+        self.ttl = ttl
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.__stats = {"hits": 0, "misses": 0, "invalidations": 0, "errors": 0}
+
+    @property
+    def provider(self) -> Any:
+        """
+        The key-value provider holding the cache.
+
+        Returns
+        -------
+        Any
+            The provider bound to the `store` handle, or the `store` provider itself.
+        """
+
+        if isinstance(self.store, str):
+            from libs.data import from_bind
+
+            return from_bind(self.store)
+        return self.store
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of hits, misses, table invalidations, and failed cache reads or writes.
+        """
+
+        with self.lock:
+            return dict(self.__stats)
+
+    def get(
+        self, statement: ClauseElement, kind: str, dialect: Any, compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Get the cached result of a statement, computing and caching it on a miss.
+
+        Parameters
+        ----------
+        statement : ClauseElement
+            The statement.
+        kind : str
+            The kind of result, such as "rows" or "count", which is part of the key.
+        dialect : Any
+            The dialect the statement is compiled with.
+        compute : Callable[[], Any]
+            The function computing the result. It must return a picklable value.
+
+        Returns
+        -------
+        Any
+            The result.
+
+        Notes
+        -----
+        A failing cache is bypassed: the result is computed and the failure is counted.
+        """
+
+        key = None
+        try:
+            key = self.__key(statement, kind, dialect)
+            expires, value = self.provider.load(key, decoder=_loads)
+            if expires > time.time():
+                self.__count("hits")
+                return value
+        except Exception as e:
+            if not is_missing(e) or key is None:
+                self.__count("errors")
+                return compute()
+        self.__count("misses")
+        value = compute()
+        try:
+            self.provider.save(key, (time.time() + self.ttl, value), encoder=_dumps)
+        except Exception:
+            self.__count("errors")
+        return value
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """
+        Invalidate the cached results reading any of the given tables.
+
+        Parameters
+        ----------
+        tables : Iterable[str]
+            The full names of the tables, as 'schema.table' or 'table'.
+        """
+
+        for table in tables:
+            try:
+                self.provider.save(
+                    self.__version_key(table), time.time_ns(), encoder=_dumps
+                )
+                self.__count("invalidations")
+            except Exception:
+                self.__count("errors")
+
+    def __key(self, statement: ClauseElement, kind: str, dialect: Any) -> str:
+        """
+        Get the key of a statement's result.
+
+        Parameters
+        ----------
+        statement : ClauseElement
+            The statement.
+        kind : str
+            The kind of result.
+        dialect : Any
+            The dialect the statement is compiled with.
+
+        Returns
+        -------
+        str
+            The key, derived from the SQL, the bound parameters and the versions of the tables read.
+        """
+
+        sql, params = STATEMENTS.sql(statement, dialect)
+        tables = STATEMENTS.tables(statement)
+        versions = []
+        for table in tables:
+            try:
+                versions.append(self.provider.load(self.__version_key(table), decoder=_loads))
+            except Exception as e:
+                if not is_missing(e):
+                    raise
+                versions.append(0)
+        identity = repr(
+            (kind, sql, params, list(zip(tables, versions)))
+        )
+        return f"{self.prefix}result:{hashlib.sha256(identity.encode()).hexdigest()}"
+
+    def __version_key(self, table: str) -> str:
+        """
+        Get the key of a table's write version.
+
+        Parameters
+        ----------
+        table : str
+            The full name of the table.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+
+        return f"{self.prefix}version:{table}"
+
+    def __count(self, name: str) -> None:
+        """
+        Increment a counter.
+
+        Parameters
+        ----------
+        name : str
+            The counter to increment.
+        """
+
+        with self.lock:
+            self.__stats[name] += 1
+
+
+class StatementCache:
+    """
+    Bounded cache of compiled SQL, shared by every query frame.
+
+    Entries are keyed by the cache keys SQLAlchemy generates for statements, which describe
+    their shape (entities, columns, filter structure, sort, limit) and leave out the values of
+    bound parameters. Statements of the same shape therefore share one compiled string, and the
+    values of a new execution are read from its cache key instead of compiling it again.
+    Statements SQLAlchemy cannot generate a cache key for are compiled every time.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Initialize an instance of StatementCache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The number of entries kept, least recently used first out, by default 512.
+        """
+
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.__entries = OrderedDict()
+
+    def sql(self, statement: ClauseElement, dialect: Any) -> Tuple[str, list]:
+        """
+        Get the SQL of a statement and the values of its bound parameters.
+
+        Parameters
+        ----------
+        statement : ClauseElement
+            The statement.
+        dialect : Any
+            The dialect the statement is compiled with.
+
+        Returns
+        -------
+        Tuple[str, list]
+            The SQL with parameter placeholders, and the values of the parameters in the order
+            they appear in the statement.
+        """
+
+        key = statement._generate_cache_key()
+        if key is None:
+            compiled = statement.compile(dialect=dialect)
+            return str(compiled), sorted(compiled.params.items())
+        sql = self.__get(
+            ("sql", dialect, key.key), lambda: str(statement.compile(dialect=dialect))
+        )
+        return sql, [bind.effective_value for bind in key.bindparams]
+
+    def literal(
+        self, statement: ClauseElement, dialect: Any, render: Callable[[str], str] = str
+    ) -> str:
+        """
+        Get the SQL of a statement with the values of its parameters rendered inline.
+
+        Parameters
+        ----------
+        statement : ClauseElement
+            The statement.
+        dialect : Any
+            The dialect the statement is compiled with.
+        render : Callable[[str], str], optional
+            A function post-processing the SQL, such as a formatter, by default str.
+            It must be the same function for every call.
+
+        Returns
+        -------
+        str
+            The rendered SQL.
+        """
+
+        compile = lambda: render(
+            str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        )
+        key = statement._generate_cache_key()
+        if key is None:
+            return compile()
+        values = repr([bind.effective_value for bind in key.bindparams])
+        return self.__get(("literal", dialect, key.key, values), compile)
+
+    def tables(self, statement: ClauseElement) -> list:
+        """
+        Get the tables a statement reads.
+
+        Parameters
+        ----------
+        statement : ClauseElement
+            The statement.
+
+        Returns
+        -------
+        list
+            The sorted full names of the tables.
+        """
+
+        find = lambda: sorted(
+            {table.fullname for table in find_tables(statement, include_joins=False)}
+        )
+        key = statement._generate_cache_key()
+        if key is None:
+            return find()
+        return self.__get(("tables", key.key), find)
+
+    def __get(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Get an entry, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the entry.
+        compute : Callable[[], Any]
+            The function computing the entry.
+
+        Returns
+        -------
+        Any
+            The entry.
+        """
+
+        with self.lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return self.__entries[key]
+        value = compute()
+        with self.lock:
+            self.__entries[key] = value
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+        return value
+
+
+# Compiled SQL is independent of the provider, so every query frame shares one cache.
+STATEMENTS = StatementCache()
+
+
+def _dumps(value: Any, **kwargs) -> bytes:
+    return pickle.dumps(value, protocol=5)
+
+
+def _loads(data: Any, **kwargs) -> Any:
+    return pickle.loads(data.read() if hasattr(data, "read") else data)
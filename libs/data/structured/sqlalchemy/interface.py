@@ -1,9 +1,24 @@
 from marshmallow import Schema
-from sqlalchemy import Column
+from sqlalchemy import Column, Select, and_, func, or_, select
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import InstrumentedAttribute, Mapper, Query, Session
-from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
-from typing import Any, List
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapper,
+    Query,
+    Session,
+    make_transient_to_detached,
+)
+from sqlalchemy.orm.attributes import instance_state
+from sqlalchemy.sql import operators, sqltypes
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BooleanClauseList,
+    ColumnElement,
+    UnaryExpression,
+)
+from sqlalchemy.sql.type_api import TypeEngine
+from typing import Any, Callable, Iterator, List, Tuple
+from .cache import STATEMENTS
 
 
 class QueryFrame:
@@ -14,8 +29,8 @@ class QueryFrame:
     ----------
     model : Any
         The SQLAlchemy model class.
-    session : Session
-        The SQLAlchemy Session object.
+    session : Callable
+        The SQLAlchemy session factory. Each execution opens and closes its own session.
 
     Attributes
     ----------
@@ -23,8 +38,8 @@ class QueryFrame:
         The SQLAlchemy model class.
     __mapper : Mapper
         The SQLAlchemy Mapper object.
-    __session : Session
-        The SQLAlchemy Session object.
+    __session : Callable
+        The SQLAlchemy session factory.
     __select : List[InstrumentedAttribute]
         The list of selected fields.
     __ops : List[Tuple[str, BinaryExpression or BooleanClauseList]]
@@ -42,8 +57,14 @@ class QueryFrame:
         Retrieve items from the query frame.
     __build__(self) -> Query
         Build the SQLAlchemy query object.
+    __statement__(self) -> Select
+        Get the select statement of the query frame.
     __call__(self, key: str = None)
         Execute the query and retrieve the results.
+    __iter__(self)
+        Iterate over the query results, streaming them in batches.
+    iter_batches(self, size: int = 1000)
+        Execute the query and retrieve the results in batches.
     __len__(self) -> int
         Get the count of query results.
     __repr__(self) -> str
@@ -54,22 +75,28 @@ class QueryFrame:
         Handle slicing operations on the query frame.
     sort_values(self, *args)
         Sort the query results based on the given columns.
-    to_pandas(self)
+    after(self, cursor: Any)
+        Restrict the query to the rows after a cursor in the sort order.
+    page(self, size: int)
+        Execute the query and retrieve the first page of results after the cursor.
+    to_pandas(self, dtype_backend: str = None, chunksize: int = None)
         Convert the query results to a pandas DataFrame.
+    to_arrow(self, batch_size: int = 65536)
+        Convert the query results to an Arrow table.
 
     Examples
     --------
-    >>> from sqlalchemy.orm import Session
+    >>> from sqlalchemy.orm import sessionmaker
     >>> from libs.data.structured.sqlalchemy.interface import QueryFrame
     >>> from myapp.models import MyModel
 
-    >>> session = Session()
+    >>> session = sessionmaker(engine)
     >>> query_frame = QueryFrame(MyModel, session)
     >>> query_frame['column_name']
     >>> # Perform actions with the retrieved attribute.
     """
 
-    def __init__(self, model: Any, session: Session) -> None:
+    def __init__(self, model: Any, session: Callable, cache: Any = None) -> None:
         """
         Initialize a QueryFrame instance.
 
@@ -77,8 +104,10 @@ class QueryFrame:
         ----------
         model : Any
             The SQLAlchemy model class.
-        session : Session
-            The SQLAlchemy Session object.
+        session : Callable
+            The SQLAlchemy session factory.
+        cache : ResultCache, optional
+            The cache of query results and counts, by default None.
         """
 
         self.__model = model
@@ -89,7 +118,11 @@ class QueryFrame:
         self.__sort = ()
         self.__limit = 0
         self.__offset = 0
-    
+        self.__after = None
+        self.__counts = {}
+        self.__cache = cache
+        self.__statements = None
+
     @property
     def schema(self) -> Schema:
         pass
@@ -145,10 +178,16 @@ class QueryFrame:
                 self.__slice(key)
         return self
 
-    def __build__(self) -> Query:
+    def __build__(self, session: Session = None) -> Query:
         """
         Build the SQLAlchemy query object.
 
+        Parameters
+        ----------
+        session : Session, optional
+            The session the query runs in, by default a new session.
+            Callers passing no session are responsible for closing the query's session.
+
         Returns
         -------
         Query
@@ -156,12 +195,14 @@ class QueryFrame:
         """
 
         query: Query = (
-            self.__session()
+            (session or self.__session())
             .query(*(self.__select or [self.__model]))
             .select_from(self.__model)
         )
         for op in self.__ops:
             query = getattr(query, op[0])(op[1])
+        if self.__after is not None:
+            query = query.where(self.__seek(self.__after))
         if len(self.__sort):
             query = query.order_by(*self.__sort)
             if self.__limit:
@@ -170,6 +211,78 @@ class QueryFrame:
                 query = query.offset(self.__offset)
         return query
 
+    def __statement__(self) -> Select:
+        """
+        Get the select statement of the query frame.
+
+        Returns
+        -------
+        Select
+            The SQLAlchemy select statement, equivalent to the statement of `__build__()`.
+
+        Notes
+        -----
+        The statement is built once per shape of the query frame (selected fields, filters, cursor,
+        sort, limit and offset) and reused until the shape changes, so repeated executions skip
+        building it. Its compiled form is cached by SQLAlchemy under the statement's cache key,
+        which leaves out the values of bound parameters.
+        """
+
+        shape = self.__shape()
+        if self.__statements is None or self.__statements[0] != shape:
+            statement: Select = select(*(self.__select or [self.__model])).select_from(
+                self.__model
+            )
+            for op in self.__ops:
+                statement = getattr(statement, op[0])(op[1])
+            if self.__after is not None:
+                statement = statement.where(self.__seek(self.__after))
+            if len(self.__sort):
+                statement = statement.order_by(*self.__sort)
+                if self.__limit:
+                    statement = statement.limit(self.__limit)
+                if self.__offset:
+                    statement = statement.offset(self.__offset)
+            self.__statements = (shape, statement, None)
+        return self.__statements[1]
+
+    def __count_statement(self) -> Select:
+        """
+        Get the statement counting the results of the query frame.
+
+        Returns
+        -------
+        Select
+            The SQLAlchemy select statement, reused until the shape of the query frame changes.
+        """
+
+        statement = self.__statement__()
+        shape, _, count = self.__statements
+        if count is None:
+            count = select(func.count()).select_from(statement.subquery())
+            self.__statements = (shape, statement, count)
+        return count
+
+    def __shape(self) -> tuple:
+        """
+        Get the shape of the query frame.
+
+        Returns
+        -------
+        tuple
+            The identities of the selected fields, filters and sort columns, which the query frame
+            holds on to, and the cursor, limit and offset.
+        """
+
+        return (
+            tuple(map(id, self.__select)),
+            tuple((op[0], id(op[1])) for op in self.__ops),
+            tuple(map(id, self.__sort)),
+            self.__after,
+            self.__limit,
+            self.__offset,
+        )
+
     def __call__(self, key: str = None) -> List[Any]:
         """
         Execute the query and retrieve the results.
@@ -188,11 +301,138 @@ class QueryFrame:
         --------
         >>> results = query_frame()
         >>> # Perform actions with the retrieved results.
+
+        Notes
+        -----
+        With a result cache, results served from the cache are detached model objects built
+        from the cached column values, or the cached rows of the selected fields.
         """
 
-        if key:
-            return self.__session().query(self.__model).get(key)
-        return self.__build__().all()
+        with self.__session() as session:
+            if key:
+                return session.get(self.__model, key)
+            statement = self.__statement__()
+            execute = lambda: (
+                session.execute(statement).all()
+                if self.__select
+                else session.execute(statement).scalars().all()
+            )
+            if self.__cache is None:
+                return execute()
+            return self.__restore(
+                self.__cache.get(
+                    statement,
+                    "rows",
+                    session.bind.dialect,
+                    lambda: self.__flatten(execute()),
+                )
+            )
+
+    def __flatten(self, results: List[Any]) -> List[Any]:
+        """
+        Convert query results into plain values that can be cached.
+
+        Parameters
+        ----------
+        results : List[Any]
+            The model objects, or the rows of the selected fields.
+
+        Returns
+        -------
+        List[Any]
+            The column values of each model object as a dictionary, or the rows themselves,
+            which pickle with their field names.
+        """
+
+        if self.__select:
+            return list(results)
+        attributes = [attribute.key for attribute in self.__mapper.column_attrs]
+        return [
+            {attribute: getattr(result, attribute) for attribute in attributes}
+            for result in results
+        ]
+
+    def __restore(self, values: List[Any]) -> List[Any]:
+        """
+        Convert cached values back into query results.
+
+        Parameters
+        ----------
+        values : List[Any]
+            The cached values.
+
+        Returns
+        -------
+        List[Any]
+            Detached model objects, or rows of the selected fields.
+        """
+
+        if self.__select:
+            return values
+        # Objects are created without running the constructor and attribute events,
+        # then marked as detached copies of their rows
+        manager = self.__mapper.class_manager
+        results = []
+        for value in values:
+            result = manager.new_instance()
+            instance_state(result).dict.update(value)
+            make_transient_to_detached(result)
+            results.append(result)
+        return results
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the query results, streaming them in batches.
+
+        Returns
+        -------
+        Iterator[Any]
+            The model objects, or the rows of the selected fields.
+
+        Examples
+        --------
+        >>> for record in query_frame:
+        >>>     print(record)
+        """
+
+        for batch in self.iter_batches():
+            yield from batch
+
+    def iter_batches(self, size: int = 1000) -> Iterator[List[Any]]:
+        """
+        Execute the query and retrieve the results in batches.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of results per batch, by default 1000.
+
+        Returns
+        -------
+        Iterator[List[Any]]
+            Lists of model objects, or of rows of the selected fields.
+
+        Examples
+        --------
+        >>> for batch in query_frame.iter_batches(10000):
+        >>>     export(batch)
+
+        Notes
+        -----
+        The results are fetched from a server-side cursor where the driver supports one, and built
+        into objects one batch at a time, so memory stays bounded by the batch size. The session stays
+        open until the iterator is exhausted or closed.
+        """
+
+        with self.__session() as session:
+            result = session.execute(
+                self.__statement__(),
+                execution_options={"yield_per": size, "stream_results": True},
+            )
+            if not self.__select:
+                result = result.scalars()
+            for partition in result.partitions():
+                yield partition
 
     def __len__(self) -> int:
         """
@@ -207,9 +447,25 @@ class QueryFrame:
         --------
         >>> len(query_frame)
         >>> # Perform actions with the count.
+
+        Notes
+        -----
+        Without a result cache, counts are memoized per statement and bound parameters for the
+        life of the query frame, so repeated calls and slices of the same query scan the table once,
+        and never see later writes. With a result cache, counts go through the cache instead,
+        which drops them when the provider writes to the table.
         """
 
-        return self.__build__().count()
+        statement = self.__count_statement()
+        with self.__session() as session:
+            count = lambda: session.execute(statement).scalar()
+            if self.__cache is not None:
+                return self.__cache.get(statement, "count", session.bind.dialect, count)
+            key = STATEMENTS.sql(statement, session.bind.dialect)
+            key = (key[0], repr(key[1]))
+            if key not in self.__counts:
+                self.__counts[key] = count()
+            return self.__counts[key]
 
     def __repr__(self) -> str:
         """
@@ -223,21 +479,16 @@ class QueryFrame:
         Examples
         --------
         >>> print(query_frame)
-        """
 
-        query = self.__build__()
-        query_string = str(
-            query.statement.compile(
-                bind=self.__session().bind,
-                compile_kwargs={"literal_binds": True},
-            )
-        )
-        try:
-            from sql_formatter.core import format_sql
+        Notes
+        -----
+        Rendered strings are cached per statement shape and parameter values, so printing the same
+        query again skips compiling and formatting it.
+        """
 
-            return format_sql(query_string)
-        except:
-            return query_string
+        with self.__session() as session:
+            dialect = session.bind.dialect
+        return STATEMENTS.literal(self.__statement__(), dialect, format_query)
 
     def __getitem_field(self, key):
         """
@@ -281,12 +532,7 @@ class QueryFrame:
         >>> # Perform actions with the sliced results.
         """
 
-        if not len(self.__sort):
-            self.__sort = [key for key in self.__mapper.primary_key]
-            if len(self.__select):
-                match self.__select[0]:
-                    case InstrumentedAttribute():
-                        self.__sort = [self.__select[0]]
+        self.__default_sort()
         start = 0
         stop = 0
         count = 0
@@ -297,11 +543,11 @@ class QueryFrame:
         ):
             self.__limit = 0
             self.__offset = 0
-            count = self.__build__().count()
-            if key.start < 0:
+            count = len(self)
+            if (key.start or 0) < 0:
                 start = key.start + count
             else:
-                start = key.start
+                start = key.start or 0
             if key.stop == None or key.stop <= 0:
                 stop = (key.stop or 0) + count
             else:
@@ -311,6 +557,148 @@ class QueryFrame:
             stop = key.stop or 0
         self.__limit = stop - start
         self.__offset = start
+
+    def __default_sort(self) -> None:
+        """
+        Sort by the primary key, or by the first selected field, unless a sort is set.
+        """
+
+        if not len(self.__sort):
+            self.__sort = [key for key in self.__mapper.primary_key]
+            if len(self.__select):
+                match self.__select[0]:
+                    case InstrumentedAttribute():
+                        self.__sort = [self.__select[0]]
+
+    def __sort_keys(self) -> List[Tuple[Any, bool]]:
+        """
+        Get the columns of the sort and their directions.
+
+        Returns
+        -------
+        List[Tuple[Any, bool]]
+            The (column, descending) pairs of the sort.
+        """
+
+        keys = []
+        for column in self.__sort:
+            if isinstance(column, UnaryExpression) and column.modifier in (
+                operators.desc_op,
+                operators.asc_op,
+            ):
+                keys.append((column.element, column.modifier is operators.desc_op))
+            else:
+                keys.append((column, False))
+        return keys
+
+    def __seek(self, cursor: tuple) -> ColumnElement:
+        """
+        Build the condition selecting the rows that come after a cursor in the sort order.
+
+        Parameters
+        ----------
+        cursor : tuple
+            The values of the sort columns of the last row seen.
+
+        Returns
+        -------
+        ColumnElement
+            The condition, as nested comparisons rather than a row-value comparison,
+            which SQL Server does not support.
+        """
+
+        condition = None
+        for (column, descending), value in reversed(
+            list(zip(self.__sort_keys(), cursor))
+        ):
+            after = column < value if descending else column > value
+            condition = after if condition is None else or_(
+                after, and_(column == value, condition)
+            )
+        return condition
+
+    def after(self, cursor: Any) -> "QueryFrame":
+        """
+        Restrict the query to the rows after a cursor in the sort order (keyset pagination).
+
+        Parameters
+        ----------
+        cursor : Any
+            The last row seen, as a model object or a row of the selected fields, or the tuple
+            of its values of the sort columns. None removes the restriction.
+
+        Returns
+        -------
+        QueryFrame
+            The query frame itself.
+
+        Raises
+        ------
+        ValueError
+            If the cursor does not hold a value for every sort column, or if a tuple cursor
+            holds more or fewer values than there are sort columns.
+
+        Examples
+        --------
+        >>> rows = query_frame.page(1000)
+        >>> while rows:
+        >>>     # Perform actions with the page.
+        >>>     rows = query_frame.after(rows[-1]).page(1000)
+
+        Notes
+        -----
+        Unlike offsets, which scan every skipped row, the cursor is a range condition on the sort
+        columns, so deep pages cost the same as the first one given an index on those columns.
+        The sort defaults to the primary key, and should be unique for pages not to skip rows.
+        """
+
+        self.__default_sort()
+        if cursor is None or isinstance(cursor, tuple) and not hasattr(cursor, "_mapping"):
+            if cursor is not None and len(cursor) != len(self.__sort_keys()):
+                raise ValueError(
+                    f"The cursor holds {len(cursor)} values for {len(self.__sort_keys())} sort columns."
+                )
+            self.__after = cursor
+        else:
+            values = []
+            for column, _ in self.__sort_keys():
+                mapping = getattr(cursor, "_mapping", None)
+                if mapping is not None and column in mapping:
+                    values.append(mapping[column])
+                elif mapping is not None and column.key in mapping:
+                    # Rows served from the result cache are only keyed by field names
+                    values.append(mapping[column.key])
+                elif mapping is None and hasattr(cursor, column.key):
+                    values.append(getattr(cursor, column.key))
+                else:
+                    raise ValueError(f"The cursor holds no value for the sort column {column.key}.")
+            self.__after = tuple(values)
+        return self
+
+    def page(self, size: int) -> List[Any]:
+        """
+        Execute the query and retrieve the first page of results after the cursor.
+
+        Parameters
+        ----------
+        size : int
+            The number of results per page.
+
+        Returns
+        -------
+        List[Any]
+            The results of the page, in the sort order.
+
+        Examples
+        --------
+        >>> first = query_frame.page(100)
+        >>> second = query_frame.after(first[-1]).page(100)
+        """
+
+        self.__default_sort()
+        self.__limit = size
+        self.__offset = 0
+        return self()
         
     def sort_values(self, *args):
         self.__sort = args
@@ -335,14 +723,23 @@ class QueryFrame:
         """
         self.__sort = args
 
-    def to_pandas(self):
+    def to_pandas(self, dtype_backend: str = None, chunksize: int = None):
         """
         Convert the query results to a pandas DataFrame.
 
+        Parameters
+        ----------
+        dtype_backend : str, optional
+            The dtype backend of the DataFrame: "pyarrow" for Arrow-backed columns built from
+            `to_arrow()`, "numpy_nullable", or None for NumPy dtypes, by default None.
+        chunksize : int, optional
+            The number of rows per DataFrame. If given, an iterator of DataFrames is returned,
+            by default None.
+
         Returns
         -------
-        pd.DataFrame
-            The pandas DataFrame representing the query results.
+        pd.DataFrame or Iterator[pd.DataFrame]
+            The pandas DataFrame representing the query results, or an iterator of DataFrames.
 
         Raises
         ------
@@ -352,11 +749,231 @@ class QueryFrame:
         Examples
         --------
         >>> df = query_frame.to_pandas()
-        >>> # Perform actions with the DataFrame.
+        >>> df = query_frame.to_pandas(dtype_backend="pyarrow")
+        >>> for chunk in query_frame.to_pandas(dtype_backend="pyarrow", chunksize=100000):
+        >>>     # Perform actions with each DataFrame.
+
+        Notes
+        -----
+        The statement is executed with bound parameters, rather than rendered with literal values.
         """
 
         try:
             import pandas as pd
         except:
             raise Exception("Pandas is not installed.")
-        return pd.read_sql(str(self), self.__session().connection())
+        if dtype_backend == "pyarrow":
+            if chunksize:
+                return (
+                    batch.to_pandas(types_mapper=pd.ArrowDtype)
+                    for batch in self.__arrow_batches(chunksize)
+                )
+            return self.to_arrow().to_pandas(types_mapper=pd.ArrowDtype)
+        kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
+        if chunksize:
+            return self.__read_sql(chunksize=chunksize, **kwargs)
+        with self.__session() as session:
+            return pd.read_sql(self.__statement__(), session.connection(), **kwargs)
+
+    def to_arrow(self, batch_size: int = 65536):
+        """
+        Convert the query results to an Arrow table.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The number of rows fetched and converted at a time, by default 65536.
+
+        Returns
+        -------
+        pa.Table
+            The Arrow table representing the query results.
+
+        Raises
+        ------
+        Exception
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> table = query_frame.to_arrow()
+
+        Notes
+        -----
+        Rows are fetched in batches, transposed, and converted column by column into Arrow arrays
+        typed after the SQL types of the selected columns, without building ORM objects.
+        """
+
+        try:
+            import pyarrow as pa
+        except:
+            raise Exception("PyArrow is not installed.")
+        batches = list(self.__arrow_batches(batch_size))
+        if not batches:
+            columns = self.__statement__().selected_columns
+            return pa.table(
+                {
+                    column.name: pa.array([], type=arrow_type(column.type) or pa.null())
+                    for column in columns
+                }
+            )
+        # Columns inferred as null in some batches are promoted to the type of the others
+        return pa.concat_tables(
+            [pa.Table.from_batches([batch]) for batch in batches],
+            promote_options="default",
+        )
+
+    def __arrow_batches(self, size: int):
+        """
+        Execute the query and convert the results into Arrow record batches.
+
+        Parameters
+        ----------
+        size : int
+            The number of rows per batch.
+
+        Returns
+        -------
+        Iterator[pa.RecordBatch]
+            The record batches.
+
+        Notes
+        -----
+        Rows are fetched straight from the DBAPI cursor, skipping SQLAlchemy's row objects and
+        result processing. Each column is converted into an Arrow array from the raw driver values
+        and cast to the Arrow type of its SQL type, so that, for instance, SQLite date strings
+        become timestamps.
+        """
+
+        import pyarrow as pa
+
+        with self.__session() as session:
+            statement = self.__statement__()
+            types = [arrow_type(column.type) for column in statement.selected_columns]
+            result = session.connection().execute(statement)
+            try:
+                names = list(result.keys())
+                while rows := result.cursor.fetchmany(size):
+                    yield pa.RecordBatch.from_arrays(
+                        [
+                            arrow_array(column, type_)
+                            for column, type_ in zip(zip(*rows), types)
+                        ],
+                        names=names,
+                    )
+            finally:
+                result.close()
+
+    def __read_sql(self, **kwargs):
+        """
+        Execute the query and read the results into DataFrames of `chunksize` rows.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The keyword arguments of `pd.read_sql`.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            The DataFrames. The session stays open until the iterator is exhausted or closed.
+        """
+
+        import pandas as pd
+
+        with self.__session() as session:
+            yield from pd.read_sql(self.__statement__(), session.connection(), **kwargs)
+
+
+def format_query(query_string: str) -> str:
+    """
+    Format a SQL string with sql_formatter, if it is installed.
+
+    Parameters
+    ----------
+    query_string : str
+        The SQL string.
+
+    Returns
+    -------
+    str
+        The formatted SQL string, or the SQL string itself.
+    """
+
+    try:
+        from sql_formatter.core import format_sql
+
+        return format_sql(query_string)
+    except:
+        return query_string
+
+
+def arrow_array(values: tuple, type_: Any = None):
+    """
+    Convert the raw driver values of a column into an Arrow array.
+
+    Parameters
+    ----------
+    values : tuple
+        The values.
+    type_ : pa.DataType, optional
+        The Arrow type of the column, by default None (inferred from the values).
+
+    Returns
+    -------
+    pa.Array
+        The array, cast to `type_` if the values allow it.
+    """
+
+    import pyarrow as pa
+
+    array = pa.array(values)
+    if type_ is not None and array.type != type_:
+        try:
+            array = array.cast(type_)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    return array
+
+
+def arrow_type(type_: TypeEngine):
+    """
+    Get the Arrow type of a SQL type.
+
+    Parameters
+    ----------
+    type_ : TypeEngine
+        The SQLAlchemy type.
+
+    Returns
+    -------
+    pa.DataType or None
+        The Arrow type, or None if it has to be inferred from the values.
+    """
+
+    import pyarrow as pa
+
+    match type_:
+        case sqltypes.Boolean():
+            return pa.bool_()
+        case sqltypes.SmallInteger():
+            return pa.int16()
+        case sqltypes.Integer():
+            return pa.int64()
+        case sqltypes.Float():
+            return pa.float64()
+        case sqltypes.Numeric() if type_.asdecimal and type_.precision:
+            return pa.decimal128(type_.precision, type_.scale or 0)
+        case sqltypes.Numeric() if not type_.asdecimal:
+            return pa.float64()
+        case sqltypes.DateTime():
+            return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+        case sqltypes.Date():
+            return pa.date32()
+        case sqltypes.Time():
+            return pa.time64("us")
+        case sqltypes.String():
+            return pa.string()
+        case sqltypes.LargeBinary():
+            return pa.binary()
+    return None
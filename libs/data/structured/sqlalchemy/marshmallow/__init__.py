@@ -1,8 +1,9 @@
-from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, SQLAlchemySchema
+from marshmallow_sqlalchemy import SQLAlchemySchema
 from marshmallow_sqlalchemy.convert import ModelConverter
 from marshmallow_sqlalchemy.fields import Nested
 from sqlalchemy.orm import Session, Relationship, RelationshipProperty
 from typing import Any, Callable, List
+import threading
 try:
     import simplejson as json
 except ImportError:
@@ -10,53 +11,125 @@ except ImportError:
 
 
 DEFAULT_CONVERTER = ModelConverter()
+
+
+class MarshmallowSchema:
+    """
+    Class-level descriptor building the marshmallow schema of a model on first access.
+
+    The schema is built once and cached, so models that are never serialized never pay
+    for it. Relationships are nested with the column-only schema of the related model,
+    which is resolved when the field is first used, so cycles between models do not recurse.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Initialize an instance of MarshmallowSchema.
+
+        Parameters
+        ----------
+        session : Session
+            SQLAlchemy session object.
+        """
+
+        self.session = session
+        self.lock = threading.Lock()
+        self.schemas = {}
+
+    def __get__(self, instance: Any, owner: type) -> type:
+        """
+        Get the schema of the model, with its relationships.
+
+        Parameters
+        ----------
+        instance : Any
+            The model instance, or None when accessed on the class.
+        owner : type
+            The model class.
+
+        Returns
+        -------
+        type
+            The `SQLAlchemySchema` subclass of the model.
+        """
+
+        return self.schema(owner, relationships=True)
+
+    def schema(self, model: type, relationships: bool = True) -> type:
+        """
+        Get the schema of a model, building it on first access.
+
+        Parameters
+        ----------
+        model : type
+            The model class.
+        relationships : bool, optional
+            Whether the relationships of the model are nested in the schema, by default True.
+
+        Returns
+        -------
+        type
+            The `SQLAlchemySchema` subclass of the model.
+        """
+
+        if (schema := self.schemas.get(relationships)) is None:
+            with self.lock:
+                if (schema := self.schemas.get(relationships)) is None:
+                    schema = self.schemas[relationships] = type(
+                        f"{model.__module__}.{model.__qualname__}",
+                        (SQLAlchemySchema,),
+                        {
+                            **DEFAULT_CONVERTER.fields_for_model(model),
+                            **(
+                                {
+                                    field_name: Nested(
+                                        nested_schema(v.mapper.class_),
+                                        depth=0,
+                                        many=not isinstance(v, Relationship),
+                                    )
+                                    for field_name, v in model.__mapper__.attrs.items()
+                                    if isinstance(v, RelationshipProperty)
+                                }
+                                if relationships
+                                else {}
+                            ),
+                            "Meta": type(
+                                "Meta",
+                                (object,),
+                                {
+                                    "model": model,
+                                    "sqla_session": self.session,
+                                    "render_module": json,
+                                },
+                            ),
+                        },
+                    )
+        return schema
+
+
+def nested_schema(model: type) -> Callable[[], type]:
+    """
+    Get a deferred reference to the column-only schema of a model.
+
+    Parameters
+    ----------
+    model : type
+        The model class.
+
+    Returns
+    -------
+    Callable[[], type]
+        A callable returning the schema, as accepted by `Nested`.
+    """
+
+    def resolve() -> type:
+        return vars(model)["__marshmallow__"].schema(model, relationships=False)
+
+    return resolve
+
+
 EXTENSION_STEPS: List[Callable] = [
-    lambda model, session: setattr(
-        model,
-        "__marshmallow__",
-        type(
-            f"{model.__module__}.{model.__qualname__}",
-            (SQLAlchemyAutoSchema,),
-            {
-                "Meta": type(
-                    "Meta",
-                    (object,),
-                    {
-                        "model": model,
-                        "sqla_session": session,
-                        "render_module": json
-                    },
-                )
-            },
-        ),
-    ),
-    lambda model, session: setattr(
-        model,
-        "__marshmallow__",
-        type(
-            f"{model.__module__}.{model.__qualname__}",
-            (SQLAlchemySchema,),
-            {
-                **DEFAULT_CONVERTER.fields_for_model(model),
-                **{
-                    field_name: Nested(v.mapper.class_.__marshmallow__, depth=0)
-                    if isinstance(v, Relationship)
-                    else Nested(v.mapper.class_.__marshmallow__, depth=0, many=True)
-                    for field_name, v in model.__mapper__.attrs.items()
-                    if isinstance(v, RelationshipProperty)
-                },
-                "Meta": type(
-                    "Meta",
-                    (object,),
-                    {
-                        "model": model,
-                        "sqla_session": session,
-                        "render_module": json
-                    },
-                ),
-            },
-        ),
-    ),
+    lambda model, session: setattr(model, "__marshmallow__", MarshmallowSchema(session)),
     lambda model, _: setattr(
         model, "__repr__", lambda self: self.__marshmallow__().dumps(self)
     ) if not hasattr(model, "__repr__") else None,
@@ -0,0 +1,119 @@
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import Pool
+from typing import Dict
+import threading
+import time
+
+
+class PoolMetrics:
+    """
+    Live metrics of the connection pool of an engine.
+
+    Counts the connections opened, checked out, checked in and invalidated, and times how long
+    each checkout waits for a connection, including the time spent opening new connections.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Initialize an instance of PoolMetrics.
+
+        Parameters
+        ----------
+        engine : Engine
+            The SQLAlchemy Engine object whose pool is measured.
+            Pools recreated by `engine.dispose()` keep being measured.
+        """
+
+        self.engine = engine
+        self.lock = threading.Lock()
+        self.__counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "timeouts": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+        # Listeners are kept by the pools recreated on dispose
+        for name, counter in (
+            ("connect", "connects"),
+            ("checkout", "checkouts"),
+            ("checkin", "checkins"),
+            ("invalidate", "invalidations"),
+        ):
+            event.listen(
+                engine.pool, name, lambda *_, counter=counter: self.__count(counter)
+            )
+        self.__instrument(engine.pool)
+        event.listen(engine, "engine_disposed", lambda engine: self.__instrument(engine.pool))
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Current state and cumulative counters of the pool.
+
+        Returns
+        -------
+        Dict[str, float]
+            The pool size, and the connections checked in, checked out and in overflow
+            (for pools that track them), followed by the cumulative counters.
+        """
+
+        pool = self.engine.pool
+        with self.lock:
+            return {
+                **{
+                    name: getattr(pool, method)()
+                    for name, method in (
+                        ("size", "size"),
+                        ("checked_in", "checkedin"),
+                        ("checked_out", "checkedout"),
+                        ("overflow", "overflow"),
+                    )
+                    if hasattr(pool, method)
+                },
+                **self.__counters,
+            }
+
+    def __instrument(self, pool: Pool) -> None:
+        """
+        Time the checkouts of a pool.
+
+        Parameters
+        ----------
+        pool : Pool
+            The pool to instrument.
+        """
+
+        connect = pool.connect
+
+        def timed_connect():
+            start = time.perf_counter()
+            try:
+                return connect()
+            except TimeoutError:
+                self.__count("timeouts")
+                raise
+            finally:
+                waited = time.perf_counter() - start
+                with self.lock:
+                    self.__counters["wait_seconds"] += waited
+                    if waited > self.__counters["max_wait_seconds"]:
+                        self.__counters["max_wait_seconds"] = waited
+
+        pool.connect = timed_connect
+
+    def __count(self, name: str) -> None:
+        """
+        Increment a counter.
+
+        Parameters
+        ----------
+        name : str
+            The counter to increment.
+        """
+
+        with self.lock:
+            self.__counters[name] += 1
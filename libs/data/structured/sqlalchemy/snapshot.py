@@ -0,0 +1,225 @@
+from sqlalchemy import Engine, MetaData, TextClause, bindparam, text
+from typing import Any, List, Union
+import hashlib
+import os
+import pickle
+import sqlalchemy
+import tempfile
+
+# Bumped whenever the layout of the pickled snapshots changes.
+SNAPSHOT_VERSION = 2
+
+
+def fingerprint(engine: Engine, schemas: List[str] = None) -> Union[str, None]:
+    """
+    Compute a cheap fingerprint of the database schema.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy Engine object.
+    schemas : List[str], optional
+        The schemas to fingerprint, by default None (the whole database).
+
+    Returns
+    -------
+    Union[str, None]
+        A digest that changes whenever a table or view of the schemas is created, altered
+        or dropped, or None if the dialect has no cheap way to tell.
+
+    Notes
+    -----
+    SQL Server reads the modify dates of `sys.objects`, SQLite reads `PRAGMA schema_version`,
+    and other dialects hash the column listing of `information_schema.columns`. None of these
+    queries touch more than the catalog, so they take milliseconds where reflection takes seconds.
+    """
+
+    with engine.connect() as connection:
+        match engine.dialect.name:
+            case "mssql":
+                statement = text(
+                    "SELECT COUNT(*), MAX(modify_date), "
+                    "CHECKSUM_AGG(CHECKSUM(object_id, modify_date)) "
+                    "FROM sys.objects WHERE type IN ('U', 'V')"
+                    + (" AND SCHEMA_NAME(schema_id) IN :schemas" if schemas else "")
+                )
+                rows = connection.execute(_in_schemas(statement, schemas)).all()
+            case "sqlite":
+                rows = [
+                    connection.exec_driver_sql(
+                        f'PRAGMA "{schema}".schema_version' if schema else "PRAGMA schema_version"
+                    ).scalar()
+                    for schema in schemas or [None]
+                ]
+            case _:
+                statement = text(
+                    "SELECT table_schema, table_name, column_name, data_type, is_nullable "
+                    "FROM information_schema.columns"
+                    + (" WHERE table_schema IN :schemas" if schemas else "")
+                )
+                try:
+                    rows = sorted(
+                        tuple(row)
+                        for row in connection.execute(_in_schemas(statement, schemas))
+                    )
+                except sqlalchemy.exc.DBAPIError:
+                    return None
+    return hashlib.sha256(repr(rows).encode()).hexdigest()
+
+
+def snapshot_key(engine: Engine, schemas: List[str], fingerprint: str) -> str:
+    """
+    Get the key of a reflection snapshot.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy Engine object.
+    schemas : List[str]
+        The reflected schemas.
+    fingerprint : str
+        The fingerprint of the database schema.
+
+    Returns
+    -------
+    str
+        A key unique to the database, the schemas, the fingerprint and the SQLAlchemy version.
+        The password of the URL is left out.
+    """
+
+    identity = repr(
+        (
+            SNAPSHOT_VERSION,
+            sqlalchemy.__version__,
+            engine.url.render_as_string(hide_password=True),
+            sorted(schemas or []),
+            fingerprint,
+        )
+    )
+    return f"sqlalchemy-{hashlib.sha256(identity.encode()).hexdigest()[:32]}.pickle"
+
+
+def load_snapshot(target: Any, key: str) -> Union[MetaData, None]:
+    """
+    Load a reflection snapshot.
+
+    Parameters
+    ----------
+    target : Any
+        A directory path, a key-value binding handle, or a key-value provider.
+    key : str
+        The key of the snapshot.
+
+    Returns
+    -------
+    Union[MetaData, None]
+        The reflected metadata, or None if there is no readable snapshot for the key.
+    """
+
+    try:
+        if _is_directory(target):
+            with open(os.path.join(target, key), "rb") as f:
+                return pickle.load(f)
+        return _provider(target).load(
+            key,
+            decoder=lambda data, **_: pickle.loads(
+                data.read() if hasattr(data, "read") else data
+            ),
+        )
+    except Exception:
+        # Missing, stale or unreadable snapshots are rebuilt by reflecting
+        return None
+
+
+def save_snapshot(target: Any, key: str, metadata: MetaData) -> None:
+    """
+    Save a reflection snapshot.
+
+    Parameters
+    ----------
+    target : Any
+        A directory path, a key-value binding handle, or a key-value provider.
+    key : str
+        The key of the snapshot.
+    metadata : MetaData
+        The reflected metadata.
+    """
+
+    data = pickle.dumps(metadata, protocol=5)
+    if _is_directory(target):
+        os.makedirs(target, exist_ok=True)
+        # Write to a temporary file first, so that concurrent cold starts never read a partial snapshot
+        fd, path = tempfile.mkstemp(dir=target, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(path, os.path.join(target, key))
+        except BaseException:
+            os.unlink(path)
+            raise
+    else:
+        _provider(target).save(key, data, encoder=lambda value, **_: value)
+
+
+def _in_schemas(statement: TextClause, schemas: List[str] = None) -> TextClause:
+    """
+    Bind the schemas of a fingerprint query.
+
+    Parameters
+    ----------
+    statement : TextClause
+        The query, with an `:schemas` parameter if schemas are given.
+    schemas : List[str], optional
+        The schemas, by default None.
+
+    Returns
+    -------
+    TextClause
+        The query, with the schemas bound as an expanding IN parameter.
+    """
+
+    if schemas:
+        return statement.bindparams(bindparam("schemas", schemas, expanding=True))
+    return statement
+
+
+def _is_directory(target: Any) -> bool:
+    """
+    Check whether a snapshot target is a directory path rather than a binding handle.
+
+    Parameters
+    ----------
+    target : Any
+        The snapshot target.
+
+    Returns
+    -------
+    bool
+        True for paths, which contain a path separator, False for binding handles and providers.
+    """
+
+    return isinstance(target, (str, os.PathLike)) and (
+        isinstance(target, os.PathLike) or os.sep in target or "/" in target
+    )
+
+
+def _provider(target: Any) -> Any:
+    """
+    Resolve a snapshot target to a key-value provider.
+
+    Parameters
+    ----------
+    target : Any
+        A key-value binding handle, or a key-value provider.
+
+    Returns
+    -------
+    Any
+        The key-value provider.
+    """
+
+    if isinstance(target, str):
+        from libs.data import from_bind
+
+        return from_bind(target)
+    return target
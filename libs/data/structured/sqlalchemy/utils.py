@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, Query
+from sqlalchemy.orm import Session, Query, object_session
 from sqlalchemy.schema import ForeignKeyConstraint
 from typing import Any, Callable, List, Union, Type
 
@@ -7,7 +7,7 @@ EXTENSION_STEPS: List[Callable] = [
     lambda model, _: setattr(
         model, "__getitem__", lambda self, key: getattr(self, key)
     ),
-    lambda model, _: setattr(model, "__setitem__", model_set_column),
+    lambda model, session: setattr(model, "__setitem__", model_set(session)),
 ]
 
 
@@ -42,7 +42,9 @@ def extend_models(models: List[Any], session: Session) -> None:
             func(model, session)
 
 
-def model_set_column(self: object, key: str, value: Any) -> None:
+def model_set_column(
+    self: object, key: str, value: Any, session: Callable = None
+) -> None:
     """
     Set a column value on the model.
 
@@ -54,6 +56,8 @@ def model_set_column(self: object, key: str, value: Any) -> None:
         The column name.
     value : Any
         The value to set.
+    session : Callable, optional
+        The session factory used to save detached model objects, by default None.
 
     Returns
     -------
@@ -67,7 +71,38 @@ def model_set_column(self: object, key: str, value: Any) -> None:
     """
 
     setattr(self, key, value)
-    self._sa_instance_state.session.commit()
+    if attached := object_session(self):
+        attached.commit()
+    elif session:
+        # Objects returned by closed sessions are merged into a short-lived one
+        with session() as scoped, scoped.begin():
+            scoped.merge(self)
+
+
+def model_set(session: Callable) -> Callable:
+    """
+    Get the __setitem__ method for the model.
+
+    Parameters
+    ----------
+    session : Callable
+        The session factory.
+
+    Returns
+    -------
+    Callable
+        The __setitem__ method, saving each column set on a model object.
+
+    Examples
+    --------
+    >>> setattr(MyModel, "__setitem__", model_set(session))
+    >>> model["column_name"] = value
+    """
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        model_set_column(self, key, value, session)
+
+    return __setitem__
 
 
 from .interface import QueryFrame
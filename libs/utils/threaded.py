@@ -1,6 +1,220 @@
-from contextvars import ContextVar
-from typing import Any
-from werkzeug.local import LocalProxy
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, Token, copy_context
+from typing import Any, Callable, Dict, Iterator
+import threading
+
+_MISSING = object()
+
+
+class ContextStore:
+    """
+    Request-scoped key-value store backed by context variables.
+
+    Each name is held by its own `ContextVar`, so reads and writes are O(1) and values set
+    in one thread or task are invisible to the others. Snapshots are O(1) copies of the
+    current context.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of ContextStore.
+        """
+
+        self._vars: Dict[str, ContextVar] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Check whether a name is set in the current context.
+
+        Parameters
+        ----------
+        name : str
+            The name to check.
+
+        Returns
+        -------
+        bool
+            True if the name is set, False otherwise.
+        """
+
+        var = self._vars.get(name)
+        return var is not None and var.get() is not _MISSING
+
+    def get(self, name: str, default: Any = _MISSING) -> Any:
+        """
+        Get the value of a name in the current context.
+
+        Parameters
+        ----------
+        name : str
+            The name to get.
+        default : Any, optional
+            The value returned if the name is not set.
+
+        Returns
+        -------
+        Any
+            The value of the name, or the default.
+
+        Raises
+        ------
+        KeyError
+            If the name is not set and no default is given.
+        """
+
+        var = self._vars.get(name)
+        value = _MISSING if var is None else var.get()
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(name)
+            return default
+        return value
+
+    def set(self, name: str, value: Any) -> Token:
+        """
+        Set the value of a name in the current context.
+
+        Parameters
+        ----------
+        name : str
+            The name to set.
+        value : Any
+            The value to set.
+
+        Returns
+        -------
+        Token
+            The token of the underlying `ContextVar`, which can reset the previous value.
+        """
+
+        var = self._vars.get(name)
+        if var is None:
+            with self._lock:
+                var = self._vars.setdefault(name, ContextVar(name, default=_MISSING))
+        return var.set(value)
+
+    def delete(self, name: str) -> None:
+        """
+        Unset a name in the current context.
+
+        Parameters
+        ----------
+        name : str
+            The name to unset.
+
+        Raises
+        ------
+        KeyError
+            If the name is not set.
+        """
+
+        if name not in self:
+            raise KeyError(name)
+        self._vars[name].set(_MISSING)
+
+    def snapshot(self) -> Context:
+        """
+        Capture the values of the current context.
+
+        Returns
+        -------
+        Context
+            A copy of the current context, which later changes do not affect.
+        """
+
+        return copy_context()
+
+    def restore(self, snapshot: Context) -> None:
+        """
+        Restore the values captured by `snapshot()` in the current context.
+
+        Parameters
+        ----------
+        snapshot : Context
+            The snapshot to restore. Names set after it was taken are unset.
+        """
+
+        for var in list(self._vars.values()):
+            var.set(snapshot.get(var, _MISSING))
+
+    @contextmanager
+    def scope(self) -> Iterator["ContextStore"]:
+        """
+        Scope the changes made within a block to that block.
+
+        Returns
+        -------
+        Iterator[ContextStore]
+            The store itself. The values of the current context are restored on exit.
+
+        Example
+        -------
+        >>> with store.scope():
+        >>>     store.set("request", request)
+        >>>     handle(request)
+        """
+
+        snapshot = self.snapshot()
+        try:
+            yield self
+        finally:
+            self.restore(snapshot)
+
+
+def propagate(func: Callable) -> Callable:
+    """
+    Bind a function to a copy of the current context.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to bind.
+
+    Returns
+    -------
+    Callable
+        A function running `func` in a copy of the context captured when `propagate` was
+        called. Each call gets its own copy, so it may run in several threads at once.
+    """
+
+    context = copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool executor running each task in a copy of the submitting context.
+
+    Values set in a `ContextStore` before a task is submitted are visible to the task,
+    while values the task sets stay local to it.
+    """
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Submit a task running in a copy of the current context.
+
+        Parameters
+        ----------
+        fn : Callable
+            The function to run.
+        *args : tuple
+            The positional arguments of the function.
+        **kwargs : dict
+            The keyword arguments of the function.
+
+        Returns
+        -------
+        Future
+            The future of the task.
+        """
+
+        return super().submit(copy_context().run, fn, *args, **kwargs)
 
 
 class DynamicObject(object):
@@ -8,34 +222,29 @@ class DynamicObject(object):
 
 
 class GlobalThreadedVar(DynamicObject):
-    def __init__(self):
-        self._context = {}
-        self._proxies = {}
+    def __init__(self, store: ContextStore = None):
+        object.__setattr__(self, "_store", store or ContextStore())
 
-    def __getattribute__(self, name) -> Any:
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            return self._proxies[name]
+    def __getattr__(self, name) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._store.get(name, None)
 
     def __setattr__(self, name, value) -> None:
         if name.startswith("_"):
             object.__setattr__(self, name, value)
         else:
-            if name not in self._context.keys():
-                self._context[name] = ContextVar(name)
-                self._proxies[name] = LocalProxy(self._context[name])
-            self._context[name].set(value)
-            
+            self._store.set(name, value)
+
     def __delattr__(self, name: str) -> None:
         try:
             object.__delattr__(self, name)
         except AttributeError:
-            del self._proxies[name]
-        
+            self._store.delete(name)
 
 
-current = GlobalThreadedVar()
+store = ContextStore()
+current = GlobalThreadedVar(store)
 
 
 import time